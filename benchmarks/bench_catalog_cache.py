@@ -0,0 +1,98 @@
+"""
+Kalter vs. warmer Katalogstart mit dem kompilierten Daten-Cache.
+
+Erzeugt einen synthetischen Katalog in der Größenordnung aller Vanilla-Items
+(standardmäßig 1.400 Items) in einem temporären Verzeichnis und misst den
+Aufbau von ``ItemCatalog`` ohne Cache (kalt) und mit gültigem Cache (warm).
+
+Verwendung:
+    python benchmarks/bench_catalog_cache.py [--items 1400] [--runs 20]
+"""
+
+import argparse
+import itertools
+import json
+import shutil
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.catalog import ItemCatalog
+
+CATEGORIES = ["Waffen", "Werkzeuge", "Rüstung", "Blöcke", "Nahrung", "Tränke", "Utility"]
+SLOTS = [["inventory"], ["mainhand", "offhand"], ["head"], ["chest"], ["legs"], ["feet"]]
+
+
+def synthetic_names(count):
+    """Nur Kleinbuchstaben, damit die IDs dem Schema entsprechen"""
+    letters = string.ascii_lowercase
+    for length in itertools.count(2):
+        for combo in itertools.product(letters, repeat=length):
+            if count <= 0:
+                return
+            yield "item_" + "".join(combo)
+            count -= 1
+
+
+def write_data(data_dir: Path, item_count: int):
+    items = []
+    for i, name in enumerate(synthetic_names(item_count)):
+        items.append({
+            "id": f"minecraft:{name}",
+            "name": name.replace("_", " ").title(),
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "max_stack": 64 if i % 3 else 1,
+            "slots": SLOTS[i % len(SLOTS)],
+            "enchantable": i % 3 == 0,
+            "icon": f"{name}.png",
+        })
+    source = Path(__file__).resolve().parent.parent / "data" / "1.20" / "enchantments.json"
+    data_dir.mkdir(parents=True)
+    (data_dir / "items.json").write_text(json.dumps({"items": items}, ensure_ascii=False, indent=2), encoding="utf-8")
+    shutil.copy(source, data_dir / "enchantments.json")
+
+
+def timed(fn, runs):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=1400)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        data_dir = tmp / "data" / "bench"
+        cache_dir = tmp / "cache"
+        write_data(data_dir, args.items)
+
+        def cold():
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            ItemCatalog("bench", data_dir=data_dir, cache_dir=cache_dir)
+
+        def warm():
+            ItemCatalog("bench", data_dir=data_dir, cache_dir=cache_dir)
+
+        cold_time = timed(cold, args.runs)
+        ItemCatalog("bench", data_dir=data_dir, cache_dir=cache_dir)
+        warm_time = timed(warm, args.runs)
+
+    print(f"items:  {args.items}")
+    print(f"cold:   {cold_time * 1000:8.2f} ms (parse + validate + write cache)")
+    print(f"warm:   {warm_time * 1000:8.2f} ms (cached)")
+    print(f"faster: {cold_time / warm_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
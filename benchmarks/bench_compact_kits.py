@@ -0,0 +1,105 @@
+"""
+Speicherbedarf großer Kit-Bibliotheken: Definition vs. Kit vs. CompactKit.
+
+Erzeugt zufällige, gültige Kits aus dem echten 1.20-Katalog (standardmäßig
+100.000 Kits, je Slot ein passendes Item, Verzauberungen über die Presets)
+und misst mit tracemalloc den Speicher, den die Bibliothek in jeder
+Darstellung belegt:
+
+* Definition: Dicts im Format von core/kit_files.py (wie nach json.load)
+* Kit:        KitSlot-Objekte (core/kit_files.kit_from_dict)
+* Compact:    CompactKit (core/compact_kit.py)
+
+Dazu die Zeit der Umwandlungen Definition -> CompactKit -> Kit -> CompactKit.
+
+Verwendung:
+    python benchmarks/bench_compact_kits.py [--kits 100000] [--filled 20]
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.catalog import get_catalog
+from core.compact_kit import CompactKit, get_codec
+from core.kit_files import kit_from_dict
+from core.presets import PresetResolver, load_presets
+
+
+def random_definitions(count: int, filled: int, seed: int = 1):
+    """Kit-Definitionen; Strings werden pro Kit neu gebaut wie beim Lesen aus JSON"""
+    catalog = get_catalog()
+    rng = random.Random(seed)
+    resolvers = [PresetResolver(preset, catalog) for preset in load_presets().values()]
+    for k in range(count):
+        resolver = rng.choice(resolvers)
+        slots = []
+        for slot_id in sorted(rng.sample(range(27), filled)):
+            item = rng.choice(catalog.items)
+            entry = {"slot": slot_id, "id": "".join(item.id), "name": "".join(item.name),
+                     "count": rng.randint(1, item.max_stack)}
+            enchantments = resolver.entries_for_item(item.id)
+            if enchantments:
+                entry["enchantments"] = [{"id": "".join(e["id"]), "level": e["level"]} for e in enchantments]
+            slots.append(entry)
+        yield {"name": f"kit{k}", "version": "1.20", "slots": slots}
+
+
+def measure(build):
+    """(Ergebnis, belegte Bytes)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, used
+
+
+def timed(label, func, count):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:28s} {elapsed:6.2f}s  {elapsed / count * 1e6:7.1f} µs/kit")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--kits", type=int, default=100000)
+    parser.add_argument("--filled", type=int, default=20, help="belegte Slots je Kit (max. 27)")
+    args = parser.parse_args()
+    count = args.kits
+    codec = get_codec(get_catalog())     # Katalog und Codec nicht mitzählen
+
+    rows = []
+    definitions, used = measure(lambda: list(random_definitions(count, args.filled)))
+    rows.append(("Definition", used))
+    kits, used = measure(lambda: [kit_from_dict(d) for d in definitions])
+    rows.append(("Kit", used))
+    del kits
+    compact, used = measure(lambda: [CompactKit.from_definition(d, codec) for d in definitions])
+    rows.append(("Compact", used))
+
+    print(f"{count} kits, {args.filled} filled slots each")
+    for label, used in rows:
+        print(f"{label:12s} {used / 2**20:8.1f} MiB  {used / count:7.0f} B/kit  "
+              f"{used / rows[-1][1]:5.1f}x")
+
+    del compact
+    compact = timed("Definition -> CompactKit", lambda: [CompactKit.from_definition(d, codec) for d in definitions], count)
+    definitions = None
+    kits = timed("CompactKit -> Kit", lambda: [c.to_kit() for c in compact], count)
+    back = timed("Kit -> CompactKit", lambda: [CompactKit.from_kit(k, codec) for k in kits], count)
+    assert back == compact
+
+
+if __name__ == "__main__":
+    main()
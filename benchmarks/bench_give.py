@@ -0,0 +1,42 @@
+"""
+Durchsatz des /give-Generators für beide Syntaxen.
+
+Erzeugt Befehle für zufällige, volle Kits (standardmäßig 10.000 Kits mit je
+27 Slots und Verzauberungen) und misst den ersten Durchlauf (leerer
+Fragment-Cache) sowie einen zweiten mit gefülltem Cache. Die Zeiten hängen
+stark von der Maschine ab; verglichen werden sollten nur Läufe auf derselben.
+
+Verwendung:
+    python benchmarks/bench_give.py [--kits 10000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_validation import random_kits
+from core.exporters import COMPONENTS, LEGACY, MAX_COMMAND_LENGTH, generate_give_commands
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--kits", type=int, default=10000)
+    args = parser.parse_args()
+
+    kits = random_kits(args.kits)
+    for syntax in (LEGACY, COMPONENTS):
+        for run in ("cold", "warm"):
+            start = time.perf_counter()
+            commands = [generate_give_commands(kit["slots"], kit["name"], syntax) for kit in kits]
+            elapsed = time.perf_counter() - start
+            total = sum(len(c) for c in commands)
+            longest = max(len(command) for c in commands for command in c)
+            print(f"{syntax:10s} {run}  {elapsed:6.3f}s  {elapsed / len(kits) * 1e6:6.1f} µs/kit  {total} commands, "
+                  f"longest {longest}/{MAX_COMMAND_LENGTH} chars")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Schneller NBT-Writer gegen den nbtlib-Pfad.
+
+Serialisiert zufällige, volle Shulker-Kits (27 Slots, mit Namen und
+Verzauberungen) einmal über create_nbt_structure + save_nbt_file (nbtlib) und
+einmal über save_items_nbt. Vor der Messung wird für jedes Kit geprüft, dass
+beide Dateien byteidentisch sind und die gzip-Variante wieder dieselben Daten
+liefert; bei Abweichung bricht das Skript ab.
+
+Verwendung:
+    python benchmarks/bench_nbt_export.py [--kits 2000]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import nbtlib
+
+from bench_validation import random_kits
+from core.exporters import create_nbt_structure, save_items_nbt, save_nbt_file
+
+
+def export_items(kit: dict):
+    """Kit-Definition -> Export-Daten wie get_export_data (mit Anzeigename)"""
+    return [dict(entry, name=entry["id"].split(":")[-1].replace("_", " ").title())
+            for entry in kit["slots"]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--kits", type=int, default=2000)
+    args = parser.parse_args()
+
+    kits = [export_items(kit) for kit in random_kits(args.kits)]
+    kits.append([])   # leere Shulker-Kiste
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reference, fast, packed = Path(tmp) / "ref.nbt", Path(tmp) / "fast.nbt", Path(tmp) / "fast.nbt.gz"
+        for items in kits:
+            save_nbt_file(create_nbt_structure(items), reference)
+            save_items_nbt(items, fast)
+            save_items_nbt(items, packed, gzipped=True)
+            assert fast.read_bytes() == reference.read_bytes(), f"byte mismatch for {items[:1]}"
+            assert nbtlib.load(packed) == nbtlib.load(reference), "gzip round trip differs"
+        print(f"{len(kits)} kits byte-identical")
+
+        timings = {}
+        start = time.perf_counter()
+        for items in kits:
+            save_nbt_file(create_nbt_structure(items), reference)
+        timings["nbtlib"] = time.perf_counter() - start
+
+        for label, gzipped in (("fast", False), ("fast+gzip", True)):
+            start = time.perf_counter()
+            for items in kits:
+                save_items_nbt(items, fast, gzipped=gzipped)
+            timings[label] = time.perf_counter() - start
+
+    for label, seconds in timings.items():
+        print(f"{label:10s} {seconds:7.3f}s  {seconds / len(kits) * 1e6:8.1f} µs/kit  "
+              f"x{timings['nbtlib'] / seconds:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
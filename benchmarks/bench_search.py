@@ -0,0 +1,59 @@
+"""
+Latenz der inkrementellen Item-Suche auf einem großen Katalog.
+
+Simuliert das Tippen von Suchbegriffen Zeichen für Zeichen (jede Eingabe ist
+eine Abfrage) auf einem synthetischen Katalog mit standardmäßig 20.000 Items.
+
+Verwendung:
+    python benchmarks/bench_search.py [--items 20000]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_catalog_cache import write_data
+from core.catalog import ItemCatalog
+from core.search import ItemSearchIndex
+
+QUERIES = ["item abc", "Item_Zz", "tem x", "itme ab", "qqq"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp) / "data"
+        write_data(data_dir, args.items)
+        catalog = ItemCatalog("bench", data_dir=data_dir, cache_dir=Path(tmp) / "cache")
+
+    start = time.perf_counter()
+    index = ItemSearchIndex(catalog)
+    build = time.perf_counter() - start
+
+    timings = []
+    for query in QUERIES:
+        for end in range(1, len(query) + 1):
+            for category in (None, "Waffen"):
+                start = time.perf_counter()
+                index.search(query[:end], category)
+                timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    print(f"items:   {len(catalog)}")
+    print(f"index:   {build * 1000:8.2f} ms (einmalig)")
+    print(f"queries: {len(timings)}")
+    print(f"median:  {statistics.median(timings) * 1000:8.3f} ms")
+    print(f"p95:     {timings[int(len(timings) * 0.95)] * 1000:8.3f} ms")
+    print(f"max:     {timings[-1] * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Durchsatz der Stapel-Validierung (core/validation.py).
+
+Erzeugt zufällige Kit-Definitionen aus dem echten 1.20-Katalog (standardmäßig
+10.000 Kits mit je 27 Slots, ein Teil davon absichtlich fehlerhaft) und prüft
+sie einmal im Hauptprozess und einmal im Prozess-Pool.
+
+Verwendung:
+    python benchmarks/bench_validation.py [--kits 10000] [--jobs 8]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.catalog import get_catalog
+from core.validation import validate_kits
+
+
+def random_kits(count: int, seed: int = 1):
+    catalog = get_catalog()
+    rng = random.Random(seed)
+    index = catalog.enchantment_index
+    kits = []
+    for k in range(count):
+        slots = []
+        for slot_id in range(27):
+            item = rng.choice(catalog.items)
+            entry = {"slot": slot_id, "id": item.id, "count": rng.randint(1, item.max_stack)}
+            applicable = index.ids_of(catalog.applicable_enchantments(item.id))
+            if len(applicable) >= 3:
+                entry["enchantments"] = [{"id": enchant_id, "level": 1}
+                                         for enchant_id in rng.sample(applicable, 3)]
+            slots.append(entry)
+        if k % 10 == 0:
+            slots[0]["count"] = 999
+            slots[1]["id"] = "minecraft:does_not_exist"
+        kits.append({"name": f"kit{k}", "version": "1.20", "slots": slots})
+    return kits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--kits", type=int, default=10000)
+    parser.add_argument("--jobs", type=int, default=None)
+    args = parser.parse_args()
+
+    kits = random_kits(args.kits)
+    for label, jobs in (("serial", 1), ("parallel", args.jobs)):
+        start = time.perf_counter()
+        report = validate_kits(kits, jobs=jobs)
+        elapsed = time.perf_counter() - start
+        summary = report.to_dict()
+        print(f"{label:8s} {elapsed:6.2f}s  {summary['kits']} kits, {summary['slots']} slots, "
+              f"{summary['invalid']} invalid, {len(report.issues)} issues")
+    print(summary["counts"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Speicherbedarf vieler Datenversionen: Deltas über einer Basis vs. volle Kopien.
+
+Erzeugt einen synthetischen Basiskatalog (standardmäßig 1.400 Items) und
+``--versions`` weitere Versionen, die jeweils einige Items hinzufügen, ändern
+oder entfernen. Verglichen wird der mit tracemalloc gemessene Speicher
+
+* Delta: jede Version als ``delta.json`` über der vorherigen (VersionRegistry)
+* Voll:  jede Version als vollständige ``items.json``
+
+Dazu die Zeit eines Versionswechsels auf eine bereits geladene Version.
+
+Verwendung:
+    python benchmarks/bench_versions.py [--items 1400] [--versions 6] [--changes 20]
+"""
+
+import argparse
+import gc
+import json
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_catalog_cache import synthetic_names, write_data
+from core.catalog import VersionRegistry, apply_delta
+
+
+def version_deltas(base_items, versions, changes):
+    """Pro Version: ein paar neue, geänderte und entfernte Items"""
+    names = synthetic_names(len(base_items) + versions * changes)
+    for _ in base_items:
+        next(names)
+    items = base_items
+    for v in range(versions):
+        add = [dict(base_items[0], id=f"minecraft:{name}", name=name.title(), icon=f"{name}.png")
+               for name in (next(names) for _ in range(changes))]
+        change = {items[(v * 7 + i) % len(items)]["id"]: {"max_stack": 16} for i in range(changes)}
+        remove = [items[-(i + 1)]["id"] for i in range(changes // 4)]
+        delta = {"add": add, "change": change, "remove": remove}
+        items, _ = apply_delta(items, delta)
+        yield f"2.{v}", delta, items
+
+
+def build(data_dir: Path, items: int, versions: int, changes: int, full: bool):
+    base_dir = data_dir / "2.base"
+    write_data(base_dir, items)
+    base_items = json.loads((base_dir / "items.json").read_text(encoding="utf-8"))["items"]
+    previous = "2.base"
+    for version, delta, all_items in version_deltas(base_items, versions, changes):
+        target = data_dir / version
+        target.mkdir()
+        if full:
+            (target / "items.json").write_text(json.dumps({"items": all_items}), encoding="utf-8")
+            shutil.copy(base_dir / "enchantments.json", target / "enchantments.json")
+        else:
+            (target / "delta.json").write_text(json.dumps({"base": previous, "items": delta}),
+                                               encoding="utf-8")
+        previous = version
+
+
+def measure(data_dir: Path, cache_dir: Path):
+    registry = VersionRegistry(data_dir, cache_dir)
+    for version in registry.versions():     # Cache füllen
+        registry.catalog(version)
+    registry = VersionRegistry(data_dir, cache_dir)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    catalogs = [registry.catalog(version) for version in registry.versions()]
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    versions = registry.versions()
+    start = time.perf_counter()
+    for _ in range(1000):
+        for version in versions:
+            registry.catalog(version)
+    switch = (time.perf_counter() - start) / (1000 * len(catalogs))
+    return catalogs, used, switch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=1400)
+    parser.add_argument("--versions", type=int, default=6)
+    parser.add_argument("--changes", type=int, default=20, help="Geänderte Items pro Version")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for mode in ("full", "delta"):
+            data_dir = Path(tmp) / mode
+            build(data_dir, args.items, args.versions, args.changes, full=mode == "full")
+            results[mode] = measure(data_dir, Path(tmp) / f"cache-{mode}")
+
+    for mode, (catalogs, used, switch) in results.items():
+        items = sum(len(c.items) for c in catalogs)
+        shared = sum(1 for c in catalogs for item in c.items
+                     if c.base is not None and c.base.by_id.get(item.id) is item)
+        print(f"{mode:>5}: {len(catalogs)} versions, {items} items, {shared} shared objects, "
+              f"{used / 1024:.0f} KiB, switch to loaded version {switch * 1e6:.2f} µs")
+    full, delta = results["full"][1], results["delta"][1]
+    print(f"delta storage uses {delta / full:.0%} of the memory of full copies")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Kit-Bibliotheken als ein einziges Archiv.
+
+Zwei Formate, beide werden Kit für Kit geschrieben, sobald es erzeugt ist -
+es liegt nie mehr als ein Kit im Speicher:
+
+* ``.zip``: ein Eintrag ``<kit>.nbt`` pro Kit (Inhaltsverzeichnis = Index)
+* ``.mkc``: Container aus längenpräfigierten NBT-Blöcken mit Index am Ende::
+
+      b"MKCKITS1"
+      [u32 Länge][NBT-Daten]  ...      (ein Block pro Kit)
+      Index (JSON: {"kits": {name: [offset, länge]}})
+      [u64 Index-Offset][u32 Index-Länge] b"MKCX"
+
+Die NBT-Daten sind dieselben Bytes wie eine einzelne .nbt-Datei
+(``serialize_items_nbt``, also ``get_export_data``/``create_nbt_structure``).
+
+Verwendung:
+    with KitArchiveWriter("kits.mkc") as archive:
+        archive.add("pvp", items)
+    KitArchiveReader("kits.mkc").read("pvp")
+"""
+
+import json
+import logging
+import struct
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .catalog import DEFAULT_VERSION
+from .exporters import LEGACY, give_syntax, serialize_items_nbt
+from .kit_files import kit_to_export_data, load_kit_file, validate_kit
+
+logger = logging.getLogger(__name__)
+
+CONTAINER_MAGIC = b"MKCKITS1"
+INDEX_MAGIC = b"MKCX"
+_LENGTH = struct.Struct(">I")
+_FOOTER = struct.Struct(">QI4s")
+
+FORMATS = ("zip", "mkc")
+
+
+def archive_format(path) -> str:
+    """Format aus der Dateiendung (.zip, sonst Container)"""
+    return "zip" if Path(path).suffix.lower() == ".zip" else "mkc"
+
+
+class KitArchiveWriter:
+    def __init__(self, path, fmt: str = None):
+        self.path = Path(path)
+        self.format = fmt or archive_format(path)
+        if self.format not in FORMATS:
+            raise ValueError(f"Unknown archive format: {self.format!r}")
+        self.index: Dict[str, Tuple[int, int]] = {}
+
+        if self.format == "zip":
+            self._zip = zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_DEFLATED)
+        else:
+            self._file = open(self.path, "wb")
+            self._file.write(CONTAINER_MAGIC)
+
+    def add(self, name: str, items: List[dict], syntax: str = LEGACY):
+        """Serialisiert ein Kit (Export-Daten) im Item-Format ``syntax`` und schreibt es sofort"""
+        self.add_nbt(name, serialize_items_nbt(items, syntax=syntax))
+
+    def add_nbt(self, name: str, data: bytes):
+        if name in self.index:
+            raise ValueError(f"Duplicate kit name in archive: {name!r}")
+        if self.format == "zip":
+            self._zip.writestr(f"{name}.nbt", data)
+            self.index[name] = (0, len(data))
+        else:
+            offset = self._file.tell() + _LENGTH.size
+            self._file.write(_LENGTH.pack(len(data)))
+            self._file.write(data)
+            self.index[name] = (offset, len(data))
+
+    def close(self):
+        if self.format == "zip":
+            self._zip.close()
+            return
+        if self._file.closed:
+            return
+        index = json.dumps({"kits": self.index}, ensure_ascii=False).encode("utf-8")
+        offset = self._file.tell()
+        self._file.write(index)
+        self._file.write(_FOOTER.pack(offset, len(index), INDEX_MAGIC))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class KitArchiveReader:
+    """Wahlfreier Zugriff auf einzelne Kits über den Namen"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._zip = None
+        self.index: Dict[str, Tuple[int, int]] = {}
+
+        if zipfile.is_zipfile(self.path):
+            self._zip = zipfile.ZipFile(self.path)
+            for info in self._zip.infolist():
+                if info.filename.endswith(".nbt"):
+                    self.index[info.filename[:-4]] = (0, info.file_size)
+            return
+
+        with open(self.path, "rb") as f:
+            if f.read(len(CONTAINER_MAGIC)) != CONTAINER_MAGIC:
+                raise ValueError(f"Not a kit archive: {self.path}")
+            f.seek(-_FOOTER.size, 2)
+            offset, length, magic = _FOOTER.unpack(f.read(_FOOTER.size))
+            if magic != INDEX_MAGIC:
+                raise ValueError(f"Kit archive is truncated (no index): {self.path}")
+            f.seek(offset)
+            kits = json.loads(f.read(length).decode("utf-8"))["kits"]
+        self.index = {name: tuple(entry) for name, entry in kits.items()}
+
+    def names(self) -> List[str]:
+        return list(self.index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def read(self, name: str) -> bytes:
+        """NBT-Bytes eines Kits (wie eine einzelne .nbt-Datei)"""
+        if name not in self.index:
+            raise KeyError(name)
+        if self._zip is not None:
+            return self._zip.read(f"{name}.nbt")
+        offset, length = self.index[name]
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_kit_files(paths: Iterable[Path]) -> Iterator[Tuple[str, List[dict], List[str], str]]:
+    """Lädt Kit-Dateien einzeln: (name, export_data, fehler, version)"""
+    for path in paths:
+        try:
+            kit = load_kit_file(path)
+            yield kit.name, kit_to_export_data(kit), validate_kit(kit), kit.version
+        except Exception as e:
+            yield Path(path).stem, [], [f"{type(e).__name__}: {e}"], DEFAULT_VERSION
+
+
+def export_kit_library(kits: Iterable[Tuple[str, List[dict], List[str], str]], path,
+                       fmt: str = None) -> Dict[str, List[str]]:
+    """Schreibt gültige Kits im Item-Format ihrer Version ins Archiv; liefert {kitname: fehler}
+    der übersprungenen"""
+    skipped = {}
+    with KitArchiveWriter(path, fmt) as archive:
+        for name, items, errors, version in kits:
+            if errors:
+                skipped[name] = errors
+                continue
+            try:
+                archive.add(name, items, syntax=give_syntax(version))
+            except ValueError as e:
+                skipped[name] = [str(e)]
+    if skipped:
+        logger.warning(f"{len(skipped)} kit(s) not archived")
+    return skipped
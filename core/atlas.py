@@ -0,0 +1,93 @@
+"""
+Sprite-Atlas für Item-Icons.
+
+Packt alle Icons, die der Katalog referenziert, in wenige Atlas-Bilder mit
+festem Zellraster (``atlas-<n>.png``) und schreibt einen Index
+``atlas.json`` mit den Teilrechtecken. Die GUI lädt jedes Atlas-Blatt einmal
+und schneidet Icons daraus aus, statt pro Item eine Datei zu öffnen.
+
+Verwendung:
+    python -m core.cli icons atlas [--icons icons/] [--cell 32]
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from .catalog import ItemCatalog, get_registry
+
+logger = logging.getLogger(__name__)
+
+ATLAS_INDEX = "atlas.json"
+ATLAS_SHEET = "atlas-{}.png"
+DEFAULT_CELL_SIZE = 32
+DEFAULT_COLUMNS = 64    # 64 x 32 px = 2048 px Blattbreite
+MAX_ROWS = 64           # höchstens 4096 Icons pro Blatt
+
+
+def build_atlas(icon_names: Iterable[str], icon_dir="icons", out_dir=None,
+                cell_size: int = DEFAULT_CELL_SIZE, columns: int = DEFAULT_COLUMNS) -> dict:
+    """Packt die Icons in Atlas-Blätter und schreibt den Index; liefert den Index"""
+    from PIL import Image
+
+    icon_dir = Path(icon_dir)
+    out_dir = Path(out_dir) if out_dir else icon_dir
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    available = [name for name in sorted(set(icon_names)) if (icon_dir / name).is_file()]
+    per_sheet = columns * MAX_ROWS
+    index = {"cell_size": cell_size, "sheets": [], "icons": {}}
+
+    for sheet_no, start in enumerate(range(0, len(available), per_sheet)):
+        names = available[start:start + per_sheet]
+        rows = (len(names) + columns - 1) // columns
+        sheet = Image.new("RGBA", (min(len(names), columns) * cell_size, rows * cell_size), (0, 0, 0, 0))
+
+        for i, name in enumerate(names):
+            try:
+                with Image.open(icon_dir / name) as icon:
+                    icon = icon.convert("RGBA")
+                    icon.thumbnail((cell_size, cell_size), Image.LANCZOS)
+                    x = (i % columns) * cell_size
+                    y = (i // columns) * cell_size
+                    # Kleinere Icons in der Zelle zentrieren
+                    offset = ((cell_size - icon.width) // 2, (cell_size - icon.height) // 2)
+                    sheet.paste(icon, (x + offset[0], y + offset[1]))
+                    index["icons"][name] = [sheet_no, x, y]
+            except Exception as e:
+                logger.warning(f"Skipping icon {name} in atlas: {e}")
+
+        sheet_name = ATLAS_SHEET.format(sheet_no)
+        tmp_path = out_dir / f"{sheet_name}.tmp"
+        sheet.save(tmp_path, format="PNG", optimize=True)
+        os.replace(tmp_path, out_dir / sheet_name)
+        index["sheets"].append(sheet_name)
+
+    tmp_index = out_dir / f"{ATLAS_INDEX}.tmp"
+    with open(tmp_index, "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+    os.replace(tmp_index, out_dir / ATLAS_INDEX)
+
+    logger.info(f"Atlas: {len(index['icons'])} icons in {len(index['sheets'])} sheet(s)")
+    return index
+
+
+def build_catalog_atlas(catalog: ItemCatalog = None, icon_dir="icons", **kwargs) -> dict:
+    """Atlas für alle Icons des Katalogs, ohne Katalog für die Items aller Versionen"""
+    icons = (get_registry().icons() if catalog is None
+             else sorted({item.icon for item in catalog.items if item.icon}))
+    return build_atlas(icons, icon_dir=icon_dir, **kwargs)
+
+
+def load_atlas_index(atlas_dir="icons") -> Optional[Dict]:
+    """Index eines vorhandenen Atlas oder None"""
+    try:
+        with open(Path(atlas_dir) / ATLAS_INDEX, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable atlas index: {e}")
+        return None
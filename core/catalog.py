@@ -0,0 +1,340 @@
+"""
+Zentraler, versionierter Item-Katalog.
+
+Lädt ``data/<version>/items.json`` und ``enchantments.json`` genau einmal pro
+Prozess und baut Indizes nach ID, Anzeigename, Kategorie und erlaubtem Slot auf.
+KitManager, MainWindow, InventoryGrid und EnchantmentDialog greifen alle über
+``get_catalog()`` auf dieselbe Instanz zu.
+
+Versionen (``VersionRegistry``): Nur die Basisversion liegt vollständig vor;
+andere Versionen haben ein ``data/<version>/delta.json`` über einer Basis
+(auch verkettet, z. B. 1.21 -> 1.20.5 -> 1.20)::
+
+    {"base": "1.20",
+     "items":        {"rename": {alt: neu}, "remove": [id], "change": {id: {feld: wert}}, "add": [...]},
+     "enchantments": {... wie items ...}}
+
+Ein Katalog wird erst beim ersten Zugriff gebaut. Unveränderte Einträge
+teilen sich Rohdaten und MinecraftItem/Enchantment-Objekte mit dem Katalog
+der Basis, IDs und Namen werden interniert - der Speicher wächst also mit den
+Unterschieden, nicht mit Versionen x Items. Ein Versionswechsel in der GUI
+liefert den bereits gebauten Katalog.
+"""
+
+import logging
+import re
+import sys
+from fnmatch import translate
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .data_cache import SCHEMA_DIR, load_json_cached
+from .enchant_index import EnchantmentIndex
+from .models import Enchantment, MinecraftItem
+from .placement import slots_to_mask
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VERSION = "1.20"
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = BASE_DIR / "data"
+DELTA_FILE = "delta.json"
+SCHEMAS = {
+    "items.json": SCHEMA_DIR / "items_schema_json.json",
+    "enchantments.json": SCHEMA_DIR / "enchantments_schema_json.json",
+}
+
+
+class ItemCatalog:
+    """Unveränderlicher Katalog aller Items und Verzauberungen einer Version"""
+
+    def __init__(self, version: str = DEFAULT_VERSION, data_dir: Optional[Path] = None,
+                 cache_dir: Optional[Path] = None, raw: Optional[Tuple[List[dict], List[dict]]] = None,
+                 base: Optional["ItemCatalog"] = None, aliases: Optional[Dict[str, str]] = None):
+        self.version = version
+        self.data_dir = Path(data_dir) if data_dir else DATA_DIR / version
+        self.cache_dir = cache_dir
+
+        self.items: List[MinecraftItem] = []
+        self.enchantments: List[Enchantment] = []
+
+        # Indizes
+        self.by_id: Dict[str, MinecraftItem] = {}
+        self.by_name: Dict[str, MinecraftItem] = {}
+        self.by_category: Dict[str, List[MinecraftItem]] = {}
+        self.by_slot: Dict[str, List[MinecraftItem]] = {}
+        self.slot_masks: Dict[str, int] = {}   # {item_id: Bitmaske der erlaubten Slot-Typen}
+        self.enchantments_by_id: Dict[str, Enchantment] = {}
+        self._item_dicts: Dict[str, dict] = {}
+        self._enchantment_dicts: Dict[str, dict] = {}
+        self.base = base                        # Katalog, mit dem Objekte geteilt werden
+        self.aliases = dict(aliases or {})      # {alte ID: neue ID} aus Umbenennungen
+
+        if raw is None:
+            raw = (self._read_json("items.json").get("items", []),
+                   self._read_json("enchantments.json").get("enchantments", []))
+        self._load_items(raw[0])
+        self._load_enchantments(raw[1])
+        self.enchantment_index = EnchantmentIndex(self.enchantments)
+        self.applicable_masks = self._applicable_masks()  # {item_id: Bitset anwendbarer Verzauberungen}
+
+    def _read_json(self, filename: str) -> dict:
+        path = self.data_dir / filename
+        if not path.exists():
+            logger.error(f"Data file not found: {path}")
+            return {}
+        return load_json_cached(path, SCHEMAS.get(filename), self.cache_dir)
+
+    def _load_items(self, raw_items: List[dict]):
+        shared = self.base._item_dicts if self.base else {}
+        for raw in raw_items:
+            if shared.get(raw["id"]) is raw:
+                # Unverändert gegenüber der Basis: Objekt wiederverwenden
+                item = self.base.by_id[raw["id"]]
+            else:
+                item = MinecraftItem(
+                    id=sys.intern(raw["id"]),
+                    name=sys.intern(raw["name"]),
+                    category=sys.intern(raw["category"]),
+                    max_stack=raw.get("max_stack", 64),
+                    slots=[sys.intern(slot) for slot in raw.get("slots", ["inventory"])],
+                    icon=sys.intern(raw.get("icon", "")),
+                    enchantable=raw.get("enchantable", False),
+                )
+            self.items.append(item)
+            self.by_id[item.id] = item
+            self.by_name[item.name] = item
+            self.by_category.setdefault(item.category, []).append(item)
+            for slot in item.slots:
+                self.by_slot.setdefault(slot, []).append(item)
+            self.slot_masks[item.id] = slots_to_mask(item.slots)
+            self._item_dicts[item.id] = raw
+        logger.debug(f"Catalog {self.version}: {len(self.items)} items indexed")
+
+    def _load_enchantments(self, raw_enchantments: List[dict]):
+        shared = self.base._enchantment_dicts if self.base else {}
+        for raw in raw_enchantments:
+            if shared.get(raw["id"]) is raw:
+                enchantment = self.base.enchantments_by_id[raw["id"]]
+            else:
+                enchantment = Enchantment(
+                    id=sys.intern(raw["id"]),
+                    name=sys.intern(raw["name"]),
+                    max_level=raw.get("max_level", 1),
+                    conflicts=[sys.intern(c) for c in raw.get("conflicts", [])],
+                    item_categories=[sys.intern(c) for c in raw.get("item_categories", [])],
+                    items=[sys.intern(pattern) for pattern in raw.get("items", [])],
+                    version=sys.intern(raw.get("version", "")),
+                )
+            self.enchantments.append(enchantment)
+            self.enchantments_by_id[enchantment.id] = enchantment
+            self._enchantment_dicts[enchantment.id] = raw
+
+    def _applicable_masks(self) -> Dict[str, int]:
+        """Anwendbarkeit je Item: ID-Muster der Verzauberung (``items``), sonst ihre Kategorien"""
+        rules = []
+        for bit, enchantment in enumerate(self.enchantment_index.enchantments):
+            pattern = (re.compile("|".join(translate(p) for p in enchantment.items))
+                       if enchantment.items else None)
+            rules.append((1 << bit, pattern, frozenset(enchantment.item_categories)))
+        masks = {}
+        for item in self.items:
+            mask = 0
+            if item.enchantable:
+                for bit, pattern, categories in rules:
+                    if pattern.match(item.id) if pattern else item.category in categories:
+                        mask |= bit
+            masks[item.id] = mask
+        return masks
+        logger.debug(f"Catalog {self.version}: {len(self.enchantments)} enchantments indexed")
+
+    # --- Abfragen ---
+
+    def get(self, item_id: str) -> Optional[MinecraftItem]:
+        """Item per Minecraft-ID"""
+        return self.by_id.get(item_id)
+
+    def get_by_name(self, name: str) -> Optional[MinecraftItem]:
+        """Item per Anzeigename"""
+        return self.by_name.get(name)
+
+    def in_category(self, category: str) -> List[MinecraftItem]:
+        """Alle Items einer Kategorie"""
+        return self.by_category.get(category, [])
+
+    def for_slot(self, slot: str) -> List[MinecraftItem]:
+        """Alle Items, die in einem Ausrüstungsslot erlaubt sind"""
+        return self.by_slot.get(slot, [])
+
+    def get_enchantment(self, enchant_id: str) -> Optional[Enchantment]:
+        """Verzauberung per Minecraft-ID"""
+        return self.enchantments_by_id.get(enchant_id)
+
+    def applicable_enchantments(self, item_id: str) -> int:
+        """Bitset (siehe enchantment_index) der auf das Item anwendbaren Verzauberungen"""
+        return self.applicable_masks.get(item_id, 0)
+
+    def item_dict(self, item_id: str) -> Optional[dict]:
+        """Rohdaten eines Items, wie sie die GUI verwendet (nur lesen!)"""
+        return self._item_dicts.get(item_id)
+
+    def item_dicts(self) -> List[dict]:
+        """Rohdaten aller Items in Dateireihenfolge (nur lesen!)"""
+        return list(self._item_dicts.values())
+
+    def enchantment_dict(self, enchant_id: str) -> Optional[dict]:
+        """Rohdaten einer Verzauberung (nur lesen!)"""
+        return self._enchantment_dicts.get(enchant_id)
+
+    def enchantment_dicts(self) -> List[dict]:
+        """Rohdaten aller Verzauberungen in Dateireihenfolge (nur lesen!)"""
+        return list(self._enchantment_dicts.values())
+
+    def current_id(self, old_id: str) -> str:
+        """Aktuelle ID zu einer in dieser Version umbenannten ID (sonst unverändert)"""
+        return self.aliases.get(old_id, old_id)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item_id):
+        return item_id in self.by_id
+
+
+def version_key(version: str) -> tuple:
+    """"1.20.5" -> (1, 20, 5) zum Sortieren; Nicht-Zahlen ans Ende"""
+    try:
+        return tuple(int(part) for part in str(version).split("."))
+    except ValueError:
+        return (sys.maxsize, str(version))
+
+
+def _intern_keys(entry: dict) -> dict:
+    return {sys.intern(k): v for k, v in entry.items()}
+
+
+def apply_delta(base: List[dict], delta: dict) -> Tuple[List[dict], Dict[str, str]]:
+    """Rohdaten der Basis + Delta -> (Rohdaten, {alte ID: neue ID}).
+
+    Unveränderte Einträge bleiben dieselben Dict-Objekte wie in der Basis.
+    """
+    renames = delta.get("rename", {})
+    removed = set(delta.get("remove", []))
+    changes = delta.get("change", {})
+    result = []
+    for raw in base:
+        old_id = raw["id"]
+        if old_id in removed:
+            continue
+        new_id = renames.get(old_id, old_id)
+        # Verweise (Konflikte) auf umbenannte IDs mitziehen
+        conflicts = raw.get("conflicts")
+        renamed_conflicts = [renames.get(c, c) for c in conflicts] if conflicts else conflicts
+        if new_id != old_id or new_id in changes or renamed_conflicts != conflicts:
+            raw = _intern_keys(dict(raw, **changes.get(new_id, {})))
+            raw["id"] = new_id
+            if conflicts:
+                raw["conflicts"] = renamed_conflicts
+        result.append(raw)
+    result.extend(_intern_keys(entry) for entry in delta.get("add", []))
+    return result, dict(renames)
+
+
+class VersionRegistry:
+    """Alle Datenversionen unter ``data/``; Kataloge werden erst bei Bedarf gebaut"""
+
+    def __init__(self, data_dir: Path = DATA_DIR, cache_dir: Optional[Path] = None):
+        self.data_dir = Path(data_dir)
+        self.cache_dir = cache_dir
+        self._catalogs: Dict[str, ItemCatalog] = {}
+        self._lock = threading.RLock()
+
+    def versions(self) -> List[str]:
+        """Vorhandene Versionen, aufsteigend"""
+        if not self.data_dir.is_dir():
+            return []
+        found = [d.name for d in self.data_dir.iterdir()
+                 if (d / "items.json").exists() or (d / DELTA_FILE).exists()]
+        return sorted(found, key=version_key)
+
+    def __contains__(self, version: str) -> bool:
+        directory = self.data_dir / str(version)
+        return (directory / "items.json").exists() or (directory / DELTA_FILE).exists()
+
+    def delta(self, version: str) -> Optional[dict]:
+        path = self.data_dir / str(version) / DELTA_FILE
+        if not path.exists():
+            return None
+        return load_json_cached(path, cache_dir=self.cache_dir)
+
+    def base_of(self, version: str) -> Optional[str]:
+        delta = self.delta(version)
+        return delta.get("base") if delta else None
+
+    def chain(self, version: str) -> List[str]:
+        """Version und ihre Basen bis zur vollständigen Version"""
+        chain = [version]
+        base = self.base_of(version)
+        while base is not None:
+            if base in chain:
+                raise ValueError(f"Cyclic version deltas: {' -> '.join(chain + [base])}")
+            chain.append(base)
+            base = self.base_of(base)
+        return chain
+
+    def renames(self) -> Dict[str, str]:
+        """{alte ID: neue ID} aller Umbenennungen (Items und Verzauberungen) aller Versionen"""
+        renames = {}
+        for version in self.versions():
+            delta = self.delta(version) or {}
+            for kind in ("items", "enchantments"):
+                renames.update(delta.get(kind, {}).get("rename", {}))
+        return renames
+
+    def icons(self) -> List[str]:
+        """Icon-Dateinamen der Items aller Versionen (ohne Duplikate); baut alle Kataloge"""
+        return sorted({item.icon for version in self.versions()
+                       for item in self.catalog(version).items if item.icon})
+
+    def loaded(self) -> List[str]:
+        return sorted(self._catalogs, key=version_key)
+
+    def catalog(self, version: str = DEFAULT_VERSION) -> ItemCatalog:
+        catalog = self._catalogs.get(version)
+        if catalog is None:
+            with self._lock:
+                catalog = self._catalogs.get(version)
+                if catalog is None:
+                    catalog = self._build(version)
+                    self._catalogs[version] = catalog
+        return catalog
+
+    def _build(self, version: str) -> ItemCatalog:
+        delta = self.delta(version)
+        data_dir = self.data_dir / str(version)
+        if delta is None:
+            return ItemCatalog(version, data_dir=data_dir, cache_dir=self.cache_dir)
+
+        base = self.catalog(delta["base"])
+        items, item_renames = apply_delta(base.item_dicts(), delta.get("items", {}))
+        enchantments, enchant_renames = apply_delta(base.enchantment_dicts(), delta.get("enchantments", {}))
+        # Umbenennungen über die ganze Kette: alte IDs der Basis zeigen auf die neue ID
+        renames = {**item_renames, **enchant_renames}
+        aliases = {old: renames.get(new, new) for old, new in base.aliases.items()}
+        aliases.update(renames)
+        logger.debug(f"Catalog {version}: built from {delta['base']} + delta")
+        return ItemCatalog(version, data_dir=data_dir, cache_dir=self.cache_dir,
+                           raw=(items, enchantments), base=base, aliases=aliases)
+
+
+_registry = VersionRegistry()
+
+
+def get_registry() -> VersionRegistry:
+    return _registry
+
+
+def get_catalog(version: str = DEFAULT_VERSION) -> ItemCatalog:
+    """Liefert den prozessweit geteilten Katalog einer Version (lädt beim ersten Zugriff)"""
+    return _registry.catalog(version)
@@ -0,0 +1,501 @@
+"""
+Headless-Kommandozeile für Kit-Builds (ohne Qt, ohne Netzwerk).
+
+Verwendung:
+    python -m core.cli build kits/*.json --out dist/
+    python -m core.cli build kits/ --out dist/ --jobs 8 --format give
+    python -m core.cli validate kits/ --report report.json
+    python -m core.cli archive pack kits/ --out library.mkc
+    python -m core.cli archive get library.mkc pvp_tier1 --out pvp_tier1.nbt
+    python -m core.cli datapack kits/ --out world/datapacks/kits --loot-tables
+    python -m core.cli import legacy_nbt/ --out kits/
+    python -m core.cli store add kits/ && python -m core.cli store find --item minecraft:elytra
+    python -m core.cli preset apply PvP kits/ --out kits_pvp/
+    python -m core.cli versions
+    python -m core.cli migrate kits/ --to 1.21 --out kits_1.21/ --report migration.json
+    python -m core.cli icons sync --base-url /srv/icon-mirror
+    python -m core.cli icons atlas
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List
+
+from .atlas import DEFAULT_CELL_SIZE, load_atlas_index
+from .catalog import DEFAULT_VERSION, get_registry
+from .exporters import commands_fit, generate_give_command, give_syntax, save_items_nbt, write_give_function
+from .kit_files import kit_to_export_data, load_kit_file, validate_kit
+from .presets import PRESETS_FILE
+from .validation import validate_files
+
+logger = logging.getLogger(__name__)
+
+
+def expand_inputs(patterns: List[str]) -> List[Path]:
+    """Expandiert Globs und Verzeichnisse zu einer sortierten Liste von Kit-Dateien"""
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.extend(Path(pattern).glob("*.json"))
+        else:
+            # Nicht expandierte Muster als Pfad behalten, damit der Fehler im Report erscheint
+            matches = glob.glob(pattern) or [pattern]
+            paths.extend(Path(m) for m in matches)
+    return sorted(set(paths))
+
+
+def file_name(name: str) -> str:
+    """Kitname -> Dateiname ohne Pfadtrenner, Steuerzeichen und führende Punkte"""
+    return re.sub(r'[\\/:*?"<>|\x00-\x1f]', "_", name).strip(" .") or "kit"
+
+
+def output_names(paths: List[Path]) -> List[str]:
+    """Dateinamen der Ausgaben, im Hauptprozess vergeben: aus dem Kitnamen (sonst dem
+    Dateinamen); gleiche Namen (auch nur in Groß-/Kleinschreibung) erhalten ``-2``, ``-3``, ..."""
+    names, used = [], set()
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                base = file_name(str(json.load(f).get("name", path.stem)))
+        except Exception:
+            base = file_name(path.stem)     # Fehler meldet build_kit
+        name, counter = base, 1
+        while name.casefold() in used:
+            counter += 1
+            name = f"{base}-{counter}"
+        used.add(name.casefold())
+        names.append(name)
+    return names
+
+
+def build_kit(path: Path, out_dir: Path, formats: tuple, gzipped: bool = False, syntax: str = None,
+              output: str = None) -> dict:
+    """Baut ein einzelnes Kit nach ``out_dir/<output>.*``; läuft im Worker-Prozess"""
+    start = time.perf_counter()
+    result = {"path": str(path), "kit": path.stem, "ok": False, "errors": []}
+    try:
+        kit = load_kit_file(path)
+        result["kit"] = kit.name
+        output = output or file_name(kit.name)
+        errors = validate_kit(kit)
+        if errors:
+            result["errors"] = errors
+        else:
+            if "nbt" in formats:
+                save_items_nbt(kit_to_export_data(kit), out_dir / f"{output}.nbt", gzipped=gzipped,
+                               syntax=syntax or give_syntax(kit.version))
+            if "give" in formats:
+                commands = generate_give_command(kit.slots, kit.name, syntax or give_syntax(kit.version)).split("\n")
+                if commands_fit(commands):
+                    (out_dir / f"{output}.give.txt").write_text("\n".join(commands) + "\n", encoding="utf-8")
+                else:
+                    # Einzelnes Item über der Befehlslänge: nur als Funktionsdatei nutzbar
+                    write_give_function(commands, out_dir / f"{output}.mcfunction")
+            result["ok"] = True
+    except Exception as e:
+        result["errors"] = [f"{type(e).__name__}: {e}"]
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def cmd_build(args) -> int:
+    paths = expand_inputs(args.kits)
+    if not paths:
+        print("No kit files found", file=sys.stderr)
+        return 2
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    formats = ("nbt", "give") if args.format == "both" else (args.format,)
+
+    start = time.perf_counter()
+    # Ausgabenamen vor dem Verteilen vergeben, damit sich keine zwei Kits überschreiben
+    outputs = output_names(paths)
+    if args.jobs == 1:
+        results = [build_kit(path, out_dir, formats, args.gzip, args.syntax, output)
+                   for path, output in zip(paths, outputs)]
+    else:
+        workers = args.jobs or os.cpu_count() or 1
+        chunksize = max(1, len(paths) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(build_kit, paths, [out_dir] * len(paths), [formats] * len(paths),
+                                    [args.gzip] * len(paths), [args.syntax] * len(paths), outputs,
+                                    chunksize=chunksize))
+    total = time.perf_counter() - start
+
+    failed = 0
+    for result in results:
+        status = "ok  " if result["ok"] else "FAIL"
+        print(f"{status} {result['seconds'] * 1000:8.1f} ms  {result['kit']}")
+        for error in result["errors"]:
+            print(f"       {error}")
+        failed += not result["ok"]
+
+    print(f"{len(results) - failed}/{len(results)} kits built in {total:.2f}s")
+    return 1 if failed else 0
+
+
+def cmd_validate(args) -> int:
+    paths = expand_inputs(args.kits)
+    if not paths:
+        print("No kit files found", file=sys.stderr)
+        return 2
+
+    report = validate_files(paths, jobs=args.jobs)
+    if args.report == "-":
+        print(report.to_json())
+    else:
+        if args.report:
+            Path(args.report).write_text(report.to_json() + "\n", encoding="utf-8")
+        for issue in report.issues:
+            print(f"{issue.path}: [{issue.code}] {issue.describe()}")
+        summary = report.to_dict()
+        print(f"{summary['valid']}/{summary['kits']} kits valid, {len(report.issues)} issue(s) "
+              f"in {report.seconds:.2f}s")
+    return 1 if report.issues else 0
+
+
+def cmd_archive_pack(args) -> int:
+    from .archive import export_kit_library, iter_kit_files
+
+    paths = expand_inputs(args.kits)
+    if not paths:
+        print("No kit files found", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    skipped = export_kit_library(iter_kit_files(paths), args.out, args.format)
+    for name, errors in sorted(skipped.items()):
+        print(f"FAIL {name}")
+        for error in errors:
+            print(f"       {error}")
+    print(f"{len(paths) - len(skipped)}/{len(paths)} kits archived to {args.out} "
+          f"in {time.perf_counter() - start:.2f}s")
+    return 1 if skipped else 0
+
+
+def cmd_archive_list(args) -> int:
+    from .archive import KitArchiveReader
+
+    with KitArchiveReader(args.archive) as archive:
+        for name in archive.names():
+            print(f"{archive.index[name][1]:8d}  {name}")
+    return 0
+
+
+def cmd_archive_get(args) -> int:
+    from .archive import KitArchiveReader
+
+    with KitArchiveReader(args.archive) as archive:
+        if args.name not in archive:
+            print(f"Kit not found: {args.name}", file=sys.stderr)
+            return 1
+        Path(args.out or f"{args.name}.nbt").write_bytes(archive.read(args.name))
+    return 0
+
+
+def cmd_datapack(args) -> int:
+    from .datapack import export_datapack, pack_format
+
+    paths = expand_inputs(args.kits)
+    if not paths:
+        print("No kit files found", file=sys.stderr)
+        return 2
+
+    try:
+        pack_format(args.version)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    result = export_datapack(paths, args.out, namespace=args.namespace, version=args.version,
+                             loot_tables=args.loot_tables, jobs=args.jobs)
+    for name, errors in sorted(result.failed.items()):
+        print(f"FAIL {name}")
+        for error in errors:
+            print(f"       {error}")
+    print(f"{result.summary()} in {time.perf_counter() - start:.2f}s")
+    return 1 if result.failed else 0
+
+
+def cmd_import(args) -> int:
+    from .nbt_import import import_directory
+
+    result = import_directory(args.source, args.out, version=args.version, jobs=args.jobs)
+    for path, warnings in sorted(result.warnings.items()):
+        for warning in warnings:
+            print(f"WARN {path}: {warning}")
+    for path, error in sorted(result.failed.items()):
+        print(f"FAIL {path}: {error}")
+    print(result.summary())
+    return 1 if result.failed else 0
+
+
+def cmd_store_add(args) -> int:
+    from .kit_files import kit_to_dict
+    from .kit_store import DEFAULT_DB, KitStore
+
+    paths = expand_inputs(args.kits)
+    failed = 0
+
+    def definitions():
+        nonlocal failed
+        for path in paths:
+            try:
+                kit = load_kit_file(path)
+                yield kit_to_dict(kit)
+            except Exception as e:
+                failed += 1
+                print(f"FAIL {path}: {type(e).__name__}: {e}")
+
+    with KitStore(args.db or DEFAULT_DB) as store:
+        added = store.save_many(definitions())
+        print(f"{added} kits stored, {len(store)} in {store.path}")
+    return 1 if failed else 0
+
+
+def cmd_store_find(args) -> int:
+    from .kit_store import DEFAULT_DB, KitStore
+
+    with KitStore(args.db or DEFAULT_DB) as store:
+        after = ""
+        while True:
+            page = store.page(after, item_id=args.item, enchant_id=args.enchantment)
+            for name, version, slot_count in page:
+                print(f"{name}  ({version}, {slot_count} slots)")
+            if not page:
+                break
+            after = page[-1][0]
+    return 0
+
+
+def cmd_preset_list(args) -> int:
+    from .presets import load_presets
+
+    for name, preset in load_presets(args.presets).items():
+        levels = "alle anwendbaren, Maximalstufe" if preset.max_all else ", ".join(
+            f"{enchant_id.split(':')[-1]} {level}" for enchant_id, level in preset.levels.items())
+        print(f"{name}: {levels}")
+    return 0
+
+
+def cmd_preset_apply(args) -> int:
+    from .migration import output_paths
+    from .presets import apply_to_definitions, get_preset
+
+    preset = get_preset(args.preset, args.presets)
+
+    # Definitionen direkt bearbeiten, ohne Kit-Objekte zu bauen
+    files, failed = [], 0
+    paths = expand_inputs(args.kits)
+    # Unter --out bleibt die Ordnerstruktur erhalten (gleichnamige Kits überschreiben sich nicht)
+    for path, target in zip(paths, output_paths([str(p) for p in paths], args.out)):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                files.append((Path(target), json.load(f)))
+        except Exception as e:
+            failed += 1
+            print(f"FAIL {path}: {type(e).__name__}: {e}")
+    changed = apply_to_definitions([definition for _, definition in files], preset)
+    for target, definition in files:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "w", encoding="utf-8") as f:
+            json.dump(definition, f, ensure_ascii=False, indent=2)
+    print(f"{preset.name}: {changed} slot(s) in {len(files)} kit(s) enchanted")
+    return 1 if failed else 0
+
+
+def cmd_versions(args) -> int:
+    registry = get_registry()
+    for version in registry.versions():
+        delta = registry.delta(version)
+        if delta is None:
+            print(f"{version}  (vollständig)")
+            continue
+        parts = []
+        for kind in ("items", "enchantments"):
+            changes = delta.get(kind, {})
+            counts = [f"{len(changes[key])} {key}" for key in ("add", "remove", "rename", "change") if changes.get(key)]
+            if counts:
+                parts.append(f"{kind}: {', '.join(counts)}")
+        print(f"{version}  <- {delta['base']}  {'; '.join(parts) or 'unverändert'}")
+    return 0
+
+
+def cmd_migrate(args) -> int:
+    from .migration import migrate_files
+
+    if args.to not in get_registry():
+        print(f"Unknown target version {args.to!r} (available: {', '.join(get_registry().versions())})")
+        return 2
+    report = migrate_files(expand_inputs(args.kits), args.to, source=args.source, out_dir=args.out,
+                           jobs=args.jobs, nbt=args.nbt, dry_run=args.dry_run)
+    # Bericht auf stdout: Klartext nach stderr, damit stdout gültiges JSON bleibt
+    log = sys.stderr if args.report == "-" else sys.stdout
+    for kit in report.kits:
+        if kit.error:
+            print(f"FAIL {kit.path}: {kit.error}", file=log)
+            continue
+        for change in kit.changes:
+            after = f" -> {change.after}" if change.after is not None else ""
+            print(f"{kit.kit}: slot {change.slot} {change.change}: {change.before}{after}", file=log)
+        for issue in kit.issues:
+            print(f"{kit.kit}: {issue}", file=log)
+    if args.report == "-":
+        print(report.to_json(indent=2))
+    elif args.report:
+        Path(args.report).write_text(report.to_json(indent=2), encoding="utf-8")
+    print(report.summary(), file=log)
+    return 1 if report.failed else 0
+
+
+def cmd_icons_sync(args) -> int:
+    from .icon_sync import sync_icons
+
+    result = sync_icons(icon_dir=args.icons, base_url=args.base_url, refresh=args.refresh,
+                        concurrency=args.concurrency)
+    for icon_name, error in sorted(result.failed.items()):
+        print(f"FAIL {icon_name}: {error}")
+    print(result.summary())
+
+    # Vorhandenen Atlas aktuell halten
+    if result.downloaded and load_atlas_index(args.icons) is not None:
+        cmd_icons_atlas(args)
+    return 1 if result.failed else 0
+
+
+def cmd_icons_atlas(args) -> int:
+    from .atlas import build_catalog_atlas
+
+    index = build_catalog_atlas(icon_dir=args.icons, cell_size=getattr(args, "cell", DEFAULT_CELL_SIZE))
+    print(f"{len(index['icons'])} icons packed into {len(index['sheets'])} atlas sheet(s)")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m core.cli", description="MinecraftKitCreator headless tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Kit-Definitionen validieren und exportieren")
+    build.add_argument("kits", nargs="+", help="Kit-JSON-Dateien, Globs oder Verzeichnisse")
+    build.add_argument("--out", default="dist", help="Ausgabeverzeichnis (Standard: dist/)")
+    build.add_argument("--format", choices=["nbt", "give", "both"], default="both")
+    build.add_argument("--jobs", type=int, default=None, help="Anzahl Worker-Prozesse (Standard: CPU-Kerne)")
+    build.add_argument("--gzip", action="store_true", help=".nbt-Dateien gzip-komprimiert schreiben")
+    build.add_argument("--syntax", choices=["legacy", "components"], default=None,
+                       help="/give- und NBT-Syntax (Standard: nach Kit-Version, ab 1.20.5 components)")
+    build.set_defaults(func=cmd_build)
+
+    validate = sub.add_parser("validate", help="Viele Kits prüfen und einen JSON-Report erzeugen")
+    validate.add_argument("kits", nargs="+", help="Kit-JSON-Dateien, Globs oder Verzeichnisse")
+    validate.add_argument("--report", default=None, help="JSON-Report in Datei schreiben ('-' = stdout)")
+    validate.add_argument("--jobs", type=int, default=None, help="Anzahl Worker-Prozesse (Standard: CPU-Kerne)")
+    validate.set_defaults(func=cmd_validate)
+
+    archive = sub.add_parser("archive", help="Kit-Bibliothek als ein Archiv (.zip oder .mkc)")
+    archive_sub = archive.add_subparsers(dest="archive_command", required=True)
+    pack = archive_sub.add_parser("pack", help="Kits streamend in ein Archiv schreiben")
+    pack.add_argument("kits", nargs="+", help="Kit-JSON-Dateien, Globs oder Verzeichnisse")
+    pack.add_argument("--out", required=True, help="Archivdatei (.zip oder .mkc)")
+    pack.add_argument("--format", choices=["zip", "mkc"], default=None,
+                      help="Archivformat (Standard: aus der Dateiendung)")
+    pack.set_defaults(func=cmd_archive_pack)
+    listing = archive_sub.add_parser("list", help="Kits in einem Archiv auflisten")
+    listing.add_argument("archive")
+    listing.set_defaults(func=cmd_archive_list)
+    get = archive_sub.add_parser("get", help="Ein Kit als .nbt-Datei entnehmen")
+    get.add_argument("archive")
+    get.add_argument("name")
+    get.add_argument("--out", default=None, help="Zieldatei (Standard: <name>.nbt)")
+    get.set_defaults(func=cmd_archive_get)
+
+    datapack = sub.add_parser("datapack", help="Kits als Datapack (Funktionen, optional Loot-Tabellen)")
+    datapack.add_argument("kits", nargs="+", help="Kit-JSON-Dateien, Globs oder Verzeichnisse")
+    datapack.add_argument("--out", required=True, help="Datapack-Verzeichnis (z. B. world/datapacks/kits)")
+    datapack.add_argument("--namespace", default="kits", help="Namespace (Standard: kits)")
+    datapack.add_argument("--version", default=DEFAULT_VERSION, help="Spielversion für pack_format und Ordnernamen")
+    datapack.add_argument("--loot-tables", action="store_true", help="Zusätzlich Loot-Tabellen erzeugen")
+    datapack.add_argument("--jobs", type=int, default=None, help="Anzahl Worker-Prozesse (Standard: CPU-Kerne)")
+    datapack.set_defaults(func=cmd_datapack)
+
+    nbt_import = sub.add_parser("import", help="Shulker-.nbt-Dateien in Kit-Definitionen umwandeln")
+    nbt_import.add_argument("source", help="Verzeichnis mit .nbt-Dateien (rekursiv)")
+    nbt_import.add_argument("--out", required=True, help="Zielverzeichnis für Kit-JSON-Dateien")
+    nbt_import.add_argument("--version", default=None,
+                            help="Katalog-Version für die ID-Zuordnung (Standard: aus dem Item-Format)")
+    nbt_import.add_argument("--jobs", type=int, default=None, help="Anzahl Worker-Prozesse (Standard: CPU-Kerne)")
+    nbt_import.set_defaults(func=cmd_import)
+
+    store = sub.add_parser("store", help="Persistente Kit-Bibliothek (SQLite)")
+    store.add_argument("--db", default=None, help="Datenbankdatei (Standard: $MKC_KIT_DB oder kits.db)")
+    store_sub = store.add_subparsers(dest="store_command", required=True)
+    store_add = store_sub.add_parser("add", help="Kit-Dateien in die Bibliothek übernehmen")
+    store_add.add_argument("kits", nargs="+", help="Kit-JSON-Dateien, Globs oder Verzeichnisse")
+    store_add.set_defaults(func=cmd_store_add)
+    store_find = store_sub.add_parser("find", help="Kits nach Item oder Verzauberung suchen")
+    store_find.add_argument("--item", default=None, help="z. B. minecraft:elytra")
+    store_find.add_argument("--enchantment", default=None, help="z. B. minecraft:mending")
+    store_find.set_defaults(func=cmd_store_find)
+
+    preset = sub.add_parser("preset", help="Verzauberungs-Presets (data/presets.json)")
+    preset.add_argument("--presets", default=str(PRESETS_FILE), help="Preset-Datei")
+    preset_sub = preset.add_subparsers(dest="preset_command", required=True)
+    preset_list = preset_sub.add_parser("list", help="Vorhandene Presets anzeigen")
+    preset_list.set_defaults(func=cmd_preset_list)
+    preset_apply = preset_sub.add_parser("apply", help="Preset auf alle Slots vieler Kits anwenden")
+    preset_apply.add_argument("preset", help="Name des Presets, z. B. PvP")
+    preset_apply.add_argument("kits", nargs="+", help="Kit-JSON-Dateien, Globs oder Verzeichnisse")
+    preset_apply.add_argument("--out", default=None, help="Zielverzeichnis (Standard: Dateien überschreiben)")
+    preset_apply.set_defaults(func=cmd_preset_apply)
+
+    versions = sub.add_parser("versions", help="Datenversionen und ihre Deltas anzeigen")
+    versions.set_defaults(func=cmd_versions)
+
+    migrate = sub.add_parser("migrate", help="Kits auf eine andere Datenversion umschreiben")
+    migrate.add_argument("kits", nargs="+", help="Kit-JSON-Dateien, Globs oder Verzeichnisse")
+    migrate.add_argument("--to", required=True, help="Zielversion, z. B. 1.21")
+    migrate.add_argument("--from", dest="source", default=None,
+                         help="Quellversion (Standard: 'version' der Kit-Datei)")
+    migrate.add_argument("--out", default=None, help="Zielverzeichnis (Standard: Dateien ersetzen)")
+    migrate.add_argument("--report", default=None, help="Diff-Bericht als JSON ('-' = stdout)")
+    migrate.add_argument("--nbt", action="store_true", help="Zusätzlich .nbt im Format der Zielversion")
+    migrate.add_argument("--dry-run", action="store_true", help="Nur berichten, nichts schreiben")
+    migrate.add_argument("--jobs", type=int, default=None, help="Anzahl Worker-Prozesse (Standard: CPU-Kerne)")
+    migrate.set_defaults(func=cmd_migrate)
+
+    icons = sub.add_parser("icons", help="Item-Icons verwalten")
+    icons_sub = icons.add_subparsers(dest="icons_command", required=True)
+    sync = icons_sub.add_parser("sync", help="Fehlende/geänderte Icons herunterladen")
+    sync.add_argument("--icons", default="icons", help="Icon-Verzeichnis (Standard: icons/)")
+    sync.add_argument("--base-url", default=None,
+                      help="HTTP-Basis-URL, lokales Spiegelverzeichnis oder file://-URL")
+    sync.add_argument("--concurrency", type=int, default=8)
+    sync.add_argument("--refresh", action="store_true",
+                      help="Auch vorhandene Icons per bedingter Anfrage prüfen")
+    sync.set_defaults(func=cmd_icons_sync)
+
+    atlas = icons_sub.add_parser("atlas", help="Sprite-Atlas aus allen Katalog-Icons bauen")
+    atlas.add_argument("--icons", default="icons", help="Icon-Verzeichnis (Standard: icons/)")
+    atlas.add_argument("--cell", type=int, default=DEFAULT_CELL_SIZE, help="Zellgröße in Pixeln")
+    atlas.set_defaults(func=cmd_icons_atlas)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s - %(message)s")
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""
+Kompakte Kit-Darstellung für große Bibliotheken.
+
+Ein ``Kit`` aus KitSlot-Objekten kostet pro Slot mehrere Python-Objekte
+(Slot, Verzauberungsliste, Verzauberungen). ``CompactKit`` speichert die 27
+Slots einer Shulker-Kiste stattdessen in festen Arrays:
+
+* ``items``: ``array('H')`` mit Item-Index + 1 (0 = leerer Slot)
+* ``counts``: ``bytearray`` mit der Anzahl je Slot
+* ``enchantments``: ``bytes`` mit je verzaubertem Slot ``slot, n`` und ``n``
+  Paaren (verzauberungs-index, stufe), nach Slot sortiert
+* ``names``: eigene Anzeigenamen ``{slot: name}``, meist ``None``
+
+Die Indizes vergibt ``KitCodec`` (einer pro Katalog, siehe ``get_codec``):
+Items in Katalogreihenfolge, Verzauberungen wie im EnchantmentIndex. Beim
+Zurückwandeln in KitSlots verwenden alle Kits dieselben MinecraftItem- und
+Enchantment-Objekte (je Verzauberung und Stufe eines).
+"""
+
+import weakref
+from array import array
+from dataclasses import replace
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .catalog import DEFAULT_VERSION, ItemCatalog, get_catalog
+from .models import Enchantment, Kit, KitSlot
+from .validation import SHULKER_SLOTS
+
+_EMPTY_ITEMS = bytes(2 * SHULKER_SLOTS)
+
+
+class KitCodec:
+    """Item- und Verzauberungs-Indizes eines Katalogs"""
+
+    def __init__(self, catalog: ItemCatalog):
+        if len(catalog.items) >= 0xFFFF or len(catalog.enchantment_index) > 0xFF:
+            raise ValueError(f"Catalog {catalog.version} too large for compact kits")
+        self.catalog = catalog
+        self.items = list(catalog.items)
+        self.item_index: Dict[str, int] = {item.id: i + 1 for i, item in enumerate(self.items)}
+        self.enchantment_index = catalog.enchantment_index
+        self._enchantments: Dict[Tuple[int, int], Enchantment] = {}
+        self._decoded: Dict[bytes, Tuple[Enchantment, ...]] = {b"": ()}
+
+    def enchantment(self, bit: int, level: int) -> Enchantment:
+        """Gemeinsames Enchantment-Objekt für (Index, Stufe)"""
+        key = (bit, level)
+        enchantment = self._enchantments.get(key)
+        if enchantment is None:
+            definition = self.enchantment_index.enchantments[bit]
+            enchantment = self._enchantments[key] = (
+                definition if definition.level == level else replace(definition, level=level))
+        return enchantment
+
+    def decode(self, pairs: bytes) -> Tuple[Enchantment, ...]:
+        """(Index, Stufe)-Paare eines Slots -> Verzauberungen; gleiche Paare liefern dasselbe Tupel"""
+        enchantments = self._decoded.get(pairs)
+        if enchantments is None:
+            enchantments = self._decoded[pairs] = tuple(
+                self.enchantment(pairs[i], pairs[i + 1]) for i in range(0, len(pairs), 2))
+        return enchantments
+
+
+_codecs: "weakref.WeakKeyDictionary[ItemCatalog, KitCodec]" = weakref.WeakKeyDictionary()
+
+
+def get_codec(catalog: Optional[ItemCatalog] = None) -> KitCodec:
+    catalog = catalog or get_catalog()
+    codec = _codecs.get(catalog)
+    if codec is None:
+        codec = _codecs[catalog] = KitCodec(catalog)
+    return codec
+
+
+def _byte(value: int, what: str, slot_id: int) -> int:
+    if not 0 <= value <= 0xFF:
+        raise ValueError(f"Slot {slot_id}: {what} {value} out of range 0-255")
+    return value
+
+
+class CompactKit:
+    __slots__ = ("name", "codec", "items", "counts", "enchantments", "names")
+
+    def __init__(self, name: str, codec: KitCodec, items: Optional[array] = None,
+                 counts: Optional[bytearray] = None, enchantments: bytes = b"",
+                 names: Optional[Dict[int, str]] = None):
+        self.name = name
+        self.codec = codec
+        self.items = items if items is not None else array("H", _EMPTY_ITEMS)
+        self.counts = counts if counts is not None else bytearray(SHULKER_SLOTS)
+        self.enchantments = enchantments
+        self.names = names or None
+
+    @property
+    def version(self) -> str:
+        return self.codec.catalog.version
+
+    # --- Aufbau ---
+
+    @classmethod
+    def from_entries(cls, name: str, entries: Iterable[Tuple[int, str, int, Iterable[Tuple[str, int]], Optional[str]]],
+                     codec: KitCodec) -> "CompactKit":
+        """Aus (slot, item_id, anzahl, [(verzauberung, stufe)], anzeigename); ungültige Werte -> ValueError"""
+        items = array("H", _EMPTY_ITEMS)
+        counts = bytearray(SHULKER_SLOTS)
+        runs: Dict[int, bytes] = {}
+        names = {}
+        item_index = codec.item_index
+        enchant_index = codec.enchantment_index.index
+        for slot_id, item_id, count, enchantments, display_name in entries:
+            if not 0 <= slot_id < SHULKER_SLOTS:
+                raise ValueError(f"Slot {slot_id} out of range 0-{SHULKER_SLOTS - 1}")
+            index = item_index.get(item_id)
+            if index is None:
+                raise ValueError(f"Unknown item id: {item_id!r}")
+            items[slot_id] = index
+            counts[slot_id] = _byte(count, "count", slot_id)
+            pairs = bytearray()
+            for enchant_id, level in enchantments:
+                bit = enchant_index.get(enchant_id)
+                if bit is None:
+                    raise ValueError(f"Unknown enchantment id: {enchant_id!r}")
+                pairs.append(bit)
+                pairs.append(_byte(level, "level", slot_id))
+            if pairs:
+                runs[slot_id] = bytes((slot_id, len(pairs) // 2)) + pairs
+            if display_name and display_name != codec.items[index - 1].name:
+                names[slot_id] = display_name
+        packed = b"".join(runs[slot_id] for slot_id in sorted(runs))
+        return cls(name, codec, items, counts, packed, names)
+
+    @classmethod
+    def from_slots(cls, name: str, slots: Iterable[KitSlot], codec: Optional[KitCodec] = None) -> "CompactKit":
+        return cls.from_entries(name, (
+            (slot.slot_id, slot.item.id, slot.count,
+             [(e.id, e.level) for e in slot.enchantments], slot.display_name)
+            for slot in slots), codec or get_codec())
+
+    @classmethod
+    def from_kit(cls, kit: Kit, codec: Optional[KitCodec] = None) -> "CompactKit":
+        return cls.from_slots(kit.name, kit.slots, codec or get_codec(get_catalog(kit.version)))
+
+    @classmethod
+    def from_definition(cls, data: dict, codec: Optional[KitCodec] = None, name: str = "kit") -> "CompactKit":
+        """Aus einer Kit-Definition (Format von core/kit_files.py)"""
+        codec = codec or get_codec(get_catalog(str(data.get("version", DEFAULT_VERSION))))
+        return cls.from_entries(str(data.get("name", name)), (
+            (int(entry["slot"]), entry.get("id", ""), int(entry.get("count", 1)),
+             [(e.get("id", ""), int(e.get("level", 1))) for e in entry.get("enchantments", ())],
+             entry.get("name"))
+            for entry in data.get("slots", [])), codec)
+
+    # --- Zugriff ---
+
+    def __len__(self):
+        """Belegte Slots"""
+        return SHULKER_SLOTS - self.items.count(0)
+
+    def __eq__(self, other):
+        if not isinstance(other, CompactKit):
+            return NotImplemented
+        return (self.name == other.name and self.codec is other.codec and self.items == other.items
+                and self.counts == other.counts and self.enchantments == other.enchantments
+                and self.names == other.names)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"CompactKit({self.name!r}, {self.version}, {len(self)} slots)"
+
+    def enchantment_runs(self) -> Dict[int, bytes]:
+        """{slot: (index, stufe)-Paare} der verzauberten Slots"""
+        runs = {}
+        packed, i = self.enchantments, 0
+        while i < len(packed):
+            end = i + 2 + 2 * packed[i + 1]
+            runs[packed[i]] = packed[i + 2:end]
+            i = end
+        return runs
+
+    def slot(self, slot_id: int) -> Optional[KitSlot]:
+        index = self.items[slot_id]
+        if not index:
+            return None
+        pairs = self.enchantment_runs().get(slot_id, b"")
+        return KitSlot(item=self.codec.items[index - 1], slot_id=slot_id,
+                       enchantments=list(self.codec.decode(pairs)), count=self.counts[slot_id],
+                       display_name=self.names.get(slot_id) if self.names else None)
+
+    def to_slots(self) -> List[KitSlot]:
+        codec, counts, names = self.codec, self.counts, self.names or {}
+        items, decode = codec.items, codec.decode
+        runs = self.enchantment_runs()
+        return [KitSlot(item=items[index - 1], slot_id=slot_id,
+                        enchantments=list(decode(runs.get(slot_id, b""))),
+                        count=counts[slot_id], display_name=names.get(slot_id))
+                for slot_id, index in enumerate(self.items) if index]
+
+    def to_kit(self) -> Kit:
+        return Kit(name=self.name, slots=self.to_slots(), version=self.version)
+
+    def to_definition(self) -> dict:
+        """Gegenstück zu from_definition (wie kit_files.kit_to_dict)"""
+        codec, names = self.codec, self.names or {}
+        ids = codec.enchantment_index.ids
+        runs = self.enchantment_runs()
+        slots = []
+        for slot_id, index in enumerate(self.items):
+            if not index:
+                continue
+            item = codec.items[index - 1]
+            entry = {"slot": slot_id, "id": item.id, "name": names.get(slot_id, item.name),
+                     "count": self.counts[slot_id]}
+            pairs = runs.get(slot_id)
+            if pairs:
+                entry["enchantments"] = [{"id": ids[pairs[i]], "level": pairs[i + 1]}
+                                         for i in range(0, len(pairs), 2)]
+            slots.append(entry)
+        return {"name": self.name, "version": self.version, "slots": slots}
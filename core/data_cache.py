@@ -0,0 +1,111 @@
+"""
+Kompilierter Cache für die JSON-Datendateien.
+
+Geparste und per ``jsonschema`` validierte Daten werden als Pickle unter dem
+Cache-Verzeichnis abgelegt. Der Cache-Schlüssel besteht aus Pfad, Größe und
+mtime der Quelldatei sowie dem Hash des Schemas; ändert sich eines davon, wird
+die Datei neu geparst, validiert und der Cache atomar ersetzt.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT = 1
+BASE_DIR = Path(__file__).resolve().parent.parent
+SCHEMA_DIR = BASE_DIR / "schema"
+DEFAULT_CACHE_DIR = Path(os.environ.get("MKC_CACHE_DIR", BASE_DIR / ".cache"))
+
+_schema_hashes = {}
+
+
+def schema_hash(schema_path: Optional[Path]) -> str:
+    """SHA-256 des Schemas (pro Prozess gemerkt)"""
+    if schema_path is None or not Path(schema_path).exists():
+        return ""
+    key = str(schema_path)
+    if key not in _schema_hashes:
+        _schema_hashes[key] = hashlib.sha256(Path(schema_path).read_bytes()).hexdigest()
+    return _schema_hashes[key]
+
+
+def cache_key(path: Path, schema_path: Optional[Path]) -> tuple:
+    stat = path.stat()
+    return (CACHE_FORMAT, str(path.resolve()), stat.st_size, stat.st_mtime_ns, schema_hash(schema_path))
+
+
+def cache_file_for(path: Path, cache_dir: Path) -> Path:
+    digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{path.stem}-{digest}.pickle"
+
+
+def validate(data: dict, schema_path: Optional[Path]) -> bool:
+    """Validiert gegen das JSON-Schema; ohne jsonschema wird nur gewarnt"""
+    if schema_path is None or not Path(schema_path).exists():
+        return True
+    try:
+        import jsonschema
+    except ImportError:
+        logger.debug("jsonschema not installed, skipping validation")
+        return True
+
+    with open(schema_path, "r", encoding="utf-8") as f:
+        schema = json.load(f)
+    try:
+        jsonschema.validate(data, schema)
+        return True
+    except jsonschema.ValidationError as e:
+        logger.error(f"Schema validation failed for {schema_path.name}: {e.message}")
+        return False
+
+
+def _write_atomic(target: Path, payload: dict):
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=target.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def load_json_cached(path, schema_path=None, cache_dir=None) -> dict:
+    """Lädt eine JSON-Datendatei, bevorzugt aus dem kompilierten Cache"""
+    path = Path(path)
+    schema_path = Path(schema_path) if schema_path else None
+    cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+
+    key = cache_key(path, schema_path)
+    cache_file = cache_file_for(path, cache_dir)
+
+    try:
+        with open(cache_file, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("key") == key:
+            return cached["data"]
+        logger.debug(f"Cache stale for {path.name}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache {cache_file}: {e}")
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    # Ungültige Daten werden nicht gecacht, damit der Fehler sichtbar bleibt
+    if validate(data, schema_path):
+        try:
+            _write_atomic(cache_file, {"key": key, "data": data})
+        except OSError as e:
+            logger.warning(f"Could not write cache {cache_file}: {e}")
+    return data
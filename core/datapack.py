@@ -0,0 +1,301 @@
+"""
+Kit-Bibliotheken als Datapack.
+
+Aufbau (Ordnernamen ab 1.21 im Singular: ``function``, ``loot_table``)::
+
+    <out>/pack.mcmeta
+    <out>/data/<ns>/functions/kits/<kit>.mcfunction    -> /function <ns>:kits/<kit>
+    <out>/data/<ns>/loot_tables/kits/<kit>.json        (optional)
+    <out>/.mkc-manifest.json                           {"files": {pfad: sha256},
+                                                        "kits": {kit-datei: [pfad, ...]}}
+
+Ordnernamen, Befehlssyntax und ``pack_format`` folgen alle aus der
+Pack-Version. Kits einer anderen Datenversion werden auf die Pack-Version
+migriert (core/migration.py); verlustfreie Änderungen wie Umbenennungen werden
+übernommen, Kits, die dabei Items, Verzauberungen oder Stufen verlieren
+würden, werden abgelehnt. Ressourcennamen werden vor dem Verteilen im
+Hauptprozess vergeben; kollidiert ein Name, wird das spätere Kit abgelehnt.
+
+Die Kits werden parallel in Worker-Prozessen gerendert. Jeder Worker schreibt
+eine Datei nur, wenn sich ihr Hash gegenüber dem Manifest des letzten Exports
+geändert hat; Dateien gelöschter Kits werden entfernt. Ein erneuter Export
+einer unveränderten Bibliothek schreibt also nichts außer dem Manifest. Schlägt
+ein Kit fehl, bleiben seine Dateien aus dem letzten Export erhalten.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .catalog import DEFAULT_VERSION, get_registry, version_key
+from .exporters import generate_give_commands, give_syntax
+from .kit_files import kit_from_dict, kit_to_dict, kit_to_export_data, load_kit_file, validate_kit
+from .migration import RENAMED_ENCHANTMENT, RENAMED_ITEM, KitMigrator
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".mkc-manifest.json"
+DEFAULT_NAMESPACE = "kits"
+
+# Datapack-Format je Spielversion (erste Version mit diesem Format)
+PACK_FORMATS = [
+    ((1, 16), 6),
+    ((1, 17), 7),
+    ((1, 18), 8),
+    ((1, 18, 2), 9),
+    ((1, 19), 10),
+    ((1, 19, 4), 12),
+    ((1, 20), 15),
+    ((1, 20, 2), 18),
+    ((1, 20, 3), 26),
+    ((1, 20, 5), 41),
+    ((1, 21), 48),
+]
+
+
+def _version_tuple(version: str) -> tuple:
+    try:
+        return tuple(int(p) for p in str(version).split("."))
+    except ValueError:
+        return PACK_FORMATS[-1][0]
+
+
+def pack_format(version: str) -> int:
+    """Datapack-Format einer Spielversion; ältere Versionen als die Tabelle -> ValueError"""
+    parts = _version_tuple(version)
+    if parts < PACK_FORMATS[0][0]:
+        oldest = ".".join(map(str, PACK_FORMATS[0][0]))
+        raise ValueError(f"No datapack format known for version {version} (oldest: {oldest})")
+    value = PACK_FORMATS[0][1]
+    for first, fmt in PACK_FORMATS:
+        if parts >= first:
+            value = fmt
+    return value
+
+
+def resource_name(name: str) -> str:
+    """Kitname -> gültiger Ressourcenpfad ([a-z0-9_.-])"""
+    return re.sub(r"[^a-z0-9_.-]", "_", name.lower()) or "kit"
+
+
+def data_version(version: str) -> str:
+    """Neueste Datenversion (data/<version>), die nicht neuer als die Spielversion ist"""
+    versions = get_registry().versions()
+    if version in versions:
+        return version
+    older = [v for v in versions if version_key(v) <= version_key(version)]
+    return older[-1] if older else (versions[0] if versions else DEFAULT_VERSION)
+
+
+def _folders(version: str):
+    if _version_tuple(version) >= (1, 21):
+        return "function", "loot_table"
+    return "functions", "loot_tables"
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def loot_table(items: List[dict]) -> dict:
+    """Loot-Tabelle, die jedes Item des Kits genau einmal liefert"""
+    pools = []
+    for item in items:
+        functions = [{"function": "minecraft:set_count", "count": item.get("count", 1)}]
+        if item.get("enchantments"):
+            functions.append({
+                "function": "minecraft:set_enchantments",
+                "enchantments": {e["id"]: e.get("level", 1) for e in item["enchantments"]},
+            })
+        if item.get("name"):
+            functions.append({"function": "minecraft:set_name", "name": {"text": item["name"]}})
+        pools.append({
+            "rolls": 1,
+            "entries": [{"type": "minecraft:item", "name": item["id"], "functions": functions}],
+        })
+    return {"type": "minecraft:generic", "pools": pools}
+
+
+def render_kit(path, namespace: str, loot_tables: bool, version: str = DEFAULT_VERSION,
+               name: str = None, migrators: Dict[str, KitMigrator] = None) -> tuple:
+    """Kit-Datei -> ({relativer Pfad: Inhalt}, fehler); Ordner und Syntax der Pack-Version"""
+    kit = load_kit_file(path)
+    target = data_version(version)
+    if kit.version != target:
+        migrators = migrators if migrators is not None else {}
+        migrator = migrators.get(kit.version)
+        if migrator is None:
+            migrator = migrators[kit.version] = KitMigrator(kit.version, target)
+        definition, changes = migrator.migrate(kit_to_dict(kit))
+        lossy = [c for c in changes if c.change not in (RENAMED_ITEM, RENAMED_ENCHANTMENT)]
+        if lossy:
+            return {}, [f"kit is for {kit.version}, not {version}; run 'migrate --to {target}' first "
+                        f"(slot {c.slot}: {c.change} {c.before})" for c in lossy]
+        kit = kit_from_dict(definition)
+    errors = validate_kit(kit)
+    if errors:
+        return {}, errors
+
+    name = name or resource_name(kit.name)
+    function_dir, loot_dir = _folders(version)
+    items = kit_to_export_data(kit)
+    # Funktionen haben keine Befehlslängen-Grenze: ein Befehl pro Kit
+    commands = generate_give_commands(items, kit.name, give_syntax(version), target="@s",
+                                      max_length=1 << 62)
+    files = {
+        f"data/{namespace}/{function_dir}/kits/{name}.mcfunction":
+            "".join(command.lstrip("/") + "\n" for command in commands),
+    }
+    if loot_tables:
+        files[f"data/{namespace}/{loot_dir}/kits/{name}.json"] = \
+            json.dumps(loot_table(items), ensure_ascii=False, indent=2) + "\n"
+    return files, []
+
+
+def _write_if_changed(out_dir: Path, rel_path: str, text: str, previous: Dict[str, str]) -> tuple:
+    """Schreibt die Datei nur bei geändertem Hash; liefert (hash, geschrieben)"""
+    digest = _sha256(text)
+    target = out_dir / rel_path
+    if previous.get(rel_path) == digest and target.exists():
+        return digest, False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(text, encoding="utf-8")
+    return digest, True
+
+
+def _kit_key(path) -> str:
+    """Kit-Datei als Schlüssel im Manifest (unabhängig vom Arbeitsverzeichnis)"""
+    return str(Path(path).resolve())
+
+
+def _export_chunk(kits: List[Tuple[str, str]], out_dir: str, namespace: str, loot_tables: bool,
+                  version: str, previous: Dict[str, str]) -> tuple:
+    """Worker: Kits (pfad, ressourcenname) rendern, geänderte Dateien schreiben;
+    liefert (hashes, geschrieben, fehler, {kit: [pfade]})"""
+    hashes, written, errors, owned = {}, [], {}, {}
+    migrators: Dict[str, KitMigrator] = {}
+    for path, name in kits:
+        try:
+            files, kit_errors = render_kit(path, namespace, loot_tables, version, name, migrators)
+        except Exception as e:
+            files, kit_errors = {}, [f"{type(e).__name__}: {e}"]
+        if kit_errors:
+            errors[path] = kit_errors
+            continue
+        for rel_path, text in files.items():
+            hashes[rel_path], changed = _write_if_changed(Path(out_dir), rel_path, text, previous)
+            if changed:
+                written.append(rel_path)
+        owned[_kit_key(path)] = sorted(files)
+    return hashes, written, errors, owned
+
+
+@dataclass
+class DatapackResult:
+    written: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    failed: Dict[str, List[str]] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        return (f"{len(self.written)} written, {len(self.unchanged)} unchanged, "
+                f"{len(self.removed)} removed, {len(self.failed)} kit(s) failed")
+
+
+def assign_names(paths: List[str]) -> Tuple[List[Tuple[str, str]], Dict[str, List[str]]]:
+    """Ressourcennamen vor dem Rendern vergeben: ([(pfad, name)], {pfad: fehler});
+    bei Kollisionen gewinnt die erste Datei"""
+    kits, errors, owners = [], {}, {}
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                name = resource_name(str(json.load(f).get("name", Path(path).stem)))
+        except Exception as e:
+            errors[path] = [f"{type(e).__name__}: {e}"]
+            continue
+        if name in owners:
+            errors[path] = [f"kit name {name!r} collides with {owners[name]}"]
+            continue
+        owners[name] = path
+        kits.append((path, name))
+    return kits, errors
+
+
+def export_datapack(paths, out_dir, namespace: str = DEFAULT_NAMESPACE, version: str = DEFAULT_VERSION,
+                    loot_tables: bool = False, jobs: Optional[int] = None,
+                    description: str = "Kits") -> DatapackResult:
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        manifest = {}
+    if isinstance(manifest.get("files"), dict):
+        previous, previous_kits = manifest["files"], manifest.get("kits", {})
+    else:
+        # Altes Manifest {pfad: sha256} ohne Zuordnung zu den Kits
+        previous, previous_kits = manifest, {}
+
+    result = DatapackResult()
+    mcmeta = json.dumps({"pack": {"pack_format": pack_format(version), "description": description}},
+                        indent=2) + "\n"
+    digest, changed = _write_if_changed(out_dir, "pack.mcmeta", mcmeta, previous)
+    hashes = {"pack.mcmeta": digest}
+    if changed:
+        result.written.append("pack.mcmeta")
+
+    kits, result.failed = assign_names([str(p) for p in paths])
+    workers = jobs or os.cpu_count() or 1
+    if workers == 1 or len(kits) < 2 * workers:
+        parts = [_export_chunk(kits, str(out_dir), namespace, loot_tables, version, previous)]
+    else:
+        size = -(-len(kits) // (workers * 4))
+        chunks = [kits[i:i + size] for i in range(0, len(kits), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_export_chunk, chunks, [str(out_dir)] * len(chunks),
+                                  [namespace] * len(chunks), [loot_tables] * len(chunks),
+                                  [version] * len(chunks), [previous] * len(chunks)))
+
+    owned = {}
+    for part_hashes, part_written, part_errors, part_owned in parts:
+        hashes.update(part_hashes)
+        result.written.extend(part_written)
+        result.failed.update(part_errors)
+        owned.update(part_owned)
+    written = set(result.written)
+    result.unchanged = sorted(p for p in hashes if p not in written)
+
+    # Fehlgeschlagene Kits behalten ihre Dateien aus dem letzten Export
+    for path in result.failed:
+        key = _kit_key(path)
+        kept = [p for p in previous_kits.get(key, []) if p in previous and p not in hashes]
+        for rel_path in kept:
+            hashes[rel_path] = previous[rel_path]
+        if kept:
+            owned[key] = kept
+
+    # Dateien von Kits, die es nicht mehr gibt (oder die jetzt anders heißen)
+    for rel_path in previous:
+        if rel_path not in hashes:
+            try:
+                (out_dir / rel_path).unlink()
+                result.removed.append(rel_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.error(f"Could not remove stale datapack file {rel_path}: {e}")
+
+    # Manifest atomar ersetzen, damit ein Abbruch keinen halben Index hinterlässt
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, prefix=MANIFEST_NAME, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"files": hashes, "kits": owned}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+    return result
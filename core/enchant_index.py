@@ -0,0 +1,87 @@
+"""
+Vorberechnete Verzauberungs-Tabellen als Bitsets.
+
+Jede Verzauberung erhält beim Laden des Katalogs einen festen Index. Daraus
+entstehen:
+
+* ``conflicts[i]``: Bitset aller Verzauberungen, die mit ``i`` kollidieren
+  (symmetrisch ergänzt, auch wenn enchantments.json nur eine Richtung nennt)
+* ``by_category[kategorie]``: Bitset der auf diese Item-Kategorie anwendbaren
+  Verzauberungen (aus ``item_categories``); die Anwendbarkeit je Item (mit den
+  ID-Mustern aus ``items``) berechnet der Katalog (``applicable_masks``)
+
+Ein Satz Verzauberungen ist damit eine Ganzzahl; Konflikt- und
+Anwendbarkeitsprüfungen sind wenige Bit-Operationen.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+from .models import Enchantment
+
+
+def iter_bits(mask: int):
+    """Indizes der gesetzten Bits, aufsteigend"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class EnchantmentIndex:
+    def __init__(self, enchantments: List[Enchantment]):
+        self.enchantments = list(enchantments)
+        self.ids = [e.id for e in self.enchantments]
+        self.index: Dict[str, int] = {enchant_id: i for i, enchant_id in enumerate(self.ids)}
+        self.max_levels = [e.max_level for e in self.enchantments]
+        self.conflicts: List[int] = [0] * len(self.ids)
+        self.by_category: Dict[str, int] = {}
+
+        for i, enchantment in enumerate(self.enchantments):
+            for other in enchantment.conflicts:
+                j = self.index.get(other)
+                if j is not None and j != i:
+                    self.conflicts[i] |= 1 << j
+                    self.conflicts[j] |= 1 << i
+            for category in enchantment.item_categories:
+                self.by_category[category] = self.by_category.get(category, 0) | (1 << i)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def mask(self, enchant_ids: Iterable[str]) -> int:
+        """Bitset aus IDs; unbekannte IDs werden ignoriert"""
+        mask = 0
+        for enchant_id in enchant_ids:
+            i = self.index.get(enchant_id)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def ids_of(self, mask: int) -> List[str]:
+        return [self.ids[i] for i in iter_bits(mask)]
+
+    def has_conflict(self, mask: int) -> bool:
+        return any(self.conflicts[i] & mask for i in iter_bits(mask))
+
+    def conflicting_pairs(self, mask: int) -> List[Tuple[int, int]]:
+        """Jedes kollidierende Paar (i, j) mit i < j genau einmal"""
+        pairs = []
+        for i in iter_bits(mask):
+            # Nur Partner oberhalb von i, damit kein Paar doppelt auftaucht
+            for j in iter_bits(self.conflicts[i] & mask & ~((2 << i) - 1)):
+                pairs.append((i, j))
+        return pairs
+
+    def applicable_mask(self, category: str) -> int:
+        return self.by_category.get(category, 0)
+
+    def is_applicable(self, category: str, enchant_id: str) -> bool:
+        i = self.index.get(enchant_id)
+        return i is not None and bool(self.by_category.get(category, 0) >> i & 1)
+
+    def compatible_with(self, mask: int) -> int:
+        """Bitset aller Verzauberungen, die mit keiner aus ``mask`` kollidieren"""
+        blocked = 0
+        for i in iter_bits(mask):
+            blocked |= self.conflicts[i]
+        return ~blocked & ((1 << len(self.ids)) - 1)
@@ -1,11 +1,381 @@
-def generate_give_command(kit_slots) -> str:
-    """Erzeugt /give-Befehl aus Kit-Daten"""
-    command = "/give @p minecraft:player_head{display:{Name:'[Kit]'},"
+import gzip
+import json
+import logging
+import struct
+from typing import Dict, Iterable, List
 
+logger = logging.getLogger(__name__)
+
+# NBT-Tag-Typen
+TAG_END = 0
+TAG_SHORT = 2
+TAG_INT = 3
+TAG_STRING = 8
+TAG_LIST = 9
+TAG_COMPOUND = 10
+
+_SHORT = struct.Struct(">h")
+_INT = struct.Struct(">i")
+_USHORT = struct.Struct(">H")
+
+
+# --- /give-Befehle -------------------------------------------------------------
+#
+# Zwei Syntaxen: klassisches NBT (bis 1.20.4, BlockEntityTag) und
+# Item-Komponenten (ab 1.20.5, minecraft:container). Jedes Item wird genau
+# einmal zu einem Fragment formatiert (Cache nach Inhalt, ohne Slot); der
+# Befehl entsteht aus einem einzigen join. Überschreitet ein Kit
+# MAX_COMMAND_LENGTH, wird es auf mehrere Shulker-Kisten verteilt.
+
+LEGACY = "legacy"
+COMPONENTS = "components"
+MAX_COMMAND_LENGTH = 32767      # Grenze für Befehlsblöcke
+_FRAGMENT_CACHE_LIMIT = 1 << 18
+
+# {(syntax, id, count, name, enchantments): Fragment ohne Slot} und
+# {(syntax, enchantments): Verzauberungs-Teil}
+_give_fragments: Dict[tuple, str] = {}
+
+
+def give_syntax(version: str) -> str:
+    """Befehlssyntax einer Spielversion ("1.20" -> legacy, "1.20.5" -> components)"""
+    try:
+        parts = tuple(int(p) for p in str(version).split("."))
+    except ValueError:
+        return COMPONENTS
+    return COMPONENTS if parts >= (1, 20, 5) else LEGACY
+
+
+def _snbt_text(text: str) -> str:
+    """Text-Komponente (JSON) als SNBT-String in einfachen Anführungszeichen"""
+    raw = json.dumps(text, ensure_ascii=False)
+    return "'" + raw.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _give_enchantments(syntax: str, enchantments: tuple) -> str:
+    key = (syntax, enchantments)
+    part = _give_fragments.get(key)
+    if part is None:
+        if syntax == LEGACY:
+            part = "Enchantments:[" + ",".join(f'{{id:"{e}",lvl:{lvl}s}}' for e, lvl in enchantments) + "]"
+        else:
+            # Komponenten-Schlüssel sind eindeutig: doppelte IDs zusammenfassen, letzte Stufe gilt
+            levels = ",".join(f'"{e}":{lvl}' for e, lvl in dict(enchantments).items())
+            part = f'"minecraft:enchantments":{{levels:{{{levels}}}}}'
+        _give_fragments[key] = part
+    return part
+
+
+def _give_fragment(syntax: str, item: dict) -> str:
+    enchantments = item.get("enchantments")
+    if enchantments:
+        enchantments = tuple([(e["id"], e.get("level", 1)) for e in enchantments])
+    key = (syntax, item["id"], item.get("count", 1), item.get("name"), enchantments)
+    fragment = _give_fragments.get(key)
+    if fragment is not None:
+        return fragment
+
+    item_id, count, name = key[1], key[2], key[3]
+    if syntax == LEGACY:
+        tag = []
+        if name:
+            tag.append(f"display:{{Name:{_snbt_text(name)}}}")
+        if enchantments:
+            tag.append(_give_enchantments(syntax, enchantments))
+        fragment = f'id:"{item_id}",Count:{count}b' + (",tag:{" + ",".join(tag) + "}" if tag else "") + "}"
+    else:
+        components = []
+        if name:
+            components.append(f'"minecraft:custom_name":{_snbt_text(name)}')
+        if enchantments:
+            components.append(_give_enchantments(syntax, enchantments))
+        fragment = (f'item:{{id:"{item_id}",count:{count}'
+                    + (",components:{" + ",".join(components) + "}" if components else "") + "}}")
+
+    if len(_give_fragments) >= _FRAGMENT_CACHE_LIMIT:
+        _give_fragments.clear()
+    _give_fragments[key] = fragment
+    return fragment
+
+
+def _give_frame(syntax: str, kit_name: str, target: str):
+    """(Präfix, Suffix) des Befehls um die Item-Liste"""
+    if syntax == LEGACY:
+        return (f"/give {target} minecraft:shulker_box{{BlockEntityTag:{{Items:[",
+                f"]}},display:{{Name:{_snbt_text(f'[Kit] {kit_name}')}}}}} 1")
+    return (f"/give {target} minecraft:shulker_box[minecraft:container=[",
+            f"],minecraft:custom_name={_snbt_text(f'[Kit] {kit_name}')}] 1")
+
+
+def generate_give_commands(items: Iterable[dict], kit_name: str = "Kit", syntax: str = LEGACY,
+                           target: str = "@p", max_length: int = MAX_COMMAND_LENGTH) -> List[str]:
+    """
+    /give-Befehle für Export-Daten (siehe get_export_data).
+
+    Passt das Kit nicht in max_length Zeichen, wird es auf mehrere Kisten
+    ("[Kit] name 1/2", ...) verteilt. Ein einzelnes Item, das allein zu lang
+    ist, bleibt in einem überlangen Befehl; solche Befehle nur über eine
+    Funktionsdatei nutzen (siehe commands_fit / write_give_function).
+    """
+    slot_key = "Slot" if syntax == LEGACY else "slot"
+    slot_suffix = "b" if syntax == LEGACY else ""
+    fragments = [f"{{{slot_key}:{item['slot']}{slot_suffix},{_give_fragment(syntax, item)}"
+                 for item in items]
+
+    prefix, suffix = _give_frame(syntax, kit_name, target)
+    if len(prefix) + len(suffix) + sum(map(len, fragments)) + len(fragments) - 1 <= max_length:
+        return [prefix + ",".join(fragments) + suffix]
+
+    # Aufteilen; Platz für den längsten Zusatz " n/n" im Kistennamen reservieren
+    reserve = 2 * len(str(len(fragments))) + 2
+    budget = max_length - len(prefix) - len(suffix) - reserve
+    groups, current, used = [], [], 0
+    for fragment in fragments:
+        extra = len(fragment) + (1 if current else 0)
+        if current and used + extra > budget:
+            groups.append(current)
+            current, used = [], 0
+            extra = len(fragment)
+        current.append(fragment)
+        used += extra
+    groups.append(current)
+
+    commands = []
+    for number, group in enumerate(groups, 1):
+        prefix, suffix = _give_frame(syntax, f"{kit_name} {number}/{len(groups)}", target)
+        commands.append(prefix + ",".join(group) + suffix)
+    return commands
+
+
+def commands_fit(commands: List[str], max_length: int = MAX_COMMAND_LENGTH) -> bool:
+    return all(len(command) <= max_length for command in commands)
+
+
+def write_give_function(commands: List[str], path):
+    """Befehle als .mcfunction (ohne führenden Slash, keine Längengrenze)"""
+    with open(path, "w", encoding="utf-8") as f:
+        for command in commands:
+            f.write(command.lstrip("/") + "\n")
+
+
+def generate_give_command(kit_slots, kit_name: str = "Kit", syntax: str = LEGACY) -> str:
+    """Erzeugt /give-Befehl(e) aus KitSlots; mehrere Befehle zeilenweise"""
     items = []
     for slot in kit_slots:
-        item = slot.item.id
-        enchants = ",".join([f"{{id:{e.id},lvl:{e.level}}}" for e in slot.enchantments])
-        items.append(f"{{Slot:{slot.slot_id},id:{item},Enchantments:[{enchants}]}}")
-    
-    return command + "Items:[" + ",".join(items) + "]}"
\ No newline at end of file
+        entry = {"slot": slot.slot_id, "id": slot.item.id, "count": slot.count}
+        if slot.display_name:
+            entry["name"] = slot.display_name
+        if slot.enchantments:
+            entry["enchantments"] = [{"id": e.id, "level": e.level} for e in slot.enchantments]
+        items.append(entry)
+    return "\n".join(generate_give_commands(items, kit_name, syntax))
+
+
+def create_nbt_structure(items, syntax: str = LEGACY):
+    """Baut die nbtlib-Liste ``Items`` aus Export-Daten (siehe get_export_data).
+
+    ``syntax``: LEGACY (``Count`` + ``tag.Enchantments``) oder COMPONENTS
+    (ab 1.20.5: ``count`` + ``components``, siehe give_syntax).
+    """
+    from nbtlib.tag import Compound, List, Int, Short, String
+
+    nbt_items = []
+    for item in items:
+        try:
+            if syntax != LEGACY:
+                nbt_items.append(_component_compound(item))
+                continue
+            item_compound = Compound({
+                'Slot': Int(item['slot']),
+                'id': String(item['id']),
+                'Count': Int(item.get('count', 1))
+            })
+
+            # tag nur hinzufügen, wenn Name oder Verzauberungen vorhanden
+            tag = Compound()
+            if 'name' in item:
+                tag['display'] = Compound({
+                    'Name': String(item['name'])
+                })
+            if item.get('enchantments'):
+                tag['Enchantments'] = List[Compound]([
+                    Compound({'id': String(ench['id']), 'lvl': Short(ench.get('level', 1))})
+                    for ench in item['enchantments']
+                ])
+            if tag:
+                item_compound['tag'] = tag
+
+            nbt_items.append(item_compound)
+        except Exception as e:
+            logger.error(f"Error creating NBT for item {item}: {e}")
+
+    return List(nbt_items)
+
+
+def _component_compound(item):
+    from nbtlib.tag import Compound, Int, String
+
+    item_compound = Compound({
+        'Slot': Int(item['slot']),
+        'id': String(item['id']),
+        'count': Int(item.get('count', 1))
+    })
+    components = Compound()
+    if 'name' in item:
+        components['minecraft:custom_name'] = String(json.dumps(item['name'], ensure_ascii=False))
+    if item.get('enchantments'):
+        components['minecraft:enchantments'] = Compound({'levels': Compound({
+            ench['id']: Int(ench.get('level', 1)) for ench in item['enchantments']
+        })})
+    if components:
+        item_compound['components'] = components
+    return item_compound
+
+
+def save_nbt_file(nbt_data, path):
+    """Schreibt die Shulker-Items als .nbt-Datei"""
+    import nbtlib
+
+    nbtlib.File({'Items': nbt_data}).save(path)
+
+
+# --- Schneller NBT-Writer ----------------------------------------------------
+#
+# Erzeugt dieselben Bytes wie create_nbt_structure + save_nbt_file, aber ohne
+# nbtlib-Objektbaum: Tag-Köpfe und Item-IDs liegen als fertige Byte-Fragmente
+# vor, Zahlen werden mit vorkompilierten struct-Formaten gepackt.
+
+def _nbt_string(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return _USHORT.pack(len(data)) + data
+
+
+def _tag_head(tag_type: int, name: str) -> bytes:
+    return bytes((tag_type,)) + _nbt_string(name)
+
+
+_HEAD_ROOT = _tag_head(TAG_COMPOUND, "")
+_HEAD_ITEMS = _tag_head(TAG_LIST, "Items")
+_HEAD_SLOT = _tag_head(TAG_INT, "Slot")
+_HEAD_ID = _tag_head(TAG_STRING, "id")
+_HEAD_COUNT = _tag_head(TAG_INT, "Count")
+_HEAD_TAG = _tag_head(TAG_COMPOUND, "tag")
+_HEAD_DISPLAY = _tag_head(TAG_COMPOUND, "display")
+_HEAD_NAME = _tag_head(TAG_STRING, "Name")
+_HEAD_ENCHANTMENTS = _tag_head(TAG_LIST, "Enchantments")
+_HEAD_LVL = _tag_head(TAG_SHORT, "lvl")
+_HEAD_COUNT_COMPONENTS = _tag_head(TAG_INT, "count")
+_HEAD_COMPONENTS = _tag_head(TAG_COMPOUND, "components")
+_HEAD_CUSTOM_NAME = _tag_head(TAG_STRING, "minecraft:custom_name")
+_HEAD_ENCHANTMENT_LEVELS = _tag_head(TAG_COMPOUND, "minecraft:enchantments") + _tag_head(TAG_COMPOUND, "levels")
+_END = bytes((TAG_END,))
+
+# {id: _HEAD_ID + String-Payload}; für Item- und Verzauberungs-IDs gleich
+_id_fragments: Dict[str, bytes] = {}
+
+
+def _id_fragment(value: str) -> bytes:
+    fragment = _id_fragments.get(value)
+    if fragment is None:
+        fragment = _id_fragments[value] = _HEAD_ID + _nbt_string(value)
+    return fragment
+
+
+def _item_bytes(item: dict) -> bytes:
+    out = bytearray(_HEAD_SLOT)
+    out += _INT.pack(item['slot'])
+    out += _id_fragment(item['id'])
+    out += _HEAD_COUNT
+    out += _INT.pack(item.get('count', 1))
+
+    enchantments = item.get('enchantments')
+    if 'name' in item or enchantments:
+        out += _HEAD_TAG
+        if 'name' in item:
+            out += _HEAD_DISPLAY
+            out += _HEAD_NAME
+            out += _nbt_string(item['name'])
+            out += _END
+        if enchantments:
+            out += _HEAD_ENCHANTMENTS
+            out.append(TAG_COMPOUND)
+            out += _INT.pack(len(enchantments))
+            for ench in enchantments:
+                out += _id_fragment(ench['id'])
+                out += _HEAD_LVL
+                out += _SHORT.pack(ench.get('level', 1))
+                out += _END
+        out += _END
+    out += _END
+    return bytes(out)
+
+
+def _component_item_bytes(item: dict) -> bytes:
+    out = bytearray(_HEAD_SLOT)
+    out += _INT.pack(item['slot'])
+    out += _id_fragment(item['id'])
+    out += _HEAD_COUNT_COMPONENTS
+    out += _INT.pack(item.get('count', 1))
+
+    enchantments = item.get('enchantments')
+    if 'name' in item or enchantments:
+        out += _HEAD_COMPONENTS
+        if 'name' in item:
+            out += _HEAD_CUSTOM_NAME
+            out += _nbt_string(json.dumps(item['name'], ensure_ascii=False))
+        if enchantments:
+            out += _HEAD_ENCHANTMENT_LEVELS
+            # Doppelte IDs wie in create_nbt_structure: ein Schlüssel, letzte Stufe gilt
+            levels = {}
+            for ench in enchantments:
+                levels[ench['id']] = ench.get('level', 1)
+            for enchant_id, level in levels.items():
+                out += _tag_head(TAG_INT, enchant_id)
+                out += _INT.pack(level)
+            out += _END
+            out += _END
+        out += _END
+    out += _END
+    return bytes(out)
+
+
+def serialize_items_nbt(items: Iterable[dict], syntax: str = LEGACY) -> bytes:
+    """Shulker-``Items`` als unkomprimierte NBT-Datei (identisch zu save_nbt_file)"""
+    item_bytes = _item_bytes if syntax == LEGACY else _component_item_bytes
+    payloads = []
+    for item in items:
+        try:
+            payloads.append(item_bytes(item))
+        except Exception as e:
+            logger.error(f"Error creating NBT for item {item}: {e}")
+
+    # Puffer einmal in Endgröße anlegen: Kopf, Listentyp + Länge, Items, TAG_End
+    header = _HEAD_ROOT + _HEAD_ITEMS
+    out = bytearray(len(header) + 5 + sum(map(len, payloads)) + 1)
+    out[:len(header)] = header
+    pos = len(header)
+    # Leere Liste: Elementtyp TAG_End wie bei nbtlib
+    out[pos] = TAG_COMPOUND if payloads else TAG_END
+    _INT.pack_into(out, pos + 1, len(payloads))
+    pos += 5
+    for payload in payloads:
+        out[pos:pos + len(payload)] = payload
+        pos += len(payload)
+    return bytes(out)
+
+
+def write_items_nbt(items: Iterable[dict], fileobj, gzipped: bool = False, syntax: str = LEGACY):
+    """Schreibt die Items in ein Datei-Objekt, optional gzip-gestreamt"""
+    data = serialize_items_nbt(items, syntax)
+    if gzipped:
+        # mtime=0 für reproduzierbare Ausgabe
+        with gzip.GzipFile(fileobj=fileobj, mode="wb", mtime=0) as gz:
+            gz.write(data)
+    else:
+        fileobj.write(data)
+
+
+def save_items_nbt(items: Iterable[dict], path, gzipped: bool = False, syntax: str = LEGACY):
+    """Schneller Ersatz für save_nbt_file(create_nbt_structure(items, syntax), path)"""
+    with open(path, "wb") as f:
+        write_items_nbt(items, f, gzipped, syntax)
\ No newline at end of file
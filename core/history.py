@@ -0,0 +1,138 @@
+"""
+Undo/Redo als kompakte Delta-Datensätze.
+
+Ein Befehl speichert pro betroffenem Slot nur ``(vorher, nachher)`` - zwei
+Referenzen auf unveränderliche Item-Handles (im GUI das Item-Dict des Slots,
+im KitManager der KitSlot), keine Kopie des Kits. Änderungen an einem Item
+(z. B. Verzauberungen) erzeugen ein neues Handle, das alte bleibt für Undo
+unverändert.
+
+* ``record`` ist O(1), unabhängig von der Kit-Größe
+* ``group()`` fasst zusammengehörige Schritte zu einem Befehl zusammen
+  (Drag: Ziel setzen + Quelle leeren, Preset, Leeren des Grids)
+* Gleicher ``merge_key`` innerhalb von ``coalesce_window`` Sekunden wird mit
+  dem vorigen Befehl verschmolzen (schnelle Folge-Edits am selben Slot)
+* ``max_changes`` begrenzt die Zahl gespeicherter Slot-Änderungen; die
+  ältesten Befehle fallen zuerst heraus
+"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_MAX_CHANGES = 5000
+DEFAULT_COALESCE_WINDOW = 0.5
+
+
+class EditCommand:
+    __slots__ = ("label", "changes", "merge_key", "timestamp")
+
+    def __init__(self, label: str, merge_key=None):
+        self.label = label
+        self.changes: Dict[int, Tuple[Any, Any]] = {}   # {slot_id: (vorher, nachher)}
+        self.merge_key = merge_key
+        self.timestamp = time.monotonic()
+
+    def add(self, slot_id: int, before, after):
+        previous = self.changes.get(slot_id)
+        # Beim Verschmelzen bleibt der erste Vorher-Zustand erhalten
+        self.changes[slot_id] = (previous[0] if previous else before, after)
+
+    def __len__(self):
+        return len(self.changes)
+
+
+class UndoHistory:
+    def __init__(self, apply: Callable[[int, Any], None], max_changes: int = DEFAULT_MAX_CHANGES,
+                 coalesce_window: float = DEFAULT_COALESCE_WINDOW):
+        self.apply = apply              # apply(slot_id, handle_oder_None)
+        self.max_changes = max_changes
+        self.coalesce_window = coalesce_window
+        self.undo_stack = deque()
+        self.redo_stack = []
+        self.change_count = 0           # Slot-Änderungen im Undo-Stack
+        self._group: Optional[EditCommand] = None
+        self._replaying = False
+
+    def record(self, slot_id: int, before, after, label: str = "Edit", merge_key=None):
+        """Merkt sich eine bereits ausgeführte Slot-Änderung"""
+        if self._replaying or before is after:
+            return
+        if self._group is not None:
+            self._group.add(slot_id, before, after)
+            return
+
+        last = self.undo_stack[-1] if self.undo_stack else None
+        now = time.monotonic()
+        if (merge_key is not None and last is not None and last.merge_key == merge_key
+                and now - last.timestamp <= self.coalesce_window and not self.redo_stack):
+            self.change_count -= len(last)
+            last.add(slot_id, before, after)
+            last.timestamp = now
+            self.change_count += len(last)
+            return
+
+        command = EditCommand(label, merge_key)
+        command.add(slot_id, before, after)
+        self._push(command)
+
+    @contextmanager
+    def group(self, label: str):
+        """Alle Änderungen im Block werden ein Befehl (verschachtelbar)"""
+        outer = self._group is None
+        if outer:
+            self._group = EditCommand(label)
+        try:
+            yield
+        finally:
+            if outer:
+                command, self._group = self._group, None
+                if command.changes:
+                    self._push(command)
+
+    def _push(self, command: EditCommand):
+        self.redo_stack.clear()
+        self.undo_stack.append(command)
+        self.change_count += len(command)
+        while self.change_count > self.max_changes and len(self.undo_stack) > 1:
+            self.change_count -= len(self.undo_stack.popleft())
+
+    def _replay(self, command: EditCommand, undo: bool):
+        self._replaying = True
+        try:
+            items = reversed(command.changes.items()) if undo else command.changes.items()
+            for slot_id, (before, after) in items:
+                self.apply(slot_id, before if undo else after)
+        finally:
+            self._replaying = False
+
+    def can_undo(self) -> bool:
+        return bool(self.undo_stack)
+
+    def can_redo(self) -> bool:
+        return bool(self.redo_stack)
+
+    def undo(self) -> Optional[str]:
+        """Macht den letzten Befehl rückgängig; liefert dessen Bezeichnung"""
+        if not self.undo_stack:
+            return None
+        command = self.undo_stack.pop()
+        self.change_count -= len(command)
+        self._replay(command, undo=True)
+        self.redo_stack.append(command)
+        return command.label
+
+    def redo(self) -> Optional[str]:
+        if not self.redo_stack:
+            return None
+        command = self.redo_stack.pop()
+        self._replay(command, undo=False)
+        self.undo_stack.append(command)
+        self.change_count += len(command)
+        return command.label
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.change_count = 0
@@ -0,0 +1,257 @@
+"""
+Icon-Synchronisation (ersetzt ``download_minecraft_icons`` aus main.py).
+
+Die Liste der benötigten Icons stammt aus dem Katalog. Quellen können eine
+HTTP-Basis-URL (Standard: Minecraft-Wiki) oder ein lokales Spiegelverzeichnis
+(Pfad oder ``file://``-URL) sein. HTTP-Downloads laufen parallel über eine
+gemeinsame ``requests.Session`` mit Timeouts, Retry/Backoff und bedingten
+Anfragen (ETag / If-Modified-Since). Ein Manifest mit SHA-256-Hashes im
+Icon-Ordner sorgt dafür, dass ein erneuter Lauf nichts tut.
+
+Verwendung:
+    python -m core.cli icons sync [--base-url URL|PFAD] [--icons icons/] [--refresh]
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import quote, unquote, urlparse
+
+from .catalog import ItemCatalog, get_registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://minecraft.fandom.com/wiki/Special:FilePath/"
+MANIFEST_NAME = ".manifest.json"
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT = (5, 20)   # (connect, read) in Sekunden
+DEFAULT_RETRIES = 3
+
+
+@dataclass
+class SyncResult:
+    downloaded: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        return (f"{len(self.downloaded)} downloaded, {len(self.unchanged)} unchanged, "
+                f"{len(self.failed)} failed")
+
+
+def wiki_file_name(icon_name: str) -> str:
+    """diamond_sword.png -> Diamond Sword.png (Dateinamen im Minecraft-Wiki)"""
+    stem = Path(icon_name).stem
+    return f"{stem.replace('_', ' ').title()}.png"
+
+
+def local_mirror_dir(base_url: str) -> Optional[Path]:
+    """Verzeichnis eines lokalen Spiegels oder None für HTTP-Quellen"""
+    parsed = urlparse(base_url)
+    if parsed.scheme == "file":
+        return Path(unquote(parsed.path))
+    if parsed.scheme in ("http", "https"):
+        return None
+    return Path(base_url)
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_atomic(target: Path, data: bytes):
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=target.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def required_icons(catalog: ItemCatalog = None) -> List[str]:
+    """Alle Icon-Dateinamen, die der Katalog referenziert (ohne Duplikate);
+    ohne Katalog die aller Versionen (Items wie mace gibt es nur in einigen)"""
+    if catalog is None:
+        return get_registry().icons()
+    return sorted({item.icon for item in catalog.items if item.icon})
+
+
+class IconSync:
+    def __init__(self, icon_dir="icons", base_url: str = DEFAULT_BASE_URL,
+                 concurrency: int = DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT,
+                 retries: int = DEFAULT_RETRIES, wiki_names: Optional[bool] = None):
+        self.icon_dir = Path(icon_dir)
+        self.base_url = base_url
+        self.mirror_dir = local_mirror_dir(base_url)
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.retries = retries
+        # Wiki-Schreibweise nur für die Standardquelle, Spiegel nutzen die Icon-Dateinamen
+        self.wiki_names = (base_url == DEFAULT_BASE_URL) if wiki_names is None else wiki_names
+        self.manifest_path = self.icon_dir / MANIFEST_NAME
+        self.manifest = self.load_manifest()
+        self._manifest_lock = threading.Lock()
+        self._manifest_dirty = False
+        self._session = None
+
+    # --- Manifest ---
+
+    def load_manifest(self) -> Dict[str, dict]:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable icon manifest: {e}")
+            return {}
+
+    def save_manifest(self):
+        data = json.dumps(self.manifest, indent=2, sort_keys=True).encode("utf-8")
+        write_atomic(self.manifest_path, data)
+
+    def is_current(self, icon_name: str) -> bool:
+        """Icon liegt vor und entspricht dem Hash im Manifest"""
+        entry = self.manifest.get(icon_name)
+        path = self.icon_dir / icon_name
+        if not entry or not path.exists():
+            return False
+        if entry.get("size") != path.stat().st_size:
+            return False
+        return entry.get("sha256") == sha256_file(path)
+
+    # --- Quellen ---
+
+    def source_name(self, icon_name: str) -> str:
+        return wiki_file_name(icon_name) if self.wiki_names else icon_name
+
+    def session(self):
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retry = Retry(total=self.retries, backoff_factor=0.5,
+                          status_forcelist=(429, 500, 502, 503, 504),
+                          allowed_methods=("GET", "HEAD"))
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency, max_retries=retry)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["User-Agent"] = "MinecraftKitCreator icon sync"
+            self._session = session
+        return self._session
+
+    def fetch(self, icon_name: str, refresh: bool) -> str:
+        """Holt ein Icon; liefert 'downloaded' oder 'unchanged'"""
+        if not refresh and self.is_current(icon_name):
+            return "unchanged"
+
+        target = self.icon_dir / icon_name
+        entry = self.manifest.get(icon_name, {})
+
+        if self.mirror_dir is not None:
+            source = self.mirror_dir / self.source_name(icon_name)
+            stat = source.stat()
+            if target.exists() and entry.get("source_mtime") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+                return "unchanged"
+            data = source.read_bytes()
+            new_entry = {"source_mtime": stat.st_mtime_ns}
+        else:
+            headers = {}
+            if target.exists():
+                if entry.get("etag"):
+                    headers["If-None-Match"] = entry["etag"]
+                if entry.get("last_modified"):
+                    headers["If-Modified-Since"] = entry["last_modified"]
+
+            url = self.base_url + quote(self.source_name(icon_name))
+            response = self.session().get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304:
+                return "unchanged"
+            if response.status_code != 200:
+                raise IOError(f"HTTP {response.status_code}")
+            data = response.content
+            new_entry = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+
+        digest = hashlib.sha256(data).hexdigest()
+        if target.exists() and sha256_file(target) == digest:
+            status = "unchanged"
+        else:
+            write_atomic(target, data)
+            status = "downloaded"
+
+        new_entry.update({"sha256": digest, "size": len(data)})
+        with self._manifest_lock:
+            if self.manifest.get(icon_name) != new_entry:
+                self.manifest[icon_name] = new_entry
+                self._manifest_dirty = True
+        return status
+
+    def sync(self, icon_names: Iterable[str], refresh: bool = False) -> SyncResult:
+        """Synchronisiert alle Icons mit begrenzter Parallelität"""
+        self.icon_dir.mkdir(parents=True, exist_ok=True)
+        result = SyncResult()
+        icon_names = list(icon_names)
+
+        if self.mirror_dir is None:
+            try:
+                import requests  # noqa: F401
+            except ImportError:
+                logger.error("Icon sync over HTTP needs the 'requests' package")
+                result.failed = {name: "requests not installed" for name in icon_names}
+                return result
+            self.session()  # einmal anlegen, bevor die Worker starten
+
+        def task(icon_name):
+            try:
+                return icon_name, self.fetch(icon_name, refresh), None
+            except Exception as e:
+                return icon_name, "failed", str(e)
+
+        workers = 1 if self.mirror_dir is not None else self.concurrency
+        with ThreadPoolExecutor(max_workers=min(workers, max(1, len(icon_names)))) as pool:
+            for icon_name, status, error in pool.map(task, icon_names):
+                if status == "downloaded":
+                    result.downloaded.append(icon_name)
+                    logger.info(f"Downloaded icon {icon_name}")
+                elif status == "unchanged":
+                    result.unchanged.append(icon_name)
+                else:
+                    result.failed[icon_name] = error
+                    logger.warning(f"Failed to fetch icon {icon_name}: {error}")
+
+        if self._manifest_dirty:
+            self.save_manifest()
+            self._manifest_dirty = False
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        logger.info(f"Icon sync: {result.summary()}")
+        return result
+
+
+def sync_icons(catalog: ItemCatalog = None, icon_dir="icons", base_url: str = None,
+               refresh: bool = False, **kwargs) -> SyncResult:
+    """Synchronisiert die Icons des Katalogs, ohne Katalog die aller Versionen;
+    Basis-URL auch über $MKC_ICON_BASE_URL"""
+    base_url = base_url or os.environ.get("MKC_ICON_BASE_URL", DEFAULT_BASE_URL)
+    syncer = IconSync(icon_dir=icon_dir, base_url=base_url, **kwargs)
+    return syncer.sync(required_icons(catalog), refresh=refresh)
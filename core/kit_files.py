@@ -0,0 +1,101 @@
+"""
+Kit-Definitionen als JSON-Dateien.
+
+Format (entspricht ``InventoryGrid.get_export_data``)::
+
+    {
+      "name": "pvp_tier1",
+      "version": "1.20",
+      "slots": [
+        {"slot": 0, "id": "minecraft:diamond_sword", "count": 1,
+         "name": "Diamantschwert",
+         "enchantments": [{"id": "minecraft:sharpness", "level": 5}]}
+      ]
+    }
+"""
+
+import json
+from dataclasses import replace
+from pathlib import Path
+from typing import List
+
+from .catalog import DEFAULT_VERSION, ItemCatalog, get_catalog
+from .models import Kit, KitSlot
+from .placement import PlacementTable
+from .validation import KitValidator, get_validator
+
+
+def kit_from_dict(data: dict, catalog: ItemCatalog = None, name: str = "kit") -> Kit:
+    """Baut ein Kit aus einer Definition; unbekannte IDs lösen ValueError aus"""
+    version = str(data.get("version", DEFAULT_VERSION))
+    catalog = catalog or get_catalog(version)
+
+    slots = []
+    for entry in data.get("slots", []):
+        item = catalog.get(entry.get("id", ""))
+        if item is None:
+            raise ValueError(f"Unknown item id: {entry.get('id')!r}")
+
+        enchantments = []
+        for ench in entry.get("enchantments", []):
+            definition = catalog.get_enchantment(ench.get("id", ""))
+            if definition is None:
+                raise ValueError(f"Unknown enchantment id: {ench.get('id')!r}")
+            enchantments.append(replace(definition, level=int(ench.get("level", 1))))
+
+        display_name = entry.get("name")
+        slots.append(KitSlot(
+            item=item,
+            slot_id=int(entry["slot"]),
+            enchantments=enchantments,
+            count=int(entry.get("count", 1)),
+            display_name=display_name if display_name != item.name else None,
+        ))
+
+    return Kit(name=data.get("name", name), slots=slots, version=version)
+
+
+def kit_to_dict(kit: Kit) -> dict:
+    """Gegenstück zu kit_from_dict"""
+    return {
+        "name": kit.name,
+        "version": kit.version,
+        "slots": kit_to_export_data(kit, item_names=True),
+    }
+
+
+def kit_to_export_data(kit: Kit, item_names: bool = False) -> List[dict]:
+    """Slots im Format von InventoryGrid.get_export_data. ``name`` nur bei eigenem
+    Anzeigenamen (wird in .nbt/Datapacks zum Custom Name); ``item_names`` setzt sonst
+    den Katalognamen ein (lesbare Kit-Definitionen)"""
+    export_data = []
+    for slot in sorted(kit.slots, key=lambda s: s.slot_id):
+        entry = {"slot": slot.slot_id, "id": slot.item.id}
+        if slot.display_name or item_names:
+            entry["name"] = slot.display_name or slot.item.name
+        entry["count"] = slot.count
+        if slot.enchantments:
+            entry["enchantments"] = [{"id": e.id, "level": e.level} for e in slot.enchantments]
+        export_data.append(entry)
+    return export_data
+
+
+def load_kit_file(path) -> Kit:
+    """Lädt eine Kit-Definition; der Dateiname ist der Standard-Kitname"""
+    path = Path(path)
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return kit_from_dict(data, name=path.stem)
+
+
+def save_kit_file(kit: Kit, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(kit_to_dict(kit), f, ensure_ascii=False, indent=2)
+
+
+def validate_kit(kit: Kit, placement: PlacementTable = None) -> List[str]:
+    """Prüft ein Kit mit allen Regeln aus core/validation.py; liefert Fehlermeldungen"""
+    validator = (get_validator(kit.version) if placement is None
+                 else KitValidator(get_catalog(kit.version), placement))
+    report = validator.validate([kit_to_dict(kit)])
+    return [issue.describe() for issue in report.issues]
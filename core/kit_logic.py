@@ -1,23 +1,16 @@
-import json
-from pathlib import Path
+from .catalog import DEFAULT_VERSION, get_catalog
 
-def load_items(version="1.20"):
-    items_dir = Path(f"data/items/{version}")
-    items = []
-    for item_file in items_dir.glob("*.json"):
-        with open(item_file) as f:
-            data = json.load(f)
-            items.append(MinecraftItem(**data))
-    return items
+def load_items(version=DEFAULT_VERSION):
+    return get_catalog(version).items
 
 class KitManager:
     def __init__(self):
         self.items = []
-        self.version = "1.20"
+        self.version = DEFAULT_VERSION
 
     def add_item(self, item_id, slot):
-        item = next((i for i in load_items() if i.id == item_id), None)
-        if item and slot not in [i.slot for i in self.items]:
+        item = get_catalog(self.version).get(item_id)
+        if item and slot not in [i["slot"] for i in self.items]:
             self.items.append({"item": item, "slot": slot})
             return True
         return False
\ No newline at end of file
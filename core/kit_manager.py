@@ -1,27 +1,170 @@
-from dataclasses import dataclass, field
-from typing import List, Dict
-from .models import KitSlot, MinecraftItem
+from dataclasses import replace
+from typing import List, Union
+from .catalog import DEFAULT_VERSION, ItemCatalog, get_catalog
+from .history import UndoHistory
+from .kit_store import KitStore
+from .models import Kit, KitSlot, MinecraftItem
+from .presets import EnchantmentPreset, PresetResolver, apply_to_slots, get_preset
 
 class KitManager:
-    def __init__(self):
-        self.kits = {}          # {tab_id: List[KitSlot]}
+    """
+    Kits in Tabs. Ein Tab ist nur ein Dict {slot_id: KitSlot}; KitSlots
+    (und ihre Items/Verzauberungen) werden nie verändert, sondern ersetzt.
+    Ein duplizierter Tab teilt sich deshalb alle Slots mit dem Original, bis
+    einer davon bearbeitet wird (Copy-on-Write).
+    """
+
+    def __init__(self, catalog: ItemCatalog = None, store: KitStore = None):
+        self.catalog = catalog or get_catalog(DEFAULT_VERSION)
+        self.store = store      # Persistente Bibliothek (optional)
+        self.kits = {0: {}}     # {tab_id: {slot_id: KitSlot}}
+        self.tab_names = {0: "Kit"}
+        self.histories = {}     # {tab_id: UndoHistory}, Undo/Redo je Tab
         self.current_tab = 0    # Aktiver Tab
-        self.undo_stack = []    # Für Undo/Redo
-    
-    def add_item(self, item: MinecraftItem, slot_id: int):
-        """Fügt Item zum aktuellen Kit hinzu"""
-        if slot_id in [slot.slot_id for slot in self.kits[self.current_tab]]:
+        self._next_tab = 1
+
+    @property
+    def history(self) -> UndoHistory:
+        """Undo/Redo (Slot-Deltas) des aktiven Tabs"""
+        history = self.histories.get(self.current_tab)
+        if history is None:
+            history = self.histories[self.current_tab] = UndoHistory(self._apply_slot)
+        return history
+
+    def new_tab(self, name: str = "Kit", slots: List[KitSlot] = None) -> int:
+        """Legt einen Tab an und macht ihn aktiv; liefert die Tab-ID"""
+        tab_id = self._next_tab
+        self._next_tab += 1
+        self.kits[tab_id] = {slot.slot_id: slot for slot in slots or []}
+        self.tab_names[tab_id] = name
+        self.current_tab = tab_id
+        return tab_id
+
+    def duplicate_tab(self, tab_id: int = None, name: str = None) -> int:
+        """Kopie eines Tabs, die sich die KitSlots mit dem Original teilt"""
+        source = self.current_tab if tab_id is None else tab_id
+        return self.new_tab(name or f"{self.tab_names.get(source, 'Kit')} (copy)",
+                            self.slots(source))
+
+    def switch_tab(self, tab_id: int):
+        if tab_id not in self.kits:
+            raise KeyError(f"Unknown tab {tab_id}")
+        self.current_tab = tab_id
+
+    def close_tab(self, tab_id: int):
+        """Schließt einen Tab; der letzte Tab wird durch einen leeren ersetzt"""
+        self.kits.pop(tab_id, None)
+        self.tab_names.pop(tab_id, None)
+        self.histories.pop(tab_id, None)
+        if not self.kits:
+            self.new_tab()
+        elif tab_id == self.current_tab:
+            self.current_tab = next(iter(self.kits))
+
+    def add_item(self, item: Union[MinecraftItem, str], slot_id: int):
+        """Fügt Item (Objekt oder ID) zum aktuellen Kit hinzu"""
+        if isinstance(item, str):
+            item = self.catalog.get(item)
+            if item is None:
+                return False  # Unbekannte ID
+
+        kit = self.kits.setdefault(self.current_tab, {})
+        if slot_id in kit:
             return False  # Slot belegt
-        
+
         new_slot = KitSlot(item=item, slot_id=slot_id, enchantments=[])
-        self.kits[self.current_tab].append(new_slot)
+        kit[slot_id] = new_slot
+        self.history.record(slot_id, None, new_slot, "Add item")
+        return True
+
+    def set_enchantments(self, slot_id: int, enchantments: list):
+        """Ersetzt die Verzauberungen eines Slots (neuer KitSlot, der alte bleibt für Undo)"""
+        old = self.get_slot(slot_id)
+        if old is None:
+            return False
+        new_slot = replace(old, enchantments=list(enchantments))
+        self._apply_slot(slot_id, new_slot)
+        self.history.record(slot_id, old, new_slot, "Edit enchantments", merge_key=("enchant", slot_id))
         return True
-    
+
+    def apply_preset_to_all(self, preset: Union[str, EnchantmentPreset], all_tabs: bool = False) -> int:
+        """Preset auf alle Slots des aktiven (oder jedes) Tabs; ein Undo-Schritt je Tab.
+
+        Liefert die Zahl geänderter Slots.
+        """
+        if isinstance(preset, str):
+            preset = get_preset(preset)
+        resolver = PresetResolver(preset, self.catalog)
+        active = self.current_tab
+        changed = 0
+        try:
+            for tab_id in (list(self.kits) if all_tabs else [active]):
+                self.current_tab = tab_id
+                old_slots = self.slots(tab_id)
+                new_slots = apply_to_slots(old_slots, resolver)
+                with self.history.group(f"Preset {preset.name}"):
+                    for old, new in zip(old_slots, new_slots):
+                        if new is not old:
+                            self.history.record(new.slot_id, old, new)
+                            changed += 1
+                self.kits[tab_id] = {slot.slot_id: slot for slot in new_slots}
+        finally:
+            self.current_tab = active
+        return changed
+
+    def slots(self, tab_id: int = None) -> List[KitSlot]:
+        """KitSlots eines Tabs (Standard: aktiver Tab), nach Slot sortiert"""
+        kit = self.kits.get(self.current_tab if tab_id is None else tab_id, {})
+        return [kit[slot_id] for slot_id in sorted(kit)]
+
+    def get_slot(self, slot_id: int):
+        return self.kits.get(self.current_tab, {}).get(slot_id)
+
+    def _apply_slot(self, slot_id: int, kit_slot):
+        """Setzt/entfernt den KitSlot eines Slots im aktuellen Tab (auch für Undo/Redo)"""
+        kit = self.kits.setdefault(self.current_tab, {})
+        if kit_slot is None:
+            kit.pop(slot_id, None)
+        else:
+            kit[slot_id] = kit_slot
+
+    def undo(self):
+        return self.history.undo()
+
+    def redo(self):
+        return self.history.redo()
+
+    def load_kit(self, kit: Kit):
+        """Ersetzt den aktuellen Tab durch die Slots eines (z. B. importierten) Kits"""
+        with self.history.group("Load kit"):
+            for slot in self.slots():
+                self.history.record(slot.slot_id, slot, None)
+            for slot in kit.slots:
+                self.history.record(slot.slot_id, None, slot)
+        self.kits[self.current_tab] = {slot.slot_id: slot for slot in kit.slots}
+
+    def save_kit(self, name: str):
+        """Speichert den aktuellen Tab unter ``name`` in der Bibliothek"""
+        kit = Kit(name=name, slots=self.slots(), version=self.catalog.version)
+        self.store.save_kit(kit)
+        self.tab_names[self.current_tab] = name
+        return kit
+
+    def open_kit(self, name: str):
+        """Lädt ein Kit aus der Bibliothek in den aktuellen Tab (mit dem Katalog seiner
+        gespeicherten Version, der danach aktiv ist); None, wenn unbekannt"""
+        kit = self.store.load_kit(name)
+        if kit is not None:
+            if kit.version != self.catalog.version:
+                self.catalog = get_catalog(kit.version)
+            self.load_kit(kit)
+            self.tab_names[self.current_tab] = name
+        return kit
+
     def validate_enchantments(self, slot: KitSlot):
-        """Prüft Verzauberungskonflikte"""
-        conflicts = []
-        for ench in slot.enchantments:
-            for other_ench in slot.enchantments:
-                if ench.id in other_ench.conflicts:
-                    conflicts.append(f"{ench.name} ❌ {other_ench.name}")
-        return conflicts
\ No newline at end of file
+        """Prüft Verzauberungskonflikte (jedes Paar einmal)"""
+        index = self.catalog.enchantment_index
+        mask = index.mask(e.id for e in slot.enchantments)
+        names = {e.id: e.name for e in slot.enchantments}
+        return [f"{names[index.ids[i]]} ❌ {names[index.ids[j]]}"
+                for i, j in index.conflicting_pairs(mask)]
\ No newline at end of file
@@ -0,0 +1,186 @@
+"""
+Persistente Kit-Bibliothek in SQLite.
+
+Tabellen::
+
+    kits(id, name UNIQUE, version, updated)
+    slots(kit_id, slot, item_id, count, name)                PK (kit_id, slot)
+    enchantments(kit_id, slot, enchant_id, level)            PK (kit_id, slot, enchant_id)
+
+Die Indizes ``slots(item_id, kit_id)`` und ``enchantments(enchant_id, kit_id)``
+beantworten Fragen wie "alle Kits mit minecraft:elytra" oder "Kits mit
+Mending" ohne Tabellenscan. Seiten werden per Keyset (``name > ?``) gelesen,
+die GUI lädt also nie die ganze Bibliothek.
+
+Standardpfad: ``$MKC_KIT_DB`` oder ``kits.db``.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .catalog import DEFAULT_VERSION, ItemCatalog, get_catalog
+from .kit_files import kit_from_dict, kit_to_dict
+from .models import Kit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB = Path(os.environ.get("MKC_KIT_DB", "kits.db"))
+PAGE_SIZE = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS kits (
+    id      INTEGER PRIMARY KEY,
+    name    TEXT NOT NULL UNIQUE,
+    version TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS slots (
+    kit_id  INTEGER NOT NULL REFERENCES kits(id) ON DELETE CASCADE,
+    slot    INTEGER NOT NULL,
+    item_id TEXT NOT NULL,
+    count   INTEGER NOT NULL,
+    name    TEXT,
+    PRIMARY KEY (kit_id, slot)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS enchantments (
+    kit_id     INTEGER NOT NULL,
+    slot       INTEGER NOT NULL,
+    enchant_id TEXT NOT NULL,
+    level      INTEGER NOT NULL,
+    PRIMARY KEY (kit_id, slot, enchant_id),
+    FOREIGN KEY (kit_id, slot) REFERENCES slots(kit_id, slot) ON DELETE CASCADE
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_slots_item ON slots(item_id, kit_id);
+CREATE INDEX IF NOT EXISTS idx_enchantments_id ON enchantments(enchant_id, kit_id);
+"""
+
+
+class KitStore:
+    def __init__(self, path: Union[str, Path] = DEFAULT_DB):
+        self.path = Path(path)
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path))
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- Schreiben ---------------------------------------------------------
+
+    def _insert(self, definition: dict):
+        cur = self.db.execute(
+            "INSERT INTO kits (name, version, updated) VALUES (?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET version = excluded.version, updated = excluded.updated "
+            "RETURNING id",
+            (definition["name"], str(definition.get("version", DEFAULT_VERSION)), time.time()),
+        )
+        kit_id = cur.fetchone()[0]
+        # Ersetzen statt Abgleichen: Slots und Verzauberungen (CASCADE) neu schreiben
+        self.db.execute("DELETE FROM slots WHERE kit_id = ?", (kit_id,))
+        self.db.executemany(
+            "INSERT INTO slots (kit_id, slot, item_id, count, name) VALUES (?, ?, ?, ?, ?)",
+            [(kit_id, s["slot"], s["id"], s.get("count", 1), s.get("name")) for s in definition["slots"]],
+        )
+        # Doppelte Verzauberung in einem Slot: die höchste Stufe bleibt
+        self.db.executemany(
+            "INSERT INTO enchantments (kit_id, slot, enchant_id, level) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(kit_id, slot, enchant_id) DO UPDATE SET level = MAX(level, excluded.level)",
+            [(kit_id, s["slot"], e["id"], e.get("level", 1))
+             for s in definition["slots"] for e in s.get("enchantments", [])],
+        )
+        return kit_id
+
+    def save_kit(self, kit: Union[Kit, dict]) -> int:
+        """Speichert (oder ersetzt) ein Kit; liefert die Kit-ID"""
+        with self.db:
+            return self._insert(kit_to_dict(kit) if isinstance(kit, Kit) else kit)
+
+    def save_many(self, kits: Iterable[Union[Kit, dict]]) -> int:
+        """Viele Kits in einer Transaktion"""
+        count = 0
+        with self.db:
+            for kit in kits:
+                self._insert(kit_to_dict(kit) if isinstance(kit, Kit) else kit)
+                count += 1
+        return count
+
+    def delete_kit(self, name: str) -> bool:
+        with self.db:
+            return self.db.execute("DELETE FROM kits WHERE name = ?", (name,)).rowcount > 0
+
+    # --- Lesen -------------------------------------------------------------
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM kits").fetchone()[0]
+
+    def __contains__(self, name: str) -> bool:
+        return self.db.execute("SELECT 1 FROM kits WHERE name = ?", (name,)).fetchone() is not None
+
+    def definition(self, name: str) -> Optional[dict]:
+        """Kit-Definition im Format von kit_files"""
+        row = self.db.execute("SELECT id, version FROM kits WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        kit_id, version = row
+        slots = {}
+        for slot, item_id, count, display_name in self.db.execute(
+                "SELECT slot, item_id, count, name FROM slots WHERE kit_id = ? ORDER BY slot", (kit_id,)):
+            entry = {"slot": slot, "id": item_id, "count": count}
+            if display_name:
+                entry["name"] = display_name
+            slots[slot] = entry
+        for slot, enchant_id, level in self.db.execute(
+                "SELECT slot, enchant_id, level FROM enchantments WHERE kit_id = ?", (kit_id,)):
+            slots[slot].setdefault("enchantments", []).append({"id": enchant_id, "level": level})
+        return {"name": name, "version": version, "slots": list(slots.values())}
+
+    def load_kit(self, name: str, catalog: ItemCatalog = None) -> Optional[Kit]:
+        definition = self.definition(name)
+        if definition is None:
+            return None
+        return kit_from_dict(definition, catalog or get_catalog(definition["version"]))
+
+    def page(self, after: str = "", limit: int = PAGE_SIZE, item_id: str = None,
+             enchant_id: str = None) -> List[Tuple[str, str, int]]:
+        """Nächste Seite (name, version, slot_anzahl) nach ``after``, optional gefiltert"""
+        filters, params = ["k.name > ?"], [after]
+        if item_id:
+            filters.append("k.id IN (SELECT kit_id FROM slots WHERE item_id = ?)")
+            params.append(item_id)
+        if enchant_id:
+            filters.append("k.id IN (SELECT kit_id FROM enchantments WHERE enchant_id = ?)")
+            params.append(enchant_id)
+        params.append(limit)
+        return self.db.execute(
+            "SELECT k.name, k.version, (SELECT COUNT(*) FROM slots s WHERE s.kit_id = k.id) "
+            f"FROM kits k WHERE {' AND '.join(filters)} ORDER BY k.name LIMIT ?",
+            params,
+        ).fetchall()
+
+    def kits_with_item(self, item_id: str) -> List[str]:
+        return [row[0] for row in self.db.execute(
+            "SELECT name FROM kits WHERE id IN (SELECT kit_id FROM slots WHERE item_id = ?) ORDER BY name",
+            (item_id,))]
+
+    def kits_with_enchantment(self, enchant_id: str) -> List[str]:
+        return [row[0] for row in self.db.execute(
+            "SELECT name FROM kits WHERE id IN "
+            "(SELECT kit_id FROM enchantments WHERE enchant_id = ?) ORDER BY name",
+            (enchant_id,))]
+
+    def query_plan(self, sql: str, params=()) -> List[str]:
+        """EXPLAIN QUERY PLAN, z. B. um Index-Nutzung zu prüfen"""
+        return [row[-1] for row in self.db.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
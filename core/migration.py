@@ -0,0 +1,280 @@
+"""
+Migration von Kits zwischen Datenversionen.
+
+``KitMigrator(quelle, ziel)`` vergleicht die beiden Kataloge einmal und baut
+Tabellen für jede Item- und Verzauberungs-ID der Quelle:
+
+* umbenannte IDs (über die Aliase der VersionRegistry, auch rückwärts, z. B.
+  ``sweeping_edge`` -> ``sweeping`` beim Wechsel von 1.21 auf 1.20)
+* entfernte Items/Verzauberungen (Slot bzw. Verzauberung fällt weg)
+* geänderte ``max_stack``/``max_level`` (Anzahl bzw. Stufe wird begrenzt)
+* im Ziel nicht mehr anwendbare Verzauberungen (fallen weg)
+
+Das Ausgabeformat (``tag.Enchantments`` bis 1.20.4, Item-Komponenten ab
+1.20.5) folgt aus der Kit-Version (siehe exporters.give_syntax); ein
+Formatwechsel wird im Bericht vermerkt, mit ``nbt=True`` wird die .nbt-Datei
+gleich im Zielformat geschrieben.
+
+``migrate_files`` verteilt große Bibliotheken in Blöcken auf Worker-Prozesse
+und sammelt einen Diff-Bericht: je Kit die Änderungen pro Slot und die
+Probleme, die nach der Migration noch bestehen (core/validation.py).
+"""
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .catalog import DEFAULT_VERSION, ItemCatalog, get_catalog
+from .exporters import give_syntax, save_items_nbt
+from .validation import get_validator
+
+logger = logging.getLogger(__name__)
+
+# Änderungsarten im Bericht
+RENAMED_ITEM = "renamed_item"
+REMOVED_ITEM = "removed_item"
+STACK_CLAMPED = "stack_clamped"
+RENAMED_ENCHANTMENT = "renamed_enchantment"
+REMOVED_ENCHANTMENT = "removed_enchantment"
+LEVEL_CLAMPED = "level_clamped"
+NOT_APPLICABLE = "enchant_not_applicable"
+
+
+@dataclass
+class SlotChange:
+    slot: int
+    change: str
+    before: object = None
+    after: object = None
+
+
+@dataclass
+class KitMigration:
+    kit: str
+    path: Optional[str]
+    source: str
+    target: str
+    changes: List[SlotChange] = field(default_factory=list)
+    format_change: Optional[str] = None     # z. B. "legacy -> components"
+    issues: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    output: Optional[str] = None
+
+
+@dataclass
+class MigrationReport:
+    kits: List[KitMigration] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def merge(self, other: "MigrationReport"):
+        self.kits.extend(other.kits)
+
+    @property
+    def failed(self) -> List[KitMigration]:
+        return [k for k in self.kits if k.error]
+
+    def counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for kit in self.kits:
+            for change in kit.changes:
+                counts[change.change] = counts.get(change.change, 0) + 1
+        return counts
+
+    def summary(self) -> str:
+        changed = sum(1 for k in self.kits if k.changes)
+        with_issues = sum(1 for k in self.kits if k.issues)
+        return (f"{len(self.kits)} kits migrated, {changed} with slot changes, "
+                f"{with_issues} with remaining issues, {len(self.failed)} failed in {self.seconds:.2f}s")
+
+    def to_dict(self) -> dict:
+        return {
+            "kits": len(self.kits),
+            "failed": len(self.failed),
+            "changes": self.counts(),
+            "seconds": round(self.seconds, 3),
+            # Nur Kits mit Unterschieden; unveränderte Kits blähen den Bericht nicht auf
+            "diff": [asdict(k) for k in self.kits if k.changes or k.issues or k.error or k.format_change],
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, **kwargs)
+
+
+def _id_map(source_ids, source: ItemCatalog, target: ItemCatalog, exists) -> Dict[str, Optional[str]]:
+    """{Quell-ID: Ziel-ID oder None (entfernt)}"""
+    # Aliase zeigen von der ID der vollständigen Basis auf die ID der Version
+    to_base = {new: old for old, new in source.aliases.items()}
+    mapping = {}
+    for source_id in source_ids:
+        base_id = to_base.get(source_id, source_id)
+        target_id = target.current_id(base_id)
+        mapping[source_id] = target_id if exists(target_id) else None
+    return mapping
+
+
+class KitMigrator:
+    def __init__(self, source: str, target: str):
+        self.source = source
+        self.target = target
+        self.source_catalog = get_catalog(source)
+        self.target_catalog = get_catalog(target)
+        self.items = _id_map([i.id for i in self.source_catalog.items], self.source_catalog,
+                             self.target_catalog, self.target_catalog.__contains__)
+        self.enchantments = _id_map([e.id for e in self.source_catalog.enchantments], self.source_catalog,
+                                    self.target_catalog,
+                                    lambda enchant_id: enchant_id in self.target_catalog.enchantments_by_id)
+        source_syntax, target_syntax = give_syntax(source), give_syntax(target)
+        self.format_change = f"{source_syntax} -> {target_syntax}" if source_syntax != target_syntax else None
+
+    def _target_id(self, mapping: Dict[str, Optional[str]], known, value: str) -> Optional[str]:
+        if value in mapping:
+            return mapping[value]
+        # Nicht im Quellkatalog: unverändert übernehmen, wenn das Ziel die ID kennt
+        return value if known(value) else None
+
+    def migrate(self, definition: dict) -> Tuple[dict, List[SlotChange]]:
+        """Kit-Definition der Quellversion -> (Definition der Zielversion, Änderungen)"""
+        target = self.target_catalog
+        index = target.enchantment_index
+        changes = []
+        slots = []
+        for entry in definition.get("slots", []):
+            slot = entry.get("slot")
+            old_id = entry.get("id", "")
+            item_id = self._target_id(self.items, target.__contains__, old_id)
+            if item_id is None:
+                changes.append(SlotChange(slot, REMOVED_ITEM, old_id))
+                continue
+            entry = dict(entry, id=item_id)
+            if item_id != old_id:
+                changes.append(SlotChange(slot, RENAMED_ITEM, old_id, item_id))
+
+            max_stack = target.get(item_id).max_stack
+            if entry.get("count", 1) > max_stack:
+                changes.append(SlotChange(slot, STACK_CLAMPED, entry["count"], max_stack))
+                entry["count"] = max_stack
+
+            if entry.get("enchantments"):
+                applicable = target.applicable_enchantments(item_id)
+                enchantments = []
+                for ench in entry["enchantments"]:
+                    old_ench = ench.get("id", "")
+                    enchant_id = self._target_id(self.enchantments,
+                                                 target.enchantments_by_id.__contains__, old_ench)
+                    if enchant_id is None:
+                        changes.append(SlotChange(slot, REMOVED_ENCHANTMENT, old_ench))
+                        continue
+                    if enchant_id != old_ench:
+                        changes.append(SlotChange(slot, RENAMED_ENCHANTMENT, old_ench, enchant_id))
+                    bit = index.index[enchant_id]
+                    if not applicable >> bit & 1:
+                        changes.append(SlotChange(slot, NOT_APPLICABLE, enchant_id))
+                        continue
+                    level = ench.get("level", 1)
+                    if level > index.max_levels[bit]:
+                        changes.append(SlotChange(slot, LEVEL_CLAMPED, f"{enchant_id} {level}",
+                                                  f"{enchant_id} {index.max_levels[bit]}"))
+                        level = index.max_levels[bit]
+                    enchantments.append({"id": enchant_id, "level": level})
+                if enchantments:
+                    entry["enchantments"] = enchantments
+                else:
+                    del entry["enchantments"]
+            slots.append(entry)
+        return dict(definition, version=self.target, slots=slots), changes
+
+
+def output_paths(paths: List[str], out_dir: Optional[str]) -> List[str]:
+    """Zielpfade: ohne ``out_dir`` die Eingaben selbst, sonst relativ zum gemeinsamen
+    Elternverzeichnis, damit gleichnamige Dateien aus verschiedenen Ordnern sich nicht
+    überschreiben"""
+    if not out_dir or not paths:
+        return list(paths)
+    absolute = [os.path.abspath(path) for path in paths]
+    root = os.path.commonpath([os.path.dirname(path) for path in absolute])
+    return [os.path.join(out_dir, os.path.relpath(path, root)) for path in absolute]
+
+
+def _migrate_chunk(paths: List[str], outputs: List[str], target: str, source: Optional[str],
+                   nbt: bool, dry_run: bool) -> MigrationReport:
+    """Worker: Kits lesen, migrieren, prüfen und schreiben; ein Migrator pro Quellversion"""
+    report = MigrationReport()
+    migrators: Dict[str, KitMigrator] = {}
+    migrated_kits: List[Tuple[KitMigration, dict, str]] = []
+    for path, output in zip(paths, outputs):
+        result = KitMigration(Path(path).stem, path, source or "", target)
+        report.kits.append(result)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                definition = json.load(f)
+            result.kit = str(definition.get("name", result.kit))
+            definition.setdefault("name", result.kit)
+            result.source = source or str(definition.get("version", DEFAULT_VERSION))
+            migrator = migrators.get(result.source)
+            if migrator is None:
+                migrator = migrators[result.source] = KitMigrator(result.source, target)
+            migrated, result.changes = migrator.migrate(definition)
+            result.format_change = migrator.format_change
+            migrated_kits.append((result, migrated, output))
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+
+    # Restprobleme in einem Durchlauf über den ganzen Block prüfen
+    issues = get_validator(target).validate(
+        [migrated for _, migrated, _ in migrated_kits], [result.path for result, _, _ in migrated_kits]).issues
+    by_path: Dict[str, List[str]] = {}
+    for issue in issues:
+        by_path.setdefault(issue.path, []).append(issue.describe())
+
+    syntax = give_syntax(target)
+    for result, migrated, output in migrated_kits:
+        result.issues = by_path.get(result.path, [])
+        if dry_run:
+            continue
+        try:
+            target_path = Path(output)
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(target_path, "w", encoding="utf-8") as f:
+                json.dump(migrated, f, ensure_ascii=False, indent=2)
+            result.output = str(target_path)
+            if nbt:
+                save_items_nbt(migrated["slots"], target_path.with_suffix(".nbt"), syntax=syntax)
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+    return report
+
+
+def migrate_files(paths, target: str, source: Optional[str] = None, out_dir=None,
+                  jobs: Optional[int] = None, nbt: bool = False, dry_run: bool = False) -> MigrationReport:
+    """
+    Migriert Kit-Dateien auf ``target``.
+
+    ``source`` überschreibt die Version aus den Dateien; ohne ``out_dir``
+    werden die Dateien ersetzt, sonst bleibt die Ordnerstruktur unterhalb des
+    gemeinsamen Elternverzeichnisses der Eingaben erhalten. Die Worker lesen und schreiben selbst, der
+    Hauptprozess sammelt nur die Berichte der fertigen Blöcke ein.
+    """
+    start = time.perf_counter()
+    paths = [str(p) for p in paths]
+    outputs = output_paths(paths, str(out_dir) if out_dir else None)
+
+    workers = jobs or os.cpu_count() or 1
+    if workers == 1 or len(paths) < 2 * workers:
+        report = _migrate_chunk(paths, outputs, target, source, nbt, dry_run)
+    else:
+        size = -(-len(paths) // (workers * 4))
+        starts = range(0, len(paths), size)
+        chunks = [paths[i:i + size] for i in starts]
+        report = MigrationReport()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(_migrate_chunk, chunks, [outputs[i:i + size] for i in starts],
+                                 [target] * len(chunks), [source] * len(chunks),
+                                 [nbt] * len(chunks), [dry_run] * len(chunks)):
+                report.merge(part)
+    report.seconds = time.perf_counter() - start
+    return report
@@ -1,7 +1,16 @@
-from dataclasses import dataclass
-from typing import List, Dict
+from dataclasses import dataclass, field
+from typing import List, Optional
 
-@dataclass
+# Katalogeinträge und Slots sind unveränderlich (frozen) und ohne __dict__
+# (slots): Kataloge verschiedener Versionen, Presets und der Undo-Verlauf
+# teilen sich dieselben Objekte, Änderungen laufen über dataclasses.replace.
+# Für große Bibliotheken siehe core/compact_kit.py.
+
+def _default_version() -> str:
+    from .catalog import DEFAULT_VERSION   # catalog importiert dieses Modul
+    return DEFAULT_VERSION
+
+@dataclass(frozen=True, slots=True)
 class MinecraftItem:
     id: str          # "minecraft:diamond_sword"
     name: str        # "Diamantschwert"
@@ -9,16 +18,29 @@ class MinecraftItem:
     max_stack: int   # 1
     slots: List[str] # ["mainhand", "offhand"]
     icon: str        # "diamond_sword.png"
+    enchantable: bool = False
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Enchantment:
     id: str                 # "minecraft:sharpness"
     name: str               # "Schärfe"
     max_level: int          # 5
     conflicts: List[str]    # ["minecraft:smite", ...]
+    item_categories: List[str] = field(default_factory=list)  # ["Waffen"]
+    items: List[str] = field(default_factory=list)            # ["minecraft:*_sword"], leer = nach Kategorie
+    version: str = ""       # "1.0+"
+    level: int = 1          # Stufe, wenn die Verzauberung auf einem Slot liegt
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class KitSlot:
     item: MinecraftItem
     slot_id: int
-    enchantments: List[Enchantment]
\ No newline at end of file
+    enchantments: List[Enchantment]
+    count: int = 1
+    display_name: Optional[str] = None  # Eigener Name, sonst item.name
+
+@dataclass(slots=True)
+class Kit:
+    name: str               # "pvp_tier1"
+    slots: List[KitSlot] = field(default_factory=list)
+    version: str = field(default_factory=_default_version)
\ No newline at end of file
@@ -0,0 +1,344 @@
+"""
+Import vorhandener Shulker-.nbt-Dateien.
+
+Der Parser liest NBT direkt aus einem (ggf. gzip-)Stream, Tag für Tag, ohne
+nbtlib. Aus dem Baum werden die Shulker-Items geholt - ``Items`` auf oberster
+Ebene (eigener Export), in ``BlockEntityTag`` (Item-NBT bis 1.20.4) oder in
+``components/minecraft:container`` (ab 1.20.5) - und über den Katalog in
+Kit-Daten zurückübersetzt: Slot, ID, Anzahl, Anzeigename und Verzauberungen.
+
+Ohne vorgegebenen Katalog bestimmt das Item-Format die Version: Komponenten
+(``count``/``components``) gibt es erst ab 1.20.5, also wird die neueste
+Komponenten-Version verwendet, sonst die Standardversion. IDs werden auch über
+die Umbenennungen der VersionRegistry zugeordnet (z. B. ``sweeping_edge`` aus
+einem 1.21-Export -> ``sweeping`` im 1.20-Katalog).
+
+Unbekannte Items oder Verzauberungen werden übersprungen und als Warnung
+gemeldet, statt den ganzen Import abzubrechen.
+"""
+
+import gzip
+import io
+import json
+import logging
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .catalog import DEFAULT_VERSION, ItemCatalog, get_catalog, get_registry
+from .exporters import COMPONENTS, give_syntax
+from .kit_files import kit_from_dict, save_kit_file
+from .models import Kit
+
+logger = logging.getLogger(__name__)
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+_NUMERIC = {
+    1: struct.Struct(">b"),
+    2: struct.Struct(">h"),
+    3: struct.Struct(">i"),
+    4: struct.Struct(">q"),
+    5: struct.Struct(">f"),
+    6: struct.Struct(">d"),
+}
+_ARRAYS = {7: "b", 11: "i", 12: "q"}
+_USHORT = struct.Struct(">H")
+_INT = _NUMERIC[3]
+
+
+class NBTParseError(ValueError):
+    pass
+
+
+class NBTReader:
+    """Rekursiver NBT-Parser über einem Binär-Stream (Big Endian)"""
+
+    def __init__(self, stream):
+        self.read = stream.read
+
+    def _exact(self, size: int) -> bytes:
+        data = self.read(size)
+        if len(data) != size:
+            raise NBTParseError("Unexpected end of NBT data")
+        return data
+
+    def _string(self) -> str:
+        length = _USHORT.unpack(self._exact(2))[0]
+        return self._exact(length).decode("utf-8", errors="replace")
+
+    def payload(self, tag_type: int):
+        numeric = _NUMERIC.get(tag_type)
+        if numeric is not None:
+            return numeric.unpack(self._exact(numeric.size))[0]
+        if tag_type == 8:
+            return self._string()
+        if tag_type == 10:
+            compound = {}
+            while True:
+                child_type = self._exact(1)[0]
+                if child_type == 0:
+                    return compound
+                name = self._string()
+                compound[name] = self.payload(child_type)
+        if tag_type == 9:
+            element_type = self._exact(1)[0]
+            length = _INT.unpack(self._exact(4))[0]
+            return [self.payload(element_type) for _ in range(max(length, 0))]
+        if tag_type in _ARRAYS:
+            length = _INT.unpack(self._exact(4))[0]
+            fmt = _ARRAYS[tag_type]
+            size = struct.calcsize(fmt)
+            return list(struct.unpack(f">{length}{fmt}", self._exact(length * size)))
+        raise NBTParseError(f"Unknown NBT tag type {tag_type}")
+
+    def root(self) -> Tuple[str, dict]:
+        tag_type = self._exact(1)[0]
+        if tag_type != 10:
+            raise NBTParseError("NBT root is not a compound")
+        name = self._string()
+        return name, self.payload(10)
+
+
+def read_nbt(path) -> dict:
+    """Liest eine .nbt-Datei (gzip oder unkomprimiert) und liefert die Wurzel"""
+    with open(path, "rb") as raw:
+        stream = io.BufferedReader(raw)
+        if stream.peek(2)[:2] == GZIP_MAGIC:
+            stream = io.BufferedReader(gzip.GzipFile(fileobj=stream))
+        return NBTReader(stream).root()[1]
+
+
+def _namespaced(value: str) -> str:
+    return value if ":" in value else f"minecraft:{value}"
+
+
+def _plain_text(component) -> str:
+    if isinstance(component, str):
+        return component
+    if isinstance(component, list):
+        return "".join(_plain_text(part) for part in component)
+    if isinstance(component, dict):
+        return _plain_text(component.get("text", "")) + _plain_text(component.get("extra", []))
+    return ""
+
+
+def _text(value) -> Optional[str]:
+    """Anzeigename aus einem String oder einer JSON-Text-Komponente"""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        return value
+    # Zahlen o. Ä. sind kein Text-Komponenten-JSON, sondern ein einfacher Name
+    return _plain_text(parsed) if isinstance(parsed, (str, list, dict)) else value
+
+
+def find_items(root: dict) -> List[dict]:
+    """Item-Liste der Kiste an den bekannten Stellen"""
+    if isinstance(root.get("Items"), list):
+        return root["Items"]
+    for holder in (root, root.get("tag", {})):
+        block_entity = holder.get("BlockEntityTag", {}) if isinstance(holder, dict) else {}
+        if isinstance(block_entity.get("Items"), list):
+            return block_entity["Items"]
+    container = root.get("components", {}).get("minecraft:container")
+    if isinstance(container, list):
+        return [dict(entry.get("item", {}), Slot=entry.get("slot", 0)) for entry in container]
+    return []
+
+
+def item_entry(raw: dict) -> dict:
+    """NBT-Item (alt oder Komponenten) -> Export-Daten-Eintrag"""
+    entry = {
+        "slot": int(raw.get("Slot", raw.get("slot", 0))),
+        "id": _namespaced(raw.get("id", "")),
+        "count": int(raw.get("Count", raw.get("count", 1))),
+    }
+    tag = raw.get("tag", {})
+    components = raw.get("components", {})
+
+    name = _text(tag.get("display", {}).get("Name")) or _text(components.get("minecraft:custom_name"))
+    if name:
+        entry["name"] = name
+
+    enchantments = [{"id": _namespaced(e.get("id", "")), "level": int(e.get("lvl", 1))}
+                    for e in tag.get("Enchantments", [])]
+    levels = components.get("minecraft:enchantments", {})
+    levels = levels.get("levels", levels)
+    enchantments += [{"id": _namespaced(k), "level": int(v)} for k, v in levels.items()]
+    if enchantments:
+        entry["enchantments"] = enchantments
+    return entry
+
+
+def detect_version(raw_items: List[dict]) -> str:
+    """Datenversion aus dem Item-Format: Komponenten -> neueste Version ab 1.20.5"""
+    for raw in raw_items:
+        if "components" in raw or ("count" in raw and "Count" not in raw):
+            versions = [v for v in get_registry().versions() if give_syntax(v) == COMPONENTS]
+            return versions[-1] if versions else DEFAULT_VERSION
+        if "Count" in raw or "tag" in raw:
+            break
+    return DEFAULT_VERSION
+
+
+class IdResolver:
+    """Ordnet IDs einem Katalog zu, auch wenn sie in einer anderen Version umbenannt sind"""
+
+    def __init__(self, catalog: ItemCatalog):
+        self.catalog = catalog
+        self.equivalents: Dict[str, List[str]] = {}
+        for old, new in get_registry().renames().items():
+            self.equivalents.setdefault(old, []).append(new)
+            self.equivalents.setdefault(new, []).append(old)
+
+    def resolve(self, value: str, exists) -> Optional[str]:
+        """Erste bekannte ID unter ``value`` und seinen (auch verketteten) Umbenennungen"""
+        queue, seen = [value, self.catalog.current_id(value)], set()
+        while queue:
+            candidate = queue.pop(0)
+            if candidate in seen:
+                continue
+            if exists(candidate):
+                return candidate
+            seen.add(candidate)
+            queue.extend(self.equivalents.get(candidate, ()))
+        return None
+
+    def item(self, item_id: str) -> Optional[str]:
+        return self.resolve(item_id, self.catalog.__contains__)
+
+    def enchantment(self, enchant_id: str) -> Optional[str]:
+        return self.resolve(enchant_id, self.catalog.enchantments_by_id.__contains__)
+
+
+_resolvers: Dict[ItemCatalog, IdResolver] = {}
+
+
+def get_resolver(catalog: ItemCatalog) -> IdResolver:
+    resolver = _resolvers.get(catalog)
+    if resolver is None:
+        resolver = _resolvers[catalog] = IdResolver(catalog)
+    return resolver
+
+
+def kit_definition_from_nbt(path, catalog: ItemCatalog = None, name: str = None) -> Tuple[dict, List[str]]:
+    """Kit-Definition (Format von kit_files) aus einer .nbt-Datei; dazu Warnungen.
+
+    Ohne ``catalog`` wird die Version aus dem Item-Format bestimmt (detect_version).
+    """
+    raw_items = find_items(read_nbt(path))
+    catalog = catalog or get_catalog(detect_version(raw_items))
+    resolver = get_resolver(catalog)
+    warnings = []
+    slots = []
+    for raw in raw_items:
+        entry = item_entry(raw)
+        item_id = resolver.item(entry["id"])
+        if item_id is None:
+            warnings.append(f"slot {entry['slot']}: unknown item {entry['id']!r} skipped")
+            continue
+        entry["id"] = item_id
+        item = catalog.get(item_id)
+        if entry.get("name") == item.name:
+            del entry["name"]
+        known = []
+        for ench in entry.get("enchantments", []):
+            enchant_id = resolver.enchantment(ench["id"])
+            if enchant_id is None:
+                warnings.append(f"slot {entry['slot']}: unknown enchantment {ench['id']!r} skipped")
+            else:
+                known.append(dict(ench, id=enchant_id))
+        if known:
+            entry["enchantments"] = known
+        else:
+            entry.pop("enchantments", None)
+        slots.append(entry)
+    return {"name": name or Path(path).stem, "version": catalog.version, "slots": slots}, warnings
+
+
+def import_nbt_file(path, catalog: ItemCatalog = None, name: str = None) -> Tuple[Kit, List[str]]:
+    """.nbt-Datei -> Kit (KitSlots mit Katalog-Items) und Warnungen"""
+    definition, warnings = kit_definition_from_nbt(path, catalog, name)
+    return kit_from_dict(definition, catalog or get_catalog(definition["version"])), warnings
+
+
+@dataclass
+class ImportResult:
+    imported: Dict[str, str] = field(default_factory=dict)        # {nbt-pfad: kit-json}
+    warnings: Dict[str, List[str]] = field(default_factory=dict)
+    failed: Dict[str, str] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        return (f"{len(self.imported)} imported, {len(self.warnings)} with warnings, "
+                f"{len(self.failed)} failed in {self.seconds:.2f}s")
+
+
+def _import_chunk(sources: List[Tuple[str, str]], out_dir: str, version: Optional[str]) -> ImportResult:
+    """Worker: Dateien parsen und als Kit-JSON ablegen"""
+    result = ImportResult()
+    catalog = get_catalog(version) if version else None
+    for path, name in sources:
+        try:
+            kit, warnings = import_nbt_file(path, catalog, name)
+            target = Path(out_dir) / f"{name}.json"
+            save_kit_file(kit, target)
+            result.imported[path] = str(target)
+            if warnings:
+                result.warnings[path] = warnings
+        except Exception as e:
+            result.failed[path] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def kit_names(paths: List[Path], source: Path) -> List[str]:
+    """Kitnamen aus den relativen Pfaden (``a/b.nbt`` -> ``a_b``); fallen zwei Namen
+    zusammen (``a/b_c`` und ``a_b/c``, auch nur in Groß-/Kleinschreibung), erhalten
+    die späteren ein Suffix ``-2``, ``-3``, ..."""
+    names, used = [], set()
+    for path in paths:
+        base = "_".join(path.relative_to(source).with_suffix("").parts)
+        name, counter = base, 1
+        while name.casefold() in used:
+            counter += 1
+            name = f"{base}-{counter}"
+        used.add(name.casefold())
+        names.append(name)
+    return names
+
+
+def import_directory(source, out_dir, version: Optional[str] = None, jobs: Optional[int] = None,
+                     pattern: str = "*.nbt") -> ImportResult:
+    """Importiert alle .nbt-Dateien eines Verzeichnisses (rekursiv) in eine Kit-Bibliothek.
+
+    Ohne ``version`` wird die Version je Datei aus dem Item-Format bestimmt.
+    """
+    start = time.perf_counter()
+    source = Path(source)
+    files = sorted(source.rglob(pattern))
+    # Namen im Hauptprozess vergeben, damit sich keine zwei Dateien überschreiben
+    paths = list(zip(map(str, files), kit_names(files, source)))
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+
+    workers = jobs or os.cpu_count() or 1
+    if workers == 1 or len(paths) < 2 * workers:
+        result = _import_chunk(paths, str(out_dir), version)
+    else:
+        size = -(-len(paths) // (workers * 4))
+        chunks = [paths[i:i + size] for i in range(0, len(paths), size)]
+        result = ImportResult()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(_import_chunk, chunks, [str(out_dir)] * len(chunks),
+                                 [version] * len(chunks)):
+                result.imported.update(part.imported)
+                result.warnings.update(part.warnings)
+                result.failed.update(part.failed)
+    result.seconds = time.perf_counter() - start
+    return result
@@ -0,0 +1,114 @@
+"""
+Platzierungsregeln als Bitmasken.
+
+Jedes Item erhält beim Laden des Katalogs eine Maske seiner erlaubten
+Slot-Typen (Feld ``slots`` in items.json), jeder Grid-Slot eine Maske der
+Slot-Typen, die er annimmt. Eine Platzierung ist gültig, wenn sich beide
+Masken überschneiden - ein einzelnes AND, in GUI und Validierung gleich.
+
+Normale Shulker-Slots nehmen jedes Item an (wie im Spiel). Über ``rules``
+lassen sich einzelne Slots oder ganze Reihen einschränken, z. B.
+``PlacementTable.for_rows({0: ARMOR})`` für eine reine Rüstungsreihe.
+Regeln werden beim Laden geprüft: Slots außerhalb des Grids oder unbekannte
+Slot-Typen lösen einen ``PlacementRuleError`` mit der betroffenen Regel aus.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+SLOT_TYPES = ("mainhand", "offhand", "head", "chest", "legs", "feet", "inventory")
+SLOT_BITS = {name: 1 << bit for bit, name in enumerate(SLOT_TYPES)}
+
+MAINHAND = SLOT_BITS["mainhand"]
+OFFHAND = SLOT_BITS["offhand"]
+HEAD = SLOT_BITS["head"]
+CHEST = SLOT_BITS["chest"]
+LEGS = SLOT_BITS["legs"]
+FEET = SLOT_BITS["feet"]
+INVENTORY = SLOT_BITS["inventory"]
+
+HANDS = MAINHAND | OFFHAND
+ARMOR = HEAD | CHEST | LEGS | FEET
+ANY = (1 << len(SLOT_TYPES)) - 1
+
+GRID_COLUMNS = 9
+GRID_SLOTS = 27
+
+
+def slots_to_mask(slots: Iterable[str]) -> int:
+    """["mainhand", "offhand"] -> MAINHAND | OFFHAND; unbekannte Namen zählen als inventory"""
+    mask = 0
+    for slot in slots:
+        mask |= SLOT_BITS.get(slot, INVENTORY)
+    return mask or INVENTORY
+
+
+class PlacementRuleError(ValueError):
+    pass
+
+
+def parse_mask(value) -> int:
+    """Maske aus int, Slot-Typ-Name, Gruppenname (armor, hands, any) oder Liste davon"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        groups = {"armor": ARMOR, "hands": HANDS, "any": ANY}
+        return groups.get(value.lower(), SLOT_BITS.get(value.lower(), 0))
+    mask = 0
+    for part in value:
+        mask |= parse_mask(part)
+    return mask
+
+
+def check_rules(rules: Optional[Dict[int, int]], slot_count: int = GRID_SLOTS) -> Dict[int, int]:
+    """{slot_id: Maske} prüfen und auflösen; meldet die erste ungültige Regel"""
+    checked = {}
+    for slot_id, value in (rules or {}).items():
+        try:
+            index = int(slot_id)
+        except (TypeError, ValueError):
+            raise PlacementRuleError(f"Placement rule {slot_id!r}: {value!r}: slot is not a number") from None
+        if not 0 <= index < slot_count:
+            raise PlacementRuleError(f"Placement rule {slot_id!r}: {value!r}: slot outside the grid "
+                                     f"(0-{slot_count - 1})")
+        mask = parse_mask(value)
+        if not mask and value not in (0, "", []):
+            raise PlacementRuleError(f"Placement rule {slot_id!r}: {value!r}: unknown slot type")
+        checked[index] = mask
+    return checked
+
+
+class PlacementTable:
+    """Slot-Masken eines Grids; Item-Masken kommen aus dem Katalog"""
+
+    def __init__(self, item_masks: Dict[str, int], rules: Optional[Dict[int, int]] = None,
+                 slot_count: int = GRID_SLOTS):
+        self.item_masks = item_masks
+        self.slot_masks: List[int] = [ANY] * slot_count
+        for slot_id, mask in check_rules(rules, slot_count).items():
+            self.slot_masks[slot_id] = mask
+
+    @classmethod
+    def for_rows(cls, item_masks: Dict[str, int], row_rules: Dict[int, int],
+                 columns: int = GRID_COLUMNS, slot_count: int = GRID_SLOTS):
+        """Regeln pro Reihe, z. B. {0: ARMOR}"""
+        rows = -(-slot_count // columns)
+        rules = {}
+        for row, mask in row_rules.items():
+            if not 0 <= row < rows:
+                raise PlacementRuleError(f"Placement rule for row {row!r}: {mask!r}: row outside the grid "
+                                         f"(0-{rows - 1})")
+            for col in range(min(columns, slot_count - row * columns)):
+                rules[row * columns + col] = mask
+        return cls(item_masks, rules, slot_count)
+
+    def item_mask(self, item_id: str) -> int:
+        # Unbekannte Items (nicht im Katalog) sind überall erlaubt
+        return self.item_masks.get(item_id, ANY)
+
+    def is_valid(self, item_id: str, slot_id: int) -> bool:
+        return bool(self.item_masks.get(item_id, ANY) & self.slot_masks[slot_id])
+
+    def valid_slots(self, item_id: str) -> List[int]:
+        """Alle Slots, in die das Item passt"""
+        mask = self.item_mask(item_id)
+        return [slot_id for slot_id, slot_mask in enumerate(self.slot_masks) if mask & slot_mask]
@@ -0,0 +1,147 @@
+"""
+Verzauberungs-Presets aus ``data/presets.json``.
+
+Ein Preset ist eine geordnete Liste ``{verzauberung: stufe}`` (oder
+``max_all``: alle anwendbaren auf Maximalstufe). Beim Anwenden erhält jedes
+Item nur den anwendbaren Teil; bei Konflikten gewinnt die frühere
+Verzauberung, Stufen werden auf ``max_level`` begrenzt.
+
+``PresetResolver`` rechnet das einmal pro Anwendbarkeits-Bitset (siehe
+core/enchant_index.py) aus - es gibt nur so viele verschiedene Bitsets wie
+Item-Kategorien. Ein Kit mit 27 Slots oder eine Bibliothek mit 500 Kits ist
+damit ein Durchlauf mit Dict-Lookups. Items, für die das Preset nichts
+Anwendbares enthält, behalten ihre Verzauberungen.
+"""
+
+import logging
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from .catalog import DATA_DIR, DEFAULT_VERSION, ItemCatalog, get_catalog
+from .data_cache import load_json_cached
+from .models import Enchantment, KitSlot
+
+logger = logging.getLogger(__name__)
+
+PRESETS_FILE = DATA_DIR / "presets.json"
+
+
+@dataclass
+class EnchantmentPreset:
+    name: str
+    levels: Dict[str, int] = field(default_factory=dict)   # Reihenfolge = Priorität bei Konflikten
+    max_all: bool = False
+    description: str = ""
+
+
+def load_presets(path: Union[str, Path] = PRESETS_FILE) -> Dict[str, EnchantmentPreset]:
+    """Presets nach Name, in Dateireihenfolge"""
+    path = Path(path)
+    if not path.exists():
+        logger.error(f"Preset file not found: {path}")
+        return {}
+    presets = {}
+    for raw in load_json_cached(path).get("presets", []):
+        levels = {(k if ":" in k else f"minecraft:{k}"): int(v)
+                  for k, v in raw.get("enchantments", {}).items()}
+        presets[raw["name"]] = EnchantmentPreset(
+            name=raw["name"],
+            levels=levels,
+            max_all=bool(raw.get("max_all", False)),
+            description=raw.get("description", ""),
+        )
+    return presets
+
+
+def get_preset(name: str, path: Union[str, Path] = PRESETS_FILE) -> EnchantmentPreset:
+    presets = load_presets(path)
+    if name not in presets:
+        raise KeyError(f"Unknown preset {name!r} (available: {', '.join(presets)})")
+    return presets[name]
+
+
+class PresetResolver:
+    """Preset -> Verzauberungen je Item, gemerkt pro Anwendbarkeits-Bitset"""
+
+    def __init__(self, preset: EnchantmentPreset, catalog: ItemCatalog):
+        self.preset = preset
+        self.catalog = catalog
+        self.index = catalog.enchantment_index
+        if preset.max_all:
+            self.wanted = list(enumerate(self.index.max_levels))
+        else:
+            self.wanted = []
+            for enchant_id, level in preset.levels.items():
+                # Presets nennen ggf. eine ältere ID (z. B. sweeping vor 1.20.5)
+                bit = self.index.index.get(catalog.current_id(enchant_id))
+                if bit is None:
+                    logger.warning(f"Preset {preset.name!r}: unknown enchantment {enchant_id!r} skipped")
+                    continue
+                self.wanted.append((bit, max(1, min(level, self.index.max_levels[bit]))))
+        self._levels: Dict[int, Tuple[Tuple[int, int], ...]] = {}
+        self._enchantments: Dict[int, Tuple[Enchantment, ...]] = {}
+
+    def levels_for(self, applicable: int) -> Tuple[Tuple[int, int], ...]:
+        """((bit, stufe), ...) für ein Anwendbarkeits-Bitset, konfliktfrei"""
+        levels = self._levels.get(applicable)
+        if levels is None:
+            chosen, blocked = [], 0
+            for bit, level in self.wanted:
+                if applicable >> bit & 1 and not blocked >> bit & 1:
+                    chosen.append((bit, level))
+                    blocked |= self.index.conflicts[bit] | (1 << bit)
+            levels = self._levels[applicable] = tuple(chosen)
+        return levels
+
+    def levels_for_item(self, item_id: str) -> Tuple[Tuple[int, int], ...]:
+        return self.levels_for(self.catalog.applicable_enchantments(item_id))
+
+    def enchantments_for_item(self, item_id: str) -> Tuple[Enchantment, ...]:
+        """Verzauberungs-Objekte mit Stufe; alle Slots mit gleichem Bitset teilen sie sich"""
+        applicable = self.catalog.applicable_enchantments(item_id)
+        enchantments = self._enchantments.get(applicable)
+        if enchantments is None:
+            enchantments = self._enchantments[applicable] = tuple(
+                replace(self.index.enchantments[bit], level=level)
+                for bit, level in self.levels_for(applicable))
+        return enchantments
+
+    def entries_for_item(self, item_id: str) -> List[dict]:
+        """Verzauberungen im Format der Kit-Definitionen"""
+        return [{"id": self.index.ids[bit], "level": level}
+                for bit, level in self.levels_for_item(item_id)]
+
+
+def apply_to_slots(slots: List[KitSlot], resolver: PresetResolver) -> List[KitSlot]:
+    """Neue Slot-Liste; unveränderte Slots bleiben dieselben Objekte"""
+    result = []
+    for slot in slots:
+        enchantments = resolver.enchantments_for_item(slot.item.id)
+        if enchantments:
+            slot = replace(slot, enchantments=list(enchantments))
+        result.append(slot)
+    return result
+
+
+def apply_to_definitions(definitions: List[dict], preset: Union[str, EnchantmentPreset],
+                         catalog: Optional[ItemCatalog] = None) -> int:
+    """Wendet ein Preset auf Kit-Definitionen (kit_files-Format) an; liefert die Zahl geänderter Slots.
+
+    Ohne ``catalog`` wird der Katalog der Version jedes Kits verwendet.
+    """
+    if isinstance(preset, str):
+        preset = get_preset(preset)
+    resolvers: Dict[str, PresetResolver] = {}
+    changed = 0
+    for definition in definitions:
+        version = str(definition.get("version", DEFAULT_VERSION))
+        resolver = resolvers.get(version)
+        if resolver is None:
+            resolver = resolvers[version] = PresetResolver(preset, catalog or get_catalog(version))
+        for entry in definition.get("slots", []):
+            enchantments = resolver.entries_for_item(entry.get("id", ""))
+            if enchantments and enchantments != entry.get("enchantments"):
+                entry["enchantments"] = enchantments
+                changed += 1
+    return changed
@@ -0,0 +1,130 @@
+"""
+Inkrementelle Item-Suche über einem vorab gebauten Index.
+
+Indiziert werden die (deutschen) Anzeigenamen und die ``minecraft:``-IDs.
+Für Suchbegriffe ab drei Zeichen wird ein Trigramm-Index verwendet, kürzere
+Begriffe laufen über einen Wortpräfix-Index. Kategorien aus dem Feld
+``category`` sind Facetten. Findet die exakte Suche nichts, liefert eine
+unscharfe Trigramm-Suche die ähnlichsten Items (Tippfehler-tolerant).
+
+Keine Abfrage durchläuft alle Items linear oder liest items.json erneut.
+"""
+
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+from .catalog import ItemCatalog
+
+PREFIX_LENGTH = 2       # Präfix-Index für Suchbegriffe mit 1-2 Zeichen
+FUZZY_MIN_SHARE = 0.6   # Anteil gemeinsamer Trigramme für unscharfe Treffer
+FUZZY_LIMIT = 200
+
+
+def normalize(text: str) -> str:
+    """Kleinschreibung, ß -> ss, Umlaute ohne Akzente, '_' und ':' als Leerzeichen"""
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return text.replace("_", " ").replace(":", " ")
+
+
+def trigrams(text: str):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class ItemSearchIndex:
+    def __init__(self, catalog: ItemCatalog):
+        self.catalog = catalog
+        self.texts: List[str] = []
+        self.trigram_index: Dict[str, set] = {}
+        self.prefix_index: Dict[str, set] = {}
+        self.category_index: Dict[str, set] = {}
+        self._last = None   # (begriff, kategorie, ergebnis) der letzten exakten Suche
+
+        for idx, item in enumerate(catalog.items):
+            short_id = item.id.split(":", 1)[-1]
+            text = f"{normalize(item.name)} | {normalize(short_id)}"
+            self.texts.append(text)
+            for gram in trigrams(text):
+                self.trigram_index.setdefault(gram, set()).add(idx)
+            for word in text.split():
+                for length in range(1, PREFIX_LENGTH + 1):
+                    if len(word) >= length:
+                        self.prefix_index.setdefault(word[:length], set()).add(idx)
+            self.category_index.setdefault(item.category, set()).add(idx)
+
+    @property
+    def categories(self) -> List[str]:
+        return sorted(self.category_index)
+
+    def _term_candidates(self, term: str) -> set:
+        if len(term) <= PREFIX_LENGTH:
+            return self.prefix_index.get(term, set())
+        postings = [self.trigram_index.get(gram) for gram in trigrams(term)]
+        if not all(postings):
+            return set()
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+        # Trigramme garantieren keine zusammenhängende Teilzeichenkette
+        return {idx for idx in result if term in self.texts[idx]}
+
+    def _matches(self, term: str, idx: int) -> bool:
+        text = self.texts[idx]
+        if len(term) <= PREFIX_LENGTH:
+            return any(word.startswith(term) for word in text.split())
+        return term in text
+
+    def _fuzzy(self, terms: List[str], allowed: Optional[set]) -> List[int]:
+        scores = Counter()
+        total = 0
+        for term in terms:
+            grams = trigrams(term) or {term}
+            total += len(grams)
+            for gram in grams:
+                for idx in self.trigram_index.get(gram, ()):
+                    scores[idx] += 1
+        if not total:
+            return []
+        needed = max(1, int(total * FUZZY_MIN_SHARE))
+        hits = [(score, idx) for idx, score in scores.items()
+                if score >= needed and (allowed is None or idx in allowed)]
+        hits.sort(key=lambda hit: (-hit[0], hit[1]))
+        return [idx for _, idx in hits[:FUZZY_LIMIT]]
+
+    def search(self, query: str = "", category: Optional[str] = None) -> Sequence[int]:
+        """Katalog-Indizes der Treffer (exakt in Katalogreihenfolge, unscharf nach Ähnlichkeit)"""
+        terms = normalize(query).split()
+        allowed = self.category_index.get(category, set()) if category else None
+
+        if not terms:
+            self._last = None
+            return sorted(allowed) if allowed is not None else range(len(self.texts))
+
+        # Inkrementell: verlängerter Suchbegriff filtert nur das vorige Ergebnis.
+        # Nur sicher, wenn die vorigen Begriffe Teilzeichenketten-Suchen waren.
+        joined = " ".join(terms)
+        last = self._last
+        if (last and last[1] == category and joined.startswith(last[0])
+                and all(len(term) > PREFIX_LENGTH for term in last[0].split())):
+            result = [idx for idx in last[2] if all(self._matches(term, idx) for term in terms)]
+        else:
+            candidates = None
+            for term in sorted(terms, key=len, reverse=True):
+                found = self._term_candidates(term)
+                candidates = found if candidates is None else candidates & found
+                if not candidates:
+                    break
+            if candidates and allowed is not None:
+                candidates = candidates & allowed
+            result = sorted(candidates) if candidates else []
+
+        if result:
+            self._last = (joined, category, result)
+            return result
+
+        self._last = None
+        return self._fuzzy(terms, allowed)
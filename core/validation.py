@@ -0,0 +1,271 @@
+"""
+Stapel-Validierung vieler Kits mit maschinenlesbarem Report.
+
+Alle Regeln an einer Stelle:
+
+* ``unknown_item`` / ``unknown_enchantment``: ID fehlt im Katalog der Version
+* ``slot_range`` / ``slot_duplicate`` / ``slot_rule``: Slot-Nummer, Doppelbelegung,
+  Platzierungsregeln (``PlacementTable``)
+* ``stack_size``: Anzahl außerhalb 1..max_stack
+* ``enchant_level``: Stufe außerhalb 1..max_level
+* ``enchant_not_applicable``: Verzauberung passt nicht zur Item-Kategorie
+* ``enchant_conflict``: kollidierende Verzauberungen (jedes Paar einmal)
+
+Die Kits werden nicht einzeln geprüft, sondern zuerst in Spalten (Slot-Nummer,
+Item-Zeile, Anzahl, Verzauberungs-Bitset, ...) über alle Kits abgeflacht; jede
+Regel ist dann ein Durchlauf über eine Spalte gegen vorberechnete
+Katalog-Tabellen. Größere Mengen werden in Blöcken auf einen Prozess-Pool
+verteilt.
+
+Verwendung:
+    report = validate_files(Path("kits").glob("*.json"), jobs=8)
+    print(report.to_json())
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from .catalog import DEFAULT_VERSION, ItemCatalog, get_catalog
+from .models import Kit
+from .placement import PlacementTable, check_rules
+
+SHULKER_SLOTS = 27
+PARALLEL_THRESHOLD = 500    # darunter lohnt sich der Prozess-Pool nicht
+
+
+@dataclass
+class ValidationIssue:
+    kit: str
+    code: str
+    message: str
+    slot: Optional[int] = None
+    item: Optional[str] = None
+    path: Optional[str] = None
+
+    def describe(self) -> str:
+        if self.slot is None:
+            return self.message
+        return f"slot {self.slot} ({self.item}): {self.message}"
+
+
+@dataclass
+class ValidationReport:
+    kits: int = 0
+    slots: int = 0
+    issues: List[ValidationIssue] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def invalid_kits(self) -> List[str]:
+        """Pfade (bzw. Namen) der Kits mit mindestens einem Fehler"""
+        return sorted({issue.path or issue.kit for issue in self.issues})
+
+    def counts(self) -> Dict[str, int]:
+        counts = {}
+        for issue in self.issues:
+            counts[issue.code] = counts.get(issue.code, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def merge(self, other: "ValidationReport"):
+        self.kits += other.kits
+        self.slots += other.slots
+        self.issues.extend(other.issues)
+
+    def to_dict(self) -> dict:
+        invalid = self.invalid_kits()
+        return {
+            "kits": self.kits,
+            "slots": self.slots,
+            "valid": self.kits - len(invalid),
+            "invalid": len(invalid),
+            "seconds": round(self.seconds, 4),
+            "counts": self.counts(),
+            "issues": [asdict(issue) for issue in self.issues],
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+
+
+class KitValidator:
+    """Prüft Kit-Definitionen (Dicts im Format von kit_files) gegen einen Katalog"""
+
+    def __init__(self, catalog: ItemCatalog, placement: PlacementTable = None):
+        self.catalog = catalog
+        self.placement = placement
+        self.enchants = catalog.enchantment_index
+
+        # Katalog als Spalten: Item-Zeile -> Eigenschaft
+        self.item_rows = {item.id: row for row, item in enumerate(catalog.items)}
+        self.max_stack = [item.max_stack for item in catalog.items]
+        self.applicable = [catalog.applicable_enchantments(item.id) for item in catalog.items]
+
+    def validate(self, kits: Iterable[dict], paths: Iterable[Optional[str]] = None) -> ValidationReport:
+        start = time.perf_counter()
+        kits = list(kits)
+        paths = list(paths) if paths is not None else [None] * len(kits)
+        names = [str(kit.get("name", f"kit{k}")) for k, kit in enumerate(kits)]
+        issues = []
+
+        def add(k, code, message, slot=None, item=None):
+            issues.append(ValidationIssue(names[k], code, message, slot, item, paths[k]))
+
+        # Abflachen: eine Zeile pro Slot über alle Kits
+        slot_kit, slot_ids, slot_items, rows, counts, masks = [], [], [], [], [], []
+        ench_slot, ench_ids, ench_levels, ench_bits = [], [], [], []
+        item_rows, enchant_bits = self.item_rows, self.enchants.index
+
+        for k, kit in enumerate(kits):
+            for entry in kit.get("slots", []):
+                s = len(slot_kit)
+                item_id = entry.get("id", "")
+                slot_kit.append(k)
+                slot_ids.append(entry.get("slot"))
+                slot_items.append(item_id)
+                rows.append(item_rows.get(item_id, -1))
+                counts.append(entry.get("count", 1))
+                mask = 0
+                for ench in entry.get("enchantments", []):
+                    bit = enchant_bits.get(ench.get("id", ""), -1)
+                    ench_slot.append(s)
+                    ench_ids.append(ench.get("id", ""))
+                    ench_levels.append(ench.get("level", 1))
+                    ench_bits.append(bit)
+                    if bit >= 0:
+                        mask |= 1 << bit
+                masks.append(mask)
+
+        # Slot-Spalten
+        seen = set()
+        placement = self.placement
+        for s, row in enumerate(rows):
+            k, slot_id, item_id = slot_kit[s], slot_ids[s], slot_items[s]
+            if row < 0:
+                add(k, "unknown_item", f"unknown item id {item_id!r}", slot_id, item_id)
+            if not isinstance(slot_id, int) or not 0 <= slot_id < SHULKER_SLOTS:
+                add(k, "slot_range", f"slot out of range 0-{SHULKER_SLOTS - 1}", slot_id, item_id)
+            else:
+                if (k, slot_id) in seen:
+                    add(k, "slot_duplicate", "slot used twice", slot_id, item_id)
+                seen.add((k, slot_id))
+                if placement is not None and not placement.is_valid(item_id, slot_id):
+                    add(k, "slot_rule", "item not allowed in this slot", slot_id, item_id)
+
+        for s, row in enumerate(rows):
+            if row >= 0 and not (isinstance(counts[s], int) and 1 <= counts[s] <= self.max_stack[row]):
+                add(slot_kit[s], "stack_size", f"count {counts[s]} exceeds max_stack {self.max_stack[row]}",
+                    slot_ids[s], slot_items[s])
+
+        # Verzauberungs-Spalten
+        max_levels = self.enchants.max_levels
+        for e, bit in enumerate(ench_bits):
+            s = ench_slot[e]
+            if bit < 0:
+                add(slot_kit[s], "unknown_enchantment", f"unknown enchantment id {ench_ids[e]!r}",
+                    slot_ids[s], slot_items[s])
+                continue
+            level = ench_levels[e]
+            if not (isinstance(level, int) and 1 <= level <= max_levels[bit]):
+                add(slot_kit[s], "enchant_level", f"{ench_ids[e]} level {level} exceeds max_level {max_levels[bit]}",
+                    slot_ids[s], slot_items[s])
+            row = rows[s]
+            if row >= 0 and not self.applicable[row] >> bit & 1:
+                add(slot_kit[s], "enchant_not_applicable", f"{ench_ids[e]} cannot be applied to this item",
+                    slot_ids[s], slot_items[s])
+
+        ids = self.enchants.ids
+        for s, mask in enumerate(masks):
+            if mask & (mask - 1):   # mindestens zwei Verzauberungen
+                for i, j in self.enchants.conflicting_pairs(mask):
+                    add(slot_kit[s], "enchant_conflict", f"{ids[i]} conflicts with {ids[j]}",
+                        slot_ids[s], slot_items[s])
+
+        return ValidationReport(kits=len(kits), slots=len(rows), issues=issues,
+                                seconds=time.perf_counter() - start)
+
+
+@lru_cache(maxsize=16)
+def get_validator(version: str = DEFAULT_VERSION) -> KitValidator:
+    """Gemeinsamer KitValidator (ohne Platzierungsregeln) je Datenversion; die
+    Katalog-Tabellen werden so nur einmal aufgebaut, auch wenn Kits einzeln
+    geprüft werden"""
+    return KitValidator(get_catalog(version))
+
+
+def _as_definition(kit: Union[Kit, dict]) -> dict:
+    if isinstance(kit, Kit):
+        from .kit_files import kit_to_dict
+        return kit_to_dict(kit)
+    return kit
+
+
+def _load_definition(path: Path) -> Union[dict, str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        data.setdefault("name", path.stem)
+        return data
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def _validate_chunk(sources: List[Union[dict, str]], slot_rules=None) -> ValidationReport:
+    """Worker: Dateien laden, nach Version gruppieren und prüfen"""
+    report = ValidationReport()
+    by_version: Dict[str, tuple] = {}
+    for source in sources:
+        path = None
+        if isinstance(source, str):
+            path = source
+            source = _load_definition(Path(path))
+            if isinstance(source, str):
+                report.kits += 1
+                report.issues.append(ValidationIssue(Path(path).stem, "unreadable", source, path=path))
+                continue
+        version = str(source.get("version", DEFAULT_VERSION))
+        kits, paths = by_version.setdefault(version, ([], []))
+        kits.append(source)
+        paths.append(path)
+
+    for version, (kits, paths) in by_version.items():
+        catalog = get_catalog(version)
+        placement = PlacementTable(catalog.slot_masks, slot_rules) if slot_rules else None
+        validator = get_validator(version) if placement is None else KitValidator(catalog, placement)
+        report.merge(validator.validate(kits, paths))
+    return report
+
+
+def validate_kits(kits: Iterable[Union[Kit, dict]], jobs: Optional[int] = None,
+                  slot_rules: Optional[Dict[int, int]] = None) -> ValidationReport:
+    """Prüft Kit-Objekte oder -Definitionen; ab PARALLEL_THRESHOLD im Prozess-Pool"""
+    return _run([_as_definition(kit) for kit in kits], jobs, slot_rules)
+
+
+def validate_files(paths: Iterable[Union[str, Path]], jobs: Optional[int] = None,
+                   slot_rules: Optional[Dict[int, int]] = None) -> ValidationReport:
+    """Prüft Kit-Dateien; die Worker lesen die Dateien selbst"""
+    return _run([str(path) for path in paths], jobs, slot_rules)
+
+
+def _run(sources: list, jobs: Optional[int], slot_rules) -> ValidationReport:
+    start = time.perf_counter()
+    # Ungültige Regeln einmal hier melden, nicht in jedem Worker
+    slot_rules = check_rules(slot_rules) or None
+    workers = jobs or os.cpu_count() or 1
+    if workers == 1 or len(sources) < PARALLEL_THRESHOLD:
+        report = _validate_chunk(sources, slot_rules)
+    else:
+        # Wenige große Blöcke: der Katalog wird pro Worker einmal geladen
+        size = -(-len(sources) // (workers * 4))
+        chunks = [sources[i:i + size] for i in range(0, len(sources), size)]
+        report = ValidationReport()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(_validate_chunk, chunks, [slot_rules] * len(chunks)):
+                report.merge(part)
+    report.seconds = time.perf_counter() - start
+    return report
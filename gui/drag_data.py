@@ -0,0 +1,79 @@
+"""
+Drag-&-Drop-Nutzlast für Items.
+
+Innerhalb des Prozesses trägt ein Drag nur einen kompakten Handle
+(``<pid>:<item_id>``) und eine Referenz auf das Item-Dict; Drop-Ziele lesen
+die Referenz direkt bzw. schlagen die ID im Katalog nach. Das vollständige
+JSON (``application/item-data``) wird erst erzeugt, wenn ein anderer Prozess
+es tatsächlich anfordert.
+"""
+
+import json
+import logging
+import os
+
+from PySide6.QtCore import QMimeData
+
+from core.catalog import get_catalog
+
+logger = logging.getLogger(__name__)
+
+MIME_ITEM_HANDLE = "application/x-mkc-item-handle"
+MIME_ITEM_DATA = "application/item-data"
+PROCESS_TAG = str(os.getpid())
+
+
+class ItemMimeData(QMimeData):
+    def __init__(self, item_data):
+        super().__init__()
+        self.item_data = item_data
+        self.setData(MIME_ITEM_HANDLE, f"{PROCESS_TAG}:{item_data.get('id', '')}".encode("utf-8"))
+        self.setText(item_data.get("name", ""))
+
+    def hasFormat(self, mime_type):
+        return mime_type == MIME_ITEM_DATA or super().hasFormat(mime_type)
+
+    def formats(self):
+        return super().formats() + [MIME_ITEM_DATA]
+
+    def retrieveData(self, mime_type, preferred_type):
+        # Volle Serialisierung nur auf Anfrage (prozessübergreifende Drops)
+        if mime_type == MIME_ITEM_DATA:
+            return json.dumps(self.item_data).encode("utf-8")
+        return super().retrieveData(mime_type, preferred_type)
+
+
+def has_item(mime_data) -> bool:
+    return mime_data.hasFormat(MIME_ITEM_HANDLE) or mime_data.hasFormat(MIME_ITEM_DATA)
+
+
+def item_id_from_mime(mime_data):
+    """Item-ID ohne JSON zu parsen (für Hover-Prüfungen); None, wenn unbekannt"""
+    if isinstance(mime_data, ItemMimeData):
+        return mime_data.item_data.get("id", "")
+    if mime_data.hasFormat(MIME_ITEM_HANDLE):
+        handle = bytes(mime_data.data(MIME_ITEM_HANDLE)).decode("utf-8")
+        return handle.split(":", 1)[1]
+    if mime_data.hasFormat(MIME_ITEM_DATA):
+        return item_from_mime(mime_data).get("id", "")
+    return None
+
+
+def item_from_mime(mime_data, catalog=None):
+    """Item-Dict aus einem Drag (Referenz, Katalog-Lookup oder JSON-Fallback).
+
+    ``catalog`` ist der Katalog des Ziel-Kits (Standard: Standardversion).
+    """
+    if isinstance(mime_data, ItemMimeData):
+        return mime_data.item_data
+
+    if mime_data.hasFormat(MIME_ITEM_HANDLE):
+        handle = bytes(mime_data.data(MIME_ITEM_HANDLE)).decode("utf-8")
+        process_tag, item_id = handle.split(":", 1)
+        item_data = (catalog or get_catalog()).item_dict(item_id)
+        if process_tag == PROCESS_TAG and item_data is not None:
+            return item_data
+
+    if mime_data.hasFormat(MIME_ITEM_DATA):
+        return json.loads(bytes(mime_data.data(MIME_ITEM_DATA)).decode("utf-8"))
+    return None
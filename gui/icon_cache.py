@@ -0,0 +1,193 @@
+"""
+Gemeinsamer Icon-Cache für Item-Liste und Inventar-Grid.
+
+Jedes PNG wird genau einmal dekodiert und direkt auf die Größen skaliert, die
+die GUI benötigt (32 px Liste, 34 px Grid). Die Pixmaps liegen im
+``QPixmapCache`` unter ``<icon>@<größe>``. Für die Item-Liste werden Icons
+über ``request()`` auf einem Worker-Thread geladen; das Signal ``icon_ready``
+meldet, wann sie bereitstehen.
+
+Liegt ein Sprite-Atlas vor (``python -m core.cli icons atlas``), werden die
+Icons aus den einmal geladenen Atlas-Blättern ausgeschnitten; einzelne
+PNG-Dateien werden dann nur noch für Icons gelesen, die im Atlas fehlen.
+"""
+
+import logging
+import os
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache
+
+from core.atlas import load_atlas_index
+
+logger = logging.getLogger(__name__)
+
+ICON_DIR = "icons"
+LIST_ICON_SIZE = 32
+SLOT_ICON_SIZE = 34
+PRESCALE_SIZES = (LIST_ICON_SIZE, SLOT_ICON_SIZE)
+CACHE_LIMIT_KB = 64 * 1024
+
+
+class IconAtlas:
+    """Atlas-Blätter werden beim ersten Zugriff einmal geladen (threadsicher)"""
+
+    def __init__(self, atlas_dir=ICON_DIR):
+        self.atlas_dir = atlas_dir
+        self.index = load_atlas_index(atlas_dir) or {"cell_size": 0, "sheets": [], "icons": {}}
+        self.cell_size = self.index["cell_size"]
+        self.sheets = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, icon_name):
+        return icon_name in self.index["icons"]
+
+    def sheet(self, sheet_no):
+        image = self.sheets.get(sheet_no)
+        if image is None:
+            with self._lock:
+                image = self.sheets.get(sheet_no)
+                if image is None:
+                    image = QImage(os.path.join(self.atlas_dir, self.index["sheets"][sheet_no]))
+                    self.sheets[sheet_no] = image
+        return image
+
+    def image(self, icon_name):
+        """Ausschnitt eines Icons oder ein leeres QImage"""
+        entry = self.index["icons"].get(icon_name)
+        if entry is None:
+            return QImage()
+        sheet_no, x, y = entry
+        return self.sheet(sheet_no).copy(x, y, self.cell_size, self.cell_size)
+
+
+def decode_icon(icon_name, sizes=PRESCALE_SIZES, icon_dir=ICON_DIR, atlas=None):
+    """Dekodiert ein Icon einmal und skaliert es auf alle Zielgrößen (threadsicher)"""
+    if not icon_name:
+        return {}
+    if atlas is not None and icon_name in atlas:
+        image = atlas.image(icon_name)
+    else:
+        image = QImage(os.path.join(icon_dir, icon_name))
+    if image.isNull():
+        return {}
+    return {
+        size: image if image.width() == size else
+        image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        for size in sizes
+    }
+
+
+class _DecodeSignals(QObject):
+    decoded = Signal(str, object)  # icon_name, {größe: QImage}
+
+
+class _DecodeTask(QRunnable):
+    def __init__(self, icon_name, signals, atlas):
+        super().__init__()
+        self.icon_name = icon_name
+        self.signals = signals
+        self.atlas = atlas
+
+    def run(self):
+        try:
+            images = decode_icon(self.icon_name, atlas=self.atlas)
+        except Exception as e:
+            logger.error(f"Icon decode error for {self.icon_name}: {e}")
+            images = {}
+        self.signals.decoded.emit(self.icon_name, images)
+
+
+class IconCache(QObject):
+    icon_ready = Signal(str)  # icon_name
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), CACHE_LIMIT_KB))
+        self.missing = set()
+        self.pending = set()
+        self.atlas = IconAtlas()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, min(4, QThreadPool.globalInstance().maxThreadCount())))
+        self._signals = _DecodeSignals()
+        # Auto-Connection: das Signal kommt aus dem Worker und wird im GUI-Thread verarbeitet
+        self._signals.decoded.connect(self._on_decoded)
+
+    @staticmethod
+    def key(icon_name, size):
+        return f"{icon_name}@{size}"
+
+    def cached(self, icon_name, size):
+        """Pixmap aus dem Cache oder None"""
+        pixmap = QPixmapCache.find(self.key(icon_name, size))
+        return pixmap if pixmap is not None and not pixmap.isNull() else None
+
+    def pixmap(self, icon_name, size):
+        """Synchroner Zugriff (z. B. für Grid-Slots); dekodiert höchstens einmal"""
+        pixmap = self.cached(icon_name, size)
+        if pixmap is not None:
+            return pixmap
+        if icon_name in self.missing:
+            return self.placeholder(size)
+
+        images = decode_icon(icon_name, tuple(set(PRESCALE_SIZES) | {size}), atlas=self.atlas)
+        self._store(icon_name, images)
+        return self.cached(icon_name, size) or self.placeholder(size)
+
+    def request(self, icon_name):
+        """Asynchrones Laden; liefert True, wenn das Icon schon im Cache liegt"""
+        if not icon_name or icon_name in self.missing:
+            return False
+        if self.cached(icon_name, LIST_ICON_SIZE) is not None:
+            return True
+        if icon_name in self.atlas:
+            # Ausschneiden aus dem Atlas ist billig genug für den GUI-Thread
+            self._store(icon_name, decode_icon(icon_name, atlas=self.atlas))
+            return self.cached(icon_name, LIST_ICON_SIZE) is not None
+        if icon_name not in self.pending:
+            self.pending.add(icon_name)
+            self.pool.start(_DecodeTask(icon_name, self._signals, self.atlas))
+        return False
+
+    def reset_missing(self):
+        """Nach einer Icon-Synchronisation fehlende Icons erneut versuchen"""
+        self.missing.clear()
+        self.atlas = IconAtlas()
+
+    def placeholder(self, size):
+        key = f"__placeholder__@{size}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(size, size)
+            pixmap.fill(Qt.transparent)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _store(self, icon_name, images):
+        if not images:
+            if icon_name not in self.missing:
+                logger.warning(f"Icon not found: {os.path.join(ICON_DIR, icon_name)}")
+            self.missing.add(icon_name)
+            return
+        for size, image in images.items():
+            QPixmapCache.insert(self.key(icon_name, size), QPixmap.fromImage(image))
+
+    def _on_decoded(self, icon_name, images):
+        self.pending.discard(icon_name)
+        self._store(icon_name, images)
+        if images:
+            self.icon_ready.emit(icon_name)
+
+
+_icon_cache = None
+_icon_cache_lock = threading.Lock()
+
+
+def get_icon_cache():
+    """Prozessweiter Icon-Cache (erst nach Erzeugen der QApplication aufrufen)"""
+    global _icon_cache
+    with _icon_cache_lock:
+        if _icon_cache is None:
+            _icon_cache = IconCache()
+        return _icon_cache
@@ -1,22 +1,35 @@
 from gui.enchantment_dialog import EnchantmentDialog
-from PySide6.QtWidgets import QLabel, QGridLayout, QWidget, QApplication
-from PySide6.QtCore import Qt, QMimeData, QPoint
+from core.catalog import get_catalog
+from core.history import UndoHistory
+from core.placement import PlacementTable
+from gui.icon_cache import SLOT_ICON_SIZE, get_icon_cache
+from gui.drag_data import ItemMimeData, has_item, item_from_mime, item_id_from_mime
+from PySide6.QtWidgets import QLabel, QGridLayout, QWidget
+from PySide6.QtCore import Qt, QPoint
 from PySide6.QtGui import QPixmap, QDrag, QPainter, QColor, QPen
-import json
 import logging
-import os
+from contextlib import nullcontext
 
 logger = logging.getLogger(__name__)
 
 class InventoryGrid(QWidget):
-    def __init__(self, slot_restrictions=None):
+    def __init__(self, catalog=None, slot_rules=None):
         super().__init__()
-        # Standardwert für slot_restrictions falls nicht angegeben
-        self.slot_restrictions = slot_restrictions or {}
+        self.catalog = catalog or get_catalog()
+        self.slot_rules = slot_rules
+        # Vorberechnete Platzierungstabelle; slot_rules schränkt einzelne Slots ein ({slot_id: Maske})
+        self.placement = PlacementTable(self.catalog.slot_masks, slot_rules)
         self.slots = []
+        # Undo/Redo: Slot-Deltas mit Referenzen auf die (nie veränderten) Item-Dicts
+        self.history = UndoHistory(self.apply_slot)
         self.mc_slot_map = self.create_slot_mapping()
         self.init_ui()
 
+    def set_catalog(self, catalog):
+        """Versionswechsel: Items im Grid bleiben, Platzierung gilt ab jetzt für ``catalog``"""
+        self.catalog = catalog
+        self.placement = PlacementTable(catalog.slot_masks, self.slot_rules)
+
     def create_slot_mapping(self):
         # Dictionary für die Zuordnung von GUI-Slot-IDs zu Minecraft-Slot-IDs
         return {gui_slot: mc_slot for mc_slot, gui_slot in enumerate(range(27))}
@@ -42,39 +55,106 @@ class InventoryGrid(QWidget):
             if not slot.item_data:
                 continue
                 
-            if not self.is_valid_placement(slot.item_data.get("name", ""), slot.slot_id):
+            if not self.is_valid_placement(slot.item_data.get("id", ""), slot.slot_id):
                 continue
                 
             try:
-                export_data.append({
+                entry = {
                     "slot": self.mc_slot_map[slot.slot_id],
                     "id": slot.item_data["id"],
                     "name": slot.item_data["name"],
                     "count": slot.item_data.get("count", 1)
-                })
+                }
+                if slot.item_data.get("enchantments"):
+                    entry["enchantments"] = [dict(e) for e in slot.item_data["enchantments"]]
+                export_data.append(entry)
             except Exception as e:
                 logger.error(f"Error exporting slot {slot.slot_id}: {e}")
                 
         return export_data
 
-    def is_valid_placement(self, item_name, slot_id):
-        # Immer True zurückgeben, wenn slot_restrictions leer ist oder der Name nicht gefunden wird
-        if not self.slot_restrictions or item_name not in self.slot_restrictions:
-            return True
-        return "inventory" in self.slot_restrictions.get(item_name, ["inventory"])
+    def is_valid_placement(self, item_id, slot_id):
+        return self.placement.is_valid(item_id, slot_id)
 
-    def clear_all(self):
-        for slot in self.slots:
+    def apply_slot(self, slot_id, item_data):
+        """Setzt oder leert einen Slot ohne Undo-Eintrag (auch für Undo/Redo)"""
+        slot = self.slots[slot_id]
+        if item_data is None:
             slot.clear_item()
+        else:
+            slot.set_item(item_data)
+
+    def assign(self, slot_id, item_data, label="Edit", merge_key=None):
+        """Setzt oder leert einen Slot und merkt sich die Änderung für Undo"""
+        before = self.slots[slot_id].item_data
+        self.apply_slot(slot_id, item_data)
+        self.history.record(slot_id, before, item_data, label, merge_key)
+
+    def snapshot(self):
+        """Item-Referenzen aller Slots (None = leer); die Dicts werden nicht kopiert"""
+        return tuple(slot.item_data for slot in self.slots)
+
+    def restore(self, items, history):
+        """Zeigt einen gespeicherten Tab-Zustand; nur abweichende Slots werden neu gezeichnet"""
+        for slot, item_data in zip(self.slots, items):
+            if slot.item_data is not item_data and slot.item_data != item_data:
+                self.apply_slot(slot.slot_id, item_data)
+        self.history = history
+
+    def apply_preset(self, resolver):
+        """Preset (core.presets.PresetResolver) auf alle Slots; ein Undo-Schritt"""
+        changed = 0
+        with self.history.group(f"Preset {resolver.preset.name}"):
+            for slot in self.slots:
+                if slot.is_empty():
+                    continue
+                enchantments = resolver.entries_for_item(slot.item_data.get("id", ""))
+                if enchantments and enchantments != slot.item_data.get("enchantments"):
+                    self.assign(slot.slot_id, dict(slot.item_data, enchantments=enchantments))
+                    changed += 1
+        return changed
+
+    def undo(self):
+        return self.history.undo()
+
+    def redo(self):
+        return self.history.redo()
+
+    def clear_all(self):
+        with self.history.group("Clear"):
+            for slot in self.slots:
+                if not slot.is_empty():
+                    self.assign(slot.slot_id, None)
+
+    def load_export_data(self, items):
+        """Füllt das Grid aus Export-Daten (Gegenstück zu get_export_data)"""
+        gui_slots = {mc_slot: gui_slot for gui_slot, mc_slot in self.mc_slot_map.items()}
+        with self.history.group("Load kit"):
+            self.clear_all()
+            self.place_export_entries(items, gui_slots)
+
+    def place_export_entries(self, items, gui_slots):
+        for entry in items:
+            gui_slot = gui_slots.get(entry.get("slot"))
+            item_data = self.catalog.item_dict(entry.get("id", ""))
+            if gui_slot is None or item_data is None:
+                logger.error(f"Cannot place imported item {entry.get('id')} in slot {entry.get('slot')}")
+                continue
+            item_data = dict(item_data, count=entry.get("count", 1))
+            if entry.get("name"):
+                item_data["name"] = entry["name"]
+            if entry.get("enchantments"):
+                item_data["enchantments"] = [dict(e) for e in entry["enchantments"]]
+            self.assign(gui_slot, item_data)
 
     def add_item_to_first_valid_slot(self, item_data):
         if not item_data:
             return
             
-        item_name = item_data.get("name", "")
+        item_id = item_data.get("id", "")
         for slot in self.slots:
-            if slot.is_empty() and self.is_valid_placement(item_name, slot.slot_id):
-                slot.set_item(item_data)
+            if slot.is_empty() and self.is_valid_placement(item_id, slot.slot_id):
+                self.assign(slot.slot_id, dict(item_data), "Add item")
                 break
 
 class InventorySlot(QLabel):
@@ -102,17 +182,15 @@ class InventorySlot(QLabel):
         """)
 
     def dragEnterEvent(self, event):
-        if event.mimeData().hasFormat("application/item-data"):
+        if has_item(event.mimeData()):
             try:
-                item_data = json.loads(event.mimeData().data("application/item-data").data().decode())
-                # Überprüfen, ob parent() den slot_restrictions hat und ob valid ist
+                # Nur die ID wird benötigt - kein JSON beim Überfahren der Slots
+                item_id = item_id_from_mime(event.mimeData())
                 valid = True
                 parent_widget = self.parent()
                 
-                if parent_widget and hasattr(parent_widget, "slot_restrictions"):
-                    item_name = item_data.get("name", "")
-                    if item_name in parent_widget.slot_restrictions:
-                        valid = "inventory" in parent_widget.slot_restrictions.get(item_name, ["inventory"])
+                if parent_widget and hasattr(parent_widget, "is_valid_placement"):
+                    valid = parent_widget.is_valid_placement(item_id, self.slot_id)
                 
                 self.set_highlight(valid)
                 if valid:
@@ -136,21 +214,24 @@ class InventorySlot(QLabel):
     def dropEvent(self, event):
         self.set_highlight(False)
         try:
+            # Ablegen auf dem eigenen Slot ist kein Verschieben
+            if event.source() is self:
+                event.ignore()
+                return
+
             # Versuche zuerst das spezifische Format
-            if event.mimeData().hasFormat("application/item-data"):
-                item_data = json.loads(event.mimeData().data("application/item-data").data().decode())
+            if has_item(event.mimeData()):
+                item_data = item_from_mime(event.mimeData(), getattr(self.parent(), "catalog", None))
                 
                 # Prüfe Platzierungsregeln
                 valid = True
                 parent_widget = self.parent()
                 
-                if parent_widget and hasattr(parent_widget, "slot_restrictions") and parent_widget.slot_restrictions:
-                    item_name = item_data.get("name", "")
-                    if item_name in parent_widget.slot_restrictions:
-                        valid = "inventory" in parent_widget.slot_restrictions.get(item_name, [])
+                if parent_widget and hasattr(parent_widget, "is_valid_placement"):
+                    valid = parent_widget.is_valid_placement(item_data.get("id", ""), self.slot_id)
                 
                 if valid:
-                    self.set_item(item_data)
+                    self.assign(dict(item_data), "Drop")
                     event.accept()
                 else:
                     event.ignore()
@@ -158,28 +239,21 @@ class InventorySlot(QLabel):
             # Fallback für Text-Format
             elif event.mimeData().hasText():
                 item_name = event.mimeData().text()
-                main_window = None
-                
-                # Versuche, zum MainWindow zu navigieren
-                current = self
-                while current:
-                    if hasattr(current, "items_db"):
-                        main_window = current
-                        break
-                    current = current.parent()
+                catalog = getattr(self.parent(), "catalog", None) or get_catalog()
                 
-                # Versuche, Item aus der items_db zu bekommen
-                if main_window and hasattr(main_window, "items_db") and item_name in main_window.items_db:
-                    self.set_item(main_window.items_db[item_name])
+                # Versuche, Item über den Katalog (Anzeigename oder ID) zu bekommen
+                item = catalog.get_by_name(item_name) or catalog.get(item_name)
+                if item:
+                    self.assign(dict(catalog.item_dict(item.id)), "Drop")
                     event.accept()
                 else:
                     # Minimales Item-Objekt erstellen
-                    self.set_item({
+                    self.assign({
                         "name": item_name,
                         "id": f"minecraft:{item_name.lower().replace(' ', '_')}",
                         "icon": f"{item_name.lower().replace(' ', '_')}.png",
                         "count": 1
-                    })
+                    }, "Drop")
                     event.accept()
             else:
                 event.ignore()
@@ -187,6 +261,16 @@ class InventorySlot(QLabel):
             logger.error(f"Drop failed: {str(e)}")
             event.ignore()
 
+    def assign(self, item_data, label="Edit", merge_key=None):
+        """Setzt/leert den Slot über das Grid (mit Undo-Eintrag), sonst direkt"""
+        grid = self.parent()
+        if grid is not None and hasattr(grid, "assign"):
+            grid.assign(self.slot_id, item_data, label, merge_key)
+        elif item_data is None:
+            self.clear_item()
+        else:
+            self.set_item(item_data)
+
     def set_item(self, item_data):
         self.item_data = item_data
         try:
@@ -199,15 +283,9 @@ class InventorySlot(QLabel):
         try:
             if not self.item_data:
                 return QPixmap()
-                
-            icon_path = os.path.join("icons", self.item_data.get("icon", ""))
-            if os.path.exists(icon_path):
-                pixmap = QPixmap(icon_path)
-            else:
-                # Fallback-Icon verwenden oder ein leeres Pixmap erstellen
-                pixmap = QPixmap(32, 32)
-                pixmap.fill(Qt.transparent)
-            return pixmap.scaled(34, 34, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+            # Bereits auf Slot-Größe skaliert; fehlende Icons liefern einen leeren Platzhalter
+            return get_icon_cache().pixmap(self.item_data.get("icon", ""), SLOT_ICON_SIZE)
         except Exception as e:
             logger.error(f"Icon error: {str(e)}")
             return QPixmap()
@@ -217,6 +295,9 @@ class InventorySlot(QLabel):
         self.clear()
         self.update_style()
 
+    def is_empty(self):
+        return self.item_data is None
+
     def set_highlight(self, state):
         self.highlight = state
         self.update()
@@ -257,46 +338,38 @@ class InventorySlot(QLabel):
     def mousePressEvent(self, event):
         if self.item_data and event.button() == Qt.LeftButton:
             self.start_drag(event)
+        elif self.item_data and event.button() == Qt.RightButton:
+            self.edit_item_enchantments()
         else:
             super().mousePressEvent(event)
 
-    def start_drag(self, widget, point):
-    """Start drag operation with proper rendering."""
-    try:
-        # Create mime data with item information
-        mime_data = QMimeData()
-        item_data_str = json.dumps(widget.item_data)
-        mime_data.setData("application/minecraft-item", QByteArray(item_data_str.encode()))
-        
-        # Create drag object
-        drag = QDrag(self)
-        drag.setMimeData(mime_data)
-        
-        # Create pixmap for drag icon
-        pixmap = QPixmap(widget.size())
-        pixmap.fill(Qt.transparent)
-        
-        # Use a temporary device to render
-        painter = QPainter(pixmap)
-        widget.render(painter, QPoint(0, 0))
-        painter.end()  # Must end the painter before setting the pixmap
-        
-        drag.setPixmap(pixmap)
-        drag.setHotSpot(QPoint(pixmap.width() // 2, pixmap.height() // 2))
-        
-        # Execute drag
-        result = drag.exec_(Qt.CopyAction | Qt.MoveAction)
-        
-        if result == Qt.MoveAction:
-            # Clear the source if it was a move operation
-            self.clear_slot(widget)
-            
-    except Exception as e:
-        logging.error(f"Drag start error: {str(e)}")
-
-def edit_item_enchantments(self, item_data):
-    """Edit enchantments for a selected item."""
-    dialog = EnchantmentDialog(self, item_data)
-    if dialog.exec_():
-        return dialog.item_data
-    return item_data
\ No newline at end of file
+    def start_drag(self, event):
+        """Startet einen Drag mit dem Item dieses Slots"""
+        try:
+            mime_data = ItemMimeData(self.item_data)
+
+            drag = QDrag(self)
+            drag.setMimeData(mime_data)
+
+            pixmap = self.pixmap()
+            if pixmap and not pixmap.isNull():
+                drag.setPixmap(pixmap)
+                drag.setHotSpot(QPoint(pixmap.width() // 2, pixmap.height() // 2))
+
+            # Drop auf dem Ziel und Leeren der Quelle sind ein Undo-Schritt
+            history = getattr(self.parent(), "history", None)
+            with history.group("Move") if history is not None else nullcontext():
+                result = drag.exec(Qt.CopyAction | Qt.MoveAction, Qt.MoveAction)
+                if result == Qt.MoveAction:
+                    self.assign(None)
+        except Exception as e:
+            logger.error(f"Drag start error: {str(e)}")
+
+    def edit_item_enchantments(self):
+        """Öffnet den Verzauberungsdialog für das Item in diesem Slot"""
+        if not self.item_data:
+            return
+        # Kopie bearbeiten: das alte Item-Dict bleibt als Undo-Zustand unverändert
+        dialog = EnchantmentDialog.instance(self.window())
+        if dialog.edit(dict(self.item_data), getattr(self.parent(), "catalog", None)):
+            self.assign(dialog.item_data, "Edit enchantments", merge_key=("enchant", self.slot_id))
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""
+Virtualisiertes Listenmodell über dem Item-Katalog.
+
+Das Modell hält nur eine Liste von Katalog-Indizes; Text, Icon und Tooltip
+werden erst in ``data()`` erzeugt, also nur für sichtbare Zeilen. Icons
+werden dabei asynchron über den Icon-Cache angefordert.
+"""
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+from PySide6.QtGui import QIcon
+
+from gui.icon_cache import LIST_ICON_SIZE, get_icon_cache
+
+
+class ItemListModel(QAbstractListModel):
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.rows = range(len(catalog.items))   # Katalog-Indizes der sichtbaren Zeilen
+        self.icon_cache = get_icon_cache()
+        self.icon_cache.icon_ready.connect(self.on_icon_ready)
+        self.waiting = {}  # {icon_name: set(row)}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def item_at(self, row):
+        return self.catalog.items[self.rows[row]]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.rows):
+            return None
+        item = self.item_at(index.row())
+
+        if role == Qt.DisplayRole:
+            return item.name
+        if role == Qt.DecorationRole:
+            return self.icon_for(item.icon, index.row())
+        if role == Qt.ToolTipRole:
+            return f"{item.name}\n{item.id}\n{item.category} · Stack {item.max_stack}"
+        if role == Qt.UserRole:
+            return self.catalog.item_dict(item.id)
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def icon_for(self, icon_name, row):
+        if self.icon_cache.request(icon_name):
+            return QIcon(self.icon_cache.cached(icon_name, LIST_ICON_SIZE))
+        if icon_name and icon_name not in self.icon_cache.missing:
+            self.waiting.setdefault(icon_name, set()).add(row)
+        return None
+
+    def on_icon_ready(self, icon_name):
+        rows = self.waiting.pop(icon_name, None)
+        if not rows:
+            return
+        for row in rows:
+            if row < len(self.rows):
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+    def refresh_icons(self):
+        """Alle Icons neu anfordern (z. B. nach einer Icon-Synchronisation)"""
+        self.waiting.clear()
+        if self.rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self.rows) - 1), [Qt.DecorationRole])
+
+    def set_catalog(self, catalog):
+        """Anderer Katalog (Versionswechsel); zeigt alle Items"""
+        self.beginResetModel()
+        self.catalog = catalog
+        self.rows = range(len(catalog.items))
+        self.waiting.clear()
+        self.endResetModel()
+
+    def set_rows(self, rows):
+        """Ersetzt die sichtbaren Zeilen durch eine Folge von Katalog-Indizes"""
+        self.beginResetModel()
+        self.rows = rows
+        self.waiting.clear()
+        self.endResetModel()
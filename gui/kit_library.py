@@ -0,0 +1,105 @@
+"""
+Seitenweise geladene Ansicht der Kit-Bibliothek (core/kit_store.py).
+
+Das Modell holt über ``canFetchMore``/``fetchMore`` jeweils eine Seite aus
+der Datenbank, sobald die Liste ans Ende gescrollt wird. Der Filter nimmt
+eine Item- oder Verzauberungs-ID (oder einen Anzeigenamen) und nutzt die
+Indizes der Datenbank.
+"""
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, Signal
+from PySide6.QtWidgets import QLineEdit, QListView, QVBoxLayout, QWidget
+
+from core.kit_store import PAGE_SIZE
+
+
+class KitLibraryModel(QAbstractListModel):
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.rows = []          # [(name, version, slot_anzahl)]
+        self.exhausted = False
+        self.item_id = None
+        self.enchant_id = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.rows):
+            return None
+        name, version, slot_count = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == Qt.ToolTipRole:
+            return f"{name}\n{version} · {slot_count} Slots"
+        if role == Qt.UserRole:
+            return name
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        after = self.rows[-1][0] if self.rows else ""
+        page = self.store.page(after, PAGE_SIZE, self.item_id, self.enchant_id)
+        self.exhausted = len(page) < PAGE_SIZE
+        if page:
+            self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(page) - 1)
+            self.rows.extend(page)
+            self.endInsertRows()
+
+    def set_filter(self, item_id=None, enchant_id=None):
+        self.beginResetModel()
+        self.item_id, self.enchant_id = item_id, enchant_id
+        self.rows = []
+        self.exhausted = False
+        self.endResetModel()
+
+    def refresh(self):
+        self.set_filter(self.item_id, self.enchant_id)
+
+
+class KitLibraryPanel(QWidget):
+    kit_activated = Signal(str)
+
+    def __init__(self, store, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.model = KitLibraryModel(store, self)
+
+        self.filter_box = QLineEdit()
+        self.filter_box.setPlaceholderText("Item/Verzauberung, z. B. minecraft:elytra")
+        self.filter_box.setClearButtonEnabled(True)
+        self.filter_box.editingFinished.connect(self.apply_filter)
+
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)
+        self.view.doubleClicked.connect(lambda index: self.kit_activated.emit(index.data(Qt.UserRole)))
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.filter_box)
+        layout.addWidget(self.view)
+
+    def apply_filter(self):
+        text = self.filter_box.text().strip()
+        if not text:
+            self.model.set_filter()
+            return
+        full_id = text if ":" in text else f"minecraft:{text}"
+        item = self.catalog.get(full_id) or self.catalog.get_by_name(text)
+        if item is not None:
+            self.model.set_filter(item_id=item.id)
+            return
+        enchantment = self.catalog.get_enchantment(full_id) or next(
+            (e for e in self.catalog.enchantments if e.name == text), None)
+        # Unbekannter Begriff: als Item-ID filtern (liefert dann eine leere Liste)
+        if enchantment is not None:
+            self.model.set_filter(enchant_id=enchantment.id)
+        else:
+            self.model.set_filter(item_id=full_id)
+
+    def refresh(self):
+        self.model.refresh()
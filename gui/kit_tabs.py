@@ -0,0 +1,172 @@
+"""
+Tabs für mehrere offene Kits über einem einzigen InventoryGrid.
+
+Die Tabs selbst verwaltet der KitManager (``kits``, ``tab_names``,
+``current_tab``); die Leiste zeigt sie nur an, Tab-Daten ist die Tab-ID des
+KitManagers. Das Grid zeigt immer den aktiven Tab: beim Umschalten werden
+seine Items als KitSlots in den KitManager zurückgeschrieben und die Slots
+des neuen Tabs ins Grid geladen, wobei nur abweichende Slots neu gezeichnet
+werden. Jeder Tab behält seine eigene Undo-Historie des Grids.
+
+KitSlots werden nie verändert, sondern ersetzt (siehe core/kit_manager.py).
+Ein duplizierter Tab teilt sich deshalb alle Slots mit dem Original, bis ein
+Slot bearbeitet wird.
+"""
+
+from dataclasses import replace
+from typing import List
+
+from PySide6.QtWidgets import QTabBar
+
+from core.history import UndoHistory
+from core.models import Enchantment, KitSlot, MinecraftItem
+
+
+def slots_from_items(items, catalog) -> List[KitSlot]:
+    """Grid-Inhalt (item_data je Slot) -> KitSlots; Items außerhalb des Katalogs bleiben erhalten"""
+    slots = []
+    for slot_id, item_data in enumerate(items):
+        if not item_data:
+            continue
+        item_id = item_data["id"]
+        item = catalog.get(item_id) or MinecraftItem(
+            id=item_id, name=item_data.get("name", item_id), category=item_data.get("category", ""),
+            max_stack=item_data.get("max_stack", 64), slots=item_data.get("slots", ["inventory"]),
+            icon=item_data.get("icon", ""), enchantable=item_data.get("enchantable", False))
+        enchantments = []
+        for entry in item_data.get("enchantments") or ():
+            level = int(entry.get("level", 1))
+            definition = catalog.get_enchantment(entry["id"]) or Enchantment(
+                id=entry["id"], name=entry["id"], max_level=level, conflicts=[])
+            enchantments.append(definition if definition.level == level else
+                                replace(definition, level=level))
+        name = item_data.get("name")
+        slots.append(KitSlot(item=item, slot_id=slot_id, enchantments=enchantments,
+                             count=item_data.get("count", 1),
+                             display_name=name if name and name != item.name else None))
+    return slots
+
+
+def items_from_slots(slots, catalog, size: int) -> tuple:
+    """KitSlots -> item_data je Slot (None = leer), Gegenstück zu slots_from_items"""
+    items = [None] * size
+    for slot in slots:
+        base = catalog.item_dict(slot.item.id) or {
+            "id": slot.item.id, "name": slot.item.name, "category": slot.item.category,
+            "max_stack": slot.item.max_stack, "slots": slot.item.slots, "icon": slot.item.icon,
+            "enchantable": slot.item.enchantable}
+        item_data = dict(base, count=slot.count)
+        if slot.display_name:
+            item_data["name"] = slot.display_name
+        if slot.enchantments:
+            item_data["enchantments"] = [{"id": e.id, "level": e.level} for e in slot.enchantments]
+        if 0 <= slot.slot_id < size:
+            items[slot.slot_id] = item_data
+    return tuple(items)
+
+
+class KitTabBar(QTabBar):
+    def __init__(self, grid, kit_manager, parent=None):
+        super().__init__(parent)
+        self.grid = grid
+        self.kit_manager = kit_manager
+        self.histories = {}             # {tab_id: UndoHistory des Grids}
+        self.active = None              # Tab-ID, deren Inhalt das Grid zeigt
+        self.setTabsClosable(True)
+        self.setMovable(True)
+        self.setExpanding(False)
+        self.currentChanged.connect(self.show_tab)
+        self.tabCloseRequested.connect(self.close_tab)
+        # Der aktive Tab übernimmt die Undo-Historie, die das Grid schon hat
+        self.histories[kit_manager.current_tab] = grid.history
+        for tab_id in kit_manager.kits:
+            self._add_tab(tab_id)
+        self.select(kit_manager.current_tab)
+
+    def _add_tab(self, tab_id: int) -> int:
+        # Ohne Signale: currentChanged käme sonst vor setTabData
+        blocked = self.blockSignals(True)
+        try:
+            index = self.addTab(self.kit_manager.tab_names.get(tab_id, "Kit"))
+            self.setTabData(index, tab_id)
+        finally:
+            self.blockSignals(blocked)
+        return index
+
+    def index_of(self, tab_id: int) -> int:
+        for index in range(self.count()):
+            if self.tabData(index) == tab_id:
+                return index
+        return -1
+
+    def select(self, tab_id: int):
+        index = self.index_of(tab_id)
+        if index == self.currentIndex():
+            self.show_tab(index)
+        else:
+            self.setCurrentIndex(index)
+
+    @property
+    def active_name(self) -> str:
+        return self.kit_manager.tab_names.get(self.active, "Kit")
+
+    def store_active(self):
+        """Grid-Inhalt als KitSlots in den aktiven Tab des KitManagers zurückschreiben"""
+        if self.active is None or self.active not in self.kit_manager.kits:
+            return
+        old = self.kit_manager.kits[self.active]
+        slots = slots_from_items(self.grid.snapshot(), self.grid.catalog)
+        # Unveränderte Slots behalten ihren KitSlot (geteilt mit Duplikaten)
+        self.kit_manager.kits[self.active] = {
+            slot.slot_id: old[slot.slot_id] if old.get(slot.slot_id) == slot else slot for slot in slots}
+        self.histories[self.active] = self.grid.history
+
+    def show_tab(self, index: int):
+        tab_id = self.tabData(index)
+        if tab_id is None or tab_id == self.active:
+            return
+        self.store_active()
+        self.kit_manager.switch_tab(tab_id)
+        history = self.histories.get(tab_id)
+        if history is None:
+            history = self.histories[tab_id] = UndoHistory(self.grid.apply_slot)
+        items = items_from_slots(self.kit_manager.slots(tab_id), self.grid.catalog, len(self.grid.slots))
+        self.grid.restore(items, history)
+        self.active = tab_id
+
+    def new_tab(self, name: str = "Kit", slots: List[KitSlot] = None) -> int:
+        self.store_active()
+        tab_id = self.kit_manager.new_tab(name, slots)
+        self._add_tab(tab_id)
+        self.select(tab_id)
+        return tab_id
+
+    def duplicate_tab(self) -> int:
+        """Kopie des aktiven Tabs; die KitSlots werden geteilt, nicht kopiert"""
+        self.store_active()
+        tab_id = self.kit_manager.duplicate_tab(self.active)
+        self._add_tab(tab_id)
+        self.select(tab_id)
+        return tab_id
+
+    def rename_active(self, name: str):
+        self.kit_manager.tab_names[self.active] = name
+        self.setTabText(self.index_of(self.active), name)
+
+    def close_tab(self, index: int):
+        tab_id = self.tabData(index)
+        if tab_id == self.active:
+            # Der geschlossene Tab darf beim Umschalten nicht mehr gesichert werden
+            self.active = None
+        self.kit_manager.close_tab(tab_id)
+        self.histories.pop(tab_id, None)
+        blocked = self.blockSignals(True)
+        try:
+            self.removeTab(index)
+        finally:
+            self.blockSignals(blocked)
+        if self.count() == 0:
+            # Letzter Tab: der KitManager hat einen leeren angelegt
+            self._add_tab(self.kit_manager.current_tab)
+        if self.active is None:
+            self.show_tab(self.currentIndex())
@@ -1,9 +1,10 @@
-from PySide6.QtWidgets import (QMainWindow, QListWidget, QWidget, 
+from PySide6.QtWidgets import (QMainWindow, QListView, QWidget, 
                               QHBoxLayout, QVBoxLayout, QToolBar, 
-                              QFileDialog, QListWidgetItem, QMessageBox,
-                              QApplication)
-from PySide6.QtCore import Qt, QSize, QMimeData, QPoint
-from PySide6.QtGui import QIcon, QDrag, QAction, QPixmap
+                              QFileDialog, QMessageBox, QLineEdit,
+                              QComboBox, QApplication, QDockWidget, QInputDialog,
+                              QMenu, QToolButton)
+from PySide6.QtCore import Qt, QSize, QPoint, Signal
+from PySide6.QtGui import QIcon, QDrag, QAction, QKeySequence
 
 # Relativen Import durch absoluten Import ersetzen
 import sys
@@ -11,11 +12,23 @@ import os
 # Füge den übergeordneten Ordner zum Suchpfad hinzu
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from gui.inventory_grid import InventoryGrid
+from gui.icon_cache import LIST_ICON_SIZE, get_icon_cache
+from gui.item_model import ItemListModel
+from gui.drag_data import ItemMimeData
+from gui.kit_library import KitLibraryPanel
+from gui.kit_tabs import KitTabBar
+from core.catalog import get_catalog, get_registry
+from core.search import ItemSearchIndex
+from core.archive import export_kit_library, iter_kit_files
+from core.exporters import give_syntax, save_items_nbt
+from core.kit_files import kit_to_export_data
+from core.kit_manager import KitManager
+from core.kit_store import KitStore
+from core.nbt_import import import_nbt_file
+from core.presets import PresetResolver, load_presets
 
-import json
 import logging
-import nbtlib
-from nbtlib.tag import Compound, List, Int, String
+import threading
 
 # Konfiguriere Logging
 logging.basicConfig(level=logging.DEBUG, 
@@ -24,10 +37,15 @@ logging.basicConfig(level=logging.DEBUG,
 logger = logging.getLogger(__name__)
 
 class MainWindow(QMainWindow):
+    icons_synced = Signal(object)  # core.icon_sync.SyncResult
+
     def __init__(self):
         super().__init__()
-        self.items_db = {}
-        self.slot_restrictions = {}
+        self.catalog = get_catalog()
+        self.search_index = ItemSearchIndex(self.catalog)
+        self.search_indexes = {self.catalog.version: self.search_index}
+        self.icon_cache = get_icon_cache()
+        self.kit_manager = KitManager(self.catalog, KitStore())
         self.init_ui()
         self.load_items()
 
@@ -48,7 +66,63 @@ class MainWindow(QMainWindow):
             export_action.setIcon(QIcon("assets/export_icon.png"))
         export_action.triggered.connect(self.export_shulker)
         toolbar.addAction(export_action)
+
+        # Datenversion; bereits geladene Versionen werden nicht neu gelesen
+        self.version_box = QComboBox()
+        self.version_box.addItems(get_registry().versions() or [self.catalog.version])
+        self.version_box.setCurrentText(self.catalog.version)
+        self.version_box.setToolTip("Minecraft-Datenversion")
+        self.version_box.currentTextChanged.connect(self.set_version)
+        toolbar.addWidget(self.version_box)
+
+        # Weitere Kits in Tabs (teilen sich das eine Grid)
+        new_tab_action = QAction("New Tab", self)
+        new_tab_action.setShortcut(QKeySequence.AddTab)
+        new_tab_action.triggered.connect(lambda: self.kit_tabs.new_tab())
+        toolbar.addAction(new_tab_action)
+
+        duplicate_tab_action = QAction("Duplicate Tab", self)
+        duplicate_tab_action.triggered.connect(lambda: self.kit_tabs.duplicate_tab())
+        toolbar.addAction(duplicate_tab_action)
+
+        # Grid in der Kit-Bibliothek speichern
+        save_kit_action = QAction("Save Kit", self)
+        save_kit_action.triggered.connect(self.save_kit)
+        toolbar.addAction(save_kit_action)
+
+        # Vorhandene Shulker-.nbt-Datei ins Grid laden
+        import_action = QAction("Import Shulker Box", self)
+        import_action.triggered.connect(self.import_shulker)
+        toolbar.addAction(import_action)
+
+        # Kit-Bibliothek (viele Kit-Dateien) in ein Archiv exportieren
+        library_action = QAction("Export Kit Library", self)
+        library_action.triggered.connect(self.export_kit_library)
+        toolbar.addAction(library_action)
         
+        # Verzauberungs-Preset auf alle Slots des Grids (data/presets.json)
+        preset_menu = QMenu(self)
+        for name, preset in load_presets().items():
+            action = preset_menu.addAction(name)
+            action.setToolTip(preset.description)
+            action.triggered.connect(lambda checked=False, preset=preset: self.apply_preset_to_all(preset))
+        preset_button = QToolButton(self)
+        preset_button.setText("Preset to All")
+        preset_button.setMenu(preset_menu)
+        preset_button.setPopupMode(QToolButton.InstantPopup)
+        toolbar.addWidget(preset_button)
+
+        # Undo/Redo (Ctrl+Z / Ctrl+Y)
+        undo_action = QAction("Undo", self)
+        undo_action.setShortcut(QKeySequence.Undo)
+        undo_action.triggered.connect(self.inventory_undo)
+        toolbar.addAction(undo_action)
+
+        redo_action = QAction("Redo", self)
+        redo_action.setShortcuts([QKeySequence.Redo, QKeySequence("Ctrl+Y")])
+        redo_action.triggered.connect(self.inventory_redo)
+        toolbar.addAction(redo_action)
+
         # Clear Action
         clear_action = QAction("Clear Inventory", self)
         if os.path.exists("assets/clear_icon.png"):
@@ -62,59 +136,113 @@ class MainWindow(QMainWindow):
         main_widget = QWidget()
         layout = QHBoxLayout()
         
-        # Item List
-        self.item_list = DraggableListWidget(self)
+        # Item List (Zeilen, Icons und Tooltips entstehen erst beim Anzeigen)
+        self.item_model = ItemListModel(self.catalog, self)
+        self.item_list = DraggableListView(self)
+        self.item_list.setModel(self.item_model)
         self.item_list.setDragEnabled(True)
-        self.item_list.setDragDropMode(QListWidget.DragOnly)
+        self.item_list.setDragDropMode(QListView.DragOnly)
         self.item_list.setFixedWidth(250)
-        self.item_list.setIconSize(QSize(32, 32))
+        self.item_list.setIconSize(QSize(LIST_ICON_SIZE, LIST_ICON_SIZE))
+        self.item_list.setUniformItemSizes(True)
         self.item_list.doubleClicked.connect(self.on_item_double_click)
+
+        # Suche und Kategorie-Filter über dem Index (kein Neuladen der Items)
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Suchen (Name oder ID)…")
+        self.search_box.setClearButtonEnabled(True)
+        self.search_box.textChanged.connect(self.apply_item_filter)
+
+        self.category_filter = QComboBox()
+        self.category_filter.addItem("Alle Kategorien", None)
+        for category in self.search_index.categories:
+            self.category_filter.addItem(category, category)
+        self.category_filter.currentIndexChanged.connect(self.apply_item_filter)
+
+        list_panel = QVBoxLayout()
+        list_panel.addWidget(self.search_box)
+        list_panel.addWidget(self.category_filter)
+        list_panel.addWidget(self.item_list)
+        self.search_box.setFixedWidth(250)
+        self.category_filter.setFixedWidth(250)
         
-        # Inventory Grid
-        self.inventory = InventoryGrid(self.slot_restrictions)
+        # Inventory Grid mit Tab-Leiste (inaktive Tabs haben kein eigenes Grid)
+        self.inventory = InventoryGrid(self.catalog)
+        self.kit_tabs = KitTabBar(self.inventory, self.kit_manager)
+        grid_panel = QVBoxLayout()
+        grid_panel.addWidget(self.kit_tabs)
+        grid_panel.addWidget(self.inventory)
+        grid_panel.addStretch()
         
-        layout.addWidget(self.item_list)
-        layout.addWidget(self.inventory)
+        layout.addLayout(list_panel)
+        layout.addLayout(grid_panel)
         main_widget.setLayout(layout)
         self.setCentralWidget(main_widget)
 
+        # Kit-Bibliothek: Seiten werden erst beim Scrollen geladen
+        self.kit_library = KitLibraryPanel(self.kit_manager.store, self.catalog, self)
+        self.kit_library.kit_activated.connect(self.open_kit)
+        library_dock = QDockWidget("Kit Library", self)
+        library_dock.setWidget(self.kit_library)
+        self.addDockWidget(Qt.RightDockWidgetArea, library_dock)
+
     def load_items(self):
+        if len(self.catalog) == 0:
+            data_path = os.path.join(str(self.catalog.data_dir), "items.json")
+            logger.error(f"No items in catalog: {data_path}")
+            QMessageBox.warning(self, "File not found", f"Could not find items.json at {data_path}")
+            return
+        logger.debug(f"Item list shows {len(self.catalog)} items")
+
+    def set_version(self, version):
+        if not version or version == self.catalog.version:
+            return
         try:
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            data_path = os.path.join(base_dir, "data", "1.20", "items.json")
-            
-            logger.debug(f"Loading items from: {data_path}")
-            
-            if os.path.exists(data_path):
-                with open(data_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    items = data.get("items", [])
-                    
-                    for item in items:
-                        self.add_item_to_list(item)
-                        self.slot_restrictions[item["name"]] = item.get("slots", ["inventory"])
-                        
-                logger.debug(f"Loaded {len(items)} items")
-            else:
-                logger.error(f"Items file not found: {data_path}")
-                QMessageBox.warning(self, "File not found", f"Could not find items.json at {data_path}")
+            self.catalog = get_catalog(version)
+            self.search_index = self.search_indexes.get(version)
+            if self.search_index is None:
+                self.search_index = self.search_indexes[version] = ItemSearchIndex(self.catalog)
+            self.kit_manager.catalog = self.catalog
+            self.kit_library.catalog = self.catalog
+            self.inventory.set_catalog(self.catalog)
+            self.item_model.set_catalog(self.catalog)
 
+            selected = self.category_filter.currentData()
+            self.category_filter.blockSignals(True)
+            self.category_filter.clear()
+            self.category_filter.addItem("Alle Kategorien", None)
+            for category in self.search_index.categories:
+                self.category_filter.addItem(category, category)
+            self.category_filter.setCurrentIndex(max(self.category_filter.findData(selected), 0))
+            self.category_filter.blockSignals(False)
+            self.apply_item_filter()
+            self.load_items()
         except Exception as e:
-            logger.error(f"Loading error: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed to load items.json: {str(e)}")
+            logger.error(f"Error switching to version {version}: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to switch version: {str(e)}")
 
-    def add_item_to_list(self, item):
-        list_item = QListWidgetItem(item.get("name", "Unknown Item"))
-        icon_path = os.path.join("icons", item.get("icon", ""))
-        
-        if os.path.exists(icon_path):
-            list_item.setIcon(QIcon(icon_path))
-        else:
-            logger.warning(f"Icon not found: {icon_path}")
-        
-        list_item.setData(Qt.UserRole, item)
-        self.item_list.addItem(list_item)
-        self.items_db[item["name"]] = item
+    def apply_item_filter(self):
+        rows = self.search_index.search(self.search_box.text(), self.category_filter.currentData())
+        self.item_model.set_rows(rows)
+
+    def start_icon_sync(self):
+        """Synchronisiert Icons im Hintergrund, ohne den Start zu blockieren"""
+        from core.icon_sync import sync_icons
+
+        def run():
+            try:
+                # Icons aller Versionen, damit ein Versionswechsel keine Lücken zeigt
+                self.icons_synced.emit(sync_icons())
+            except Exception as e:
+                logger.error(f"Icon sync failed: {e}")
+
+        self.icons_synced.connect(self.on_icons_synced)
+        threading.Thread(target=run, name="icon-sync", daemon=True).start()
+
+    def on_icons_synced(self, result):
+        if result.downloaded:
+            self.icon_cache.reset_missing()
+            self.item_model.refresh_icons()
 
     def export_shulker(self):
         try:
@@ -124,38 +252,13 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Empty", "Inventory is empty!")
                 return
 
-            nbt_data = self.create_nbt_structure(items)
-            self.save_nbt_file(nbt_data)
+            self.save_nbt_file(items)
             
         except Exception as e:
             logger.error(f"Export error: {str(e)}")
             QMessageBox.critical(self, "Error", f"Failed to export shulker box: {str(e)}")
 
-    def create_nbt_structure(self, items):
-        nbt_items = []
-        for item in items:
-            try:
-                item_compound = Compound({
-                    'Slot': Int(item['slot']),
-                    'id': String(item['id']),
-                    'Count': Int(item.get('count', 1))
-                })
-                
-                # Nur hinzufügen, wenn name vorhanden
-                if 'name' in item:
-                    item_compound['tag'] = Compound({
-                        'display': Compound({
-                            'Name': String(item['name'])
-                        })
-                    })
-                
-                nbt_items.append(item_compound)
-            except Exception as e:
-                logger.error(f"Error creating NBT for item {item}: {e}")
-        
-        return List(nbt_items)
-
-    def save_nbt_file(self, nbt_data):
+    def save_nbt_file(self, items):
         path, _ = QFileDialog.getSaveFileName(
             self, "Save Shulker Box", 
             os.path.expanduser("~/Desktop"), 
@@ -164,25 +267,129 @@ class MainWindow(QMainWindow):
         
         if path:
             try:
-                nbtlib.File({'Items': nbt_data}).save(path)
+                save_items_nbt(items, path, syntax=give_syntax(self.catalog.version))
                 QMessageBox.information(self, "Success", f"Shulker box saved to:\n{path}")
             except Exception as e:
                 logger.error(f"Error saving NBT file: {e}")
                 QMessageBox.critical(self, "Error", f"Failed to save NBT file: {str(e)}")
 
+    def save_kit(self):
+        name, ok = QInputDialog.getText(self, "Save Kit", "Kit name:", text=self.kit_tabs.active_name)
+        name = name.strip()
+        if not ok or not name:
+            return
+        try:
+            self.kit_tabs.store_active()
+            self.kit_manager.save_kit(name)
+            self.kit_tabs.rename_active(name)
+            self.kit_library.refresh()
+        except Exception as e:
+            logger.error(f"Error saving kit: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to save kit: {str(e)}")
+
+    def open_kit(self, name):
+        try:
+            # Mit dem Katalog der gespeicherten Version auflösen, nicht dem der GUI
+            kit = self.kit_manager.store.load_kit(name)
+            if kit is not None:
+                if kit.version != self.catalog.version:
+                    self.version_box.setCurrentText(kit.version)
+                # Bibliotheks-Kits öffnen in einem eigenen Tab
+                self.kit_tabs.new_tab(name, kit.slots)
+        except Exception as e:
+            logger.error(f"Error opening kit {name}: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to open kit: {str(e)}")
+
+    def import_shulker(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Open Shulker Box",
+            os.path.expanduser("~/Desktop"),
+            "NBT Files (*.nbt)"
+        )
+        if not path:
+            return
+
+        try:
+            kit, warnings = import_nbt_file(path, self.catalog)
+            # Ins Grid des aktiven Tabs (mit Undo), danach in den KitManager
+            self.inventory.load_export_data(kit_to_export_data(kit))
+            self.kit_tabs.store_active()
+            if warnings:
+                QMessageBox.warning(self, "Import", "Some entries were skipped:\n" + "\n".join(warnings))
+        except Exception as e:
+            logger.error(f"Error importing NBT file: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to import shulker box: {str(e)}")
+
+    def export_kit_library(self):
+        paths, _ = QFileDialog.getOpenFileNames(
+            self, "Select Kit Files",
+            os.path.expanduser("~/Desktop"),
+            "Kit Files (*.json)"
+        )
+        if not paths:
+            return
+
+        out_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Kit Library",
+            os.path.expanduser("~/Desktop/kits.zip"),
+            "Zip Archive (*.zip);;Kit Container (*.mkc)"
+        )
+        if not out_path:
+            return
+
+        try:
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            try:
+                skipped = export_kit_library(iter_kit_files(paths), out_path)
+            finally:
+                QApplication.restoreOverrideCursor()
+
+            message = f"{len(paths) - len(skipped)} of {len(paths)} kits saved to:\n{out_path}"
+            if skipped:
+                details = "\n".join(f"{name}: {errors[0]}" for name, errors in sorted(skipped.items()))
+                QMessageBox.warning(self, "Kit Library", f"{message}\n\nSkipped:\n{details}")
+            else:
+                QMessageBox.information(self, "Success", message)
+        except Exception as e:
+            logger.error(f"Error exporting kit library: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to export kit library: {str(e)}")
+
     def clear_inventory(self):
         self.inventory.clear_all()
 
-    def on_item_double_click(self):
-        current_item = self.item_list.currentItem()
-        if current_item:
-            item_data = current_item.data(Qt.UserRole)
+    def apply_preset_to_all(self, preset):
+        try:
+            changed = self.inventory.apply_preset(PresetResolver(preset, self.catalog))
+            self.statusBar().showMessage(f"{preset.name}: {changed} slot(s) enchanted", 3000)
+        except Exception as e:
+            logger.error(f"Error applying preset {preset.name}: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to apply preset: {str(e)}")
+
+    def inventory_undo(self):
+        label = self.inventory.undo()
+        if label:
+            self.statusBar().showMessage(f"Undo: {label}", 2000)
+
+    def inventory_redo(self):
+        label = self.inventory.redo()
+        if label:
+            self.statusBar().showMessage(f"Redo: {label}", 2000)
+
+    def on_item_double_click(self, index):
+        item_data = index.data(Qt.UserRole)
+        if item_data:
             self.inventory.add_item_to_first_valid_slot(item_data)
 
     def setup_styles(self):
         self.setStyleSheet("""
             QMainWindow { background: #333; }
-            QListWidget {
+            QLineEdit, QComboBox {
+                background: #404040;
+                color: white;
+                border: 1px solid #505050;
+                padding: 2px;
+            }
+            QListView {
                 background: #404040;
                 color: white;
                 border: 2px solid #505050;
@@ -202,7 +409,7 @@ class MainWindow(QMainWindow):
         """)
 
 
-class DraggableListWidget(QListWidget):
+class DraggableListView(QListView):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.drag_start_position = None
@@ -229,39 +436,25 @@ class DraggableListWidget(QListWidget):
         super().mousePressEvent(event) 
 
     def startDrag(self, event):
-        current_item = self.currentItem()
-        if not current_item:
+        current_index = self.currentIndex()
+        if not current_index.isValid():
             return
             
-        item_data = current_item.data(Qt.UserRole)
+        item_data = current_index.data(Qt.UserRole)
         if not item_data:
             return
             
-        # Erstelle Drag-Objekt
+        # Erstelle Drag-Objekt; die MIME-Daten tragen nur einen Handle auf das Item
         drag = QDrag(self)
-        mime_data = QMimeData()
-        
-        # Setze Text (einfacher Fallback)
-        mime_data.setText(item_data["name"])
-        
-        # Setze das spezialisierte Format mit allen Item-Daten
-        try:
-            json_data = json.dumps(item_data)
-            if json_data:
-                mime_data.setData(
-                    "application/item-data", 
-                    json_data.encode("utf-8")
-                )
-        except Exception as e:
-            logger.error(f"JSON serialization error: {e}")
+        mime_data = ItemMimeData(item_data)
         
-        # Icon für Drag-Anzeige
-        icon_path = os.path.join("icons", item_data.get("icon", ""))
-        if os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path).scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # Icon für Drag-Anzeige (aus dem gemeinsamen Cache, bereits skaliert)
+        icon_name = item_data.get("icon", "")
+        if icon_name and icon_name not in get_icon_cache().missing:
+            pixmap = get_icon_cache().pixmap(icon_name, LIST_ICON_SIZE)
             drag.setPixmap(pixmap)
             # Hot spot in der Mitte des Icons
-            drag.setHotSpot(QPoint(16, 16))
+            drag.setHotSpot(QPoint(LIST_ICON_SIZE // 2, LIST_ICON_SIZE // 2))
         
         # Setze MIME-Daten und führe Drag-Operation aus
         drag.setMimeData(mime_data)
@@ -0,0 +1,51 @@
+"""
+Anwendbarkeit von Verzauberungen je Item (ID-Muster statt nur Kategorie).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.catalog import get_catalog
+from core.presets import PresetResolver, get_preset
+
+
+def applicable(version, item_id):
+    catalog = get_catalog(version)
+    return set(catalog.enchantment_index.ids_of(catalog.applicable_enchantments(item_id)))
+
+
+@pytest.mark.parametrize("item_id, allowed, forbidden", [
+    ("minecraft:diamond_sword", {"minecraft:sharpness", "minecraft:looting", "minecraft:mending"},
+     {"minecraft:power", "minecraft:punch", "minecraft:flame", "minecraft:infinity", "minecraft:impaling",
+      "minecraft:riptide", "minecraft:multishot", "minecraft:quick_charge", "minecraft:efficiency"}),
+    ("minecraft:bow", {"minecraft:power", "minecraft:infinity", "minecraft:unbreaking"},
+     {"minecraft:sharpness", "minecraft:multishot", "minecraft:loyalty"}),
+    ("minecraft:crossbow", {"minecraft:multishot", "minecraft:piercing", "minecraft:quick_charge"},
+     {"minecraft:power", "minecraft:sharpness"}),
+    ("minecraft:diamond_axe", {"minecraft:sharpness", "minecraft:efficiency"}, {"minecraft:looting"}),
+    ("minecraft:diamond_boots", {"minecraft:feather_falling", "minecraft:protection"},
+     {"minecraft:respiration", "minecraft:swift_sneak"}),
+    ("minecraft:golden_apple", set(), {"minecraft:unbreaking"}),
+])
+def test_applicability_per_item(item_id, allowed, forbidden):
+    found = applicable("1.20", item_id)
+    assert allowed <= found
+    assert not forbidden & found
+
+
+def test_delta_changes_applicability():
+    assert {"minecraft:density", "minecraft:breach", "minecraft:smite"} <= applicable("1.21", "minecraft:mace")
+    assert "minecraft:density" not in applicable("1.21", "minecraft:diamond_sword")
+
+
+def test_max_all_preset_on_sword():
+    catalog = get_catalog("1.20")
+    resolver = PresetResolver(get_preset("Max All"), catalog)
+    ids = {entry["id"] for entry in resolver.entries_for_item("minecraft:diamond_sword")}
+    assert "minecraft:sharpness" in ids
+    assert not ids & {"minecraft:power", "minecraft:punch", "minecraft:flame", "minecraft:infinity",
+                      "minecraft:impaling", "minecraft:riptide", "minecraft:multishot", "minecraft:quick_charge"}
@@ -0,0 +1,50 @@
+"""
+Kommandozeile: Ausgabenamen von ``build`` und der JSON-Bericht von ``migrate``.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.cli import file_name, main, output_names
+
+
+def write_kit(path, name, version="1.20", slots=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"name": name, "version": version, "slots": slots or [
+        {"slot": 0, "id": "minecraft:diamond_sword", "count": 1}]}), encoding="utf-8")
+    return path
+
+
+def test_file_name_stays_inside_out_dir():
+    assert file_name("../evil/Kit") == "_evil_Kit"
+    assert file_name("..") == "kit"
+    assert file_name("PvP Kit") == "PvP Kit"
+
+
+def test_output_names_are_unique(tmp_path):
+    paths = [write_kit(tmp_path / "a.json", "Kit"), write_kit(tmp_path / "b.json", "kit"),
+             write_kit(tmp_path / "c.json", "Kit")]
+    (tmp_path / "d.json").write_text("{broken", encoding="utf-8")
+    assert output_names(paths + [tmp_path / "d.json"]) == ["Kit", "kit-2", "Kit-3", "d"]
+
+
+def test_build_writes_one_file_per_kit(tmp_path):
+    write_kit(tmp_path / "kits/a.json", "../Kit")
+    write_kit(tmp_path / "kits/b.json", "../Kit")
+    out = tmp_path / "out"
+    assert main(["build", str(tmp_path / "kits"), "--out", str(out), "--jobs", "1", "--format", "nbt"]) == 0
+    assert sorted(p.name for p in out.iterdir()) == ["_Kit-2.nbt", "_Kit.nbt"]
+
+
+def test_migrate_report_on_stdout_is_json(tmp_path, capsys):
+    write_kit(tmp_path / "kits/mace.json", "Mace", version="1.21",
+              slots=[{"slot": 0, "id": "minecraft:mace", "count": 1}])
+    assert main(["migrate", str(tmp_path / "kits"), "--to", "1.20", "--out", str(tmp_path / "out"),
+                 "--jobs", "1", "--report", "-"]) == 0
+    captured = capsys.readouterr()
+    report = json.loads(captured.out)
+    assert report["changes"] == {"removed_item": 1}
+    assert "removed_item" in captured.err and "1 kits migrated" in captured.err
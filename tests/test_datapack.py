@@ -0,0 +1,63 @@
+"""
+Datapack-Export: pack_format je Version und inkrementeller Export über das
+Manifest (fehlgeschlagene Kits behalten ihre Dateien, gelöschte nicht).
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.datapack import export_datapack, pack_format
+
+
+@pytest.mark.parametrize("version, expected", [
+    ("1.16", 6), ("1.16.5", 6), ("1.17.1", 7), ("1.18", 8), ("1.18.2", 9),
+    ("1.19", 10), ("1.19.4", 12), ("1.20", 15), ("1.20.2", 18), ("1.21", 48),
+])
+def test_pack_format(version, expected):
+    assert pack_format(version) == expected
+
+
+def test_pack_format_rejects_older_versions():
+    with pytest.raises(ValueError):
+        pack_format("1.15.2")
+
+
+def write_kit(path, name, item_id="minecraft:diamond_sword"):
+    path.write_text(json.dumps({"name": name, "version": "1.20",
+                                "slots": [{"slot": 0, "id": item_id, "count": 1}]}), encoding="utf-8")
+
+
+def test_failed_kit_keeps_previous_files(tmp_path):
+    kits, out = tmp_path / "kits", tmp_path / "pack"
+    kits.mkdir()
+    write_kit(kits / "a.json", "a")
+    write_kit(kits / "b.json", "b")
+    result = export_datapack(sorted(kits.iterdir()), out, version="1.20", loot_tables=True, jobs=1)
+    assert not result.failed
+    files = {p.relative_to(out).as_posix() for p in out.rglob("*") if p.is_file()}
+
+    (kits / "a.json").write_text("{broken", encoding="utf-8")
+    result = export_datapack(sorted(kits.iterdir()), out, version="1.20", loot_tables=True, jobs=1)
+    assert list(result.failed) == [str(kits / "a.json")]
+    assert result.removed == []
+    assert {p.relative_to(out).as_posix() for p in out.rglob("*") if p.is_file()} == files
+
+    (kits / "a.json").unlink()
+    result = export_datapack(sorted(kits.iterdir()), out, version="1.20", loot_tables=True, jobs=1)
+    assert sorted(result.removed) == ["data/kits/functions/kits/a.mcfunction",
+                                      "data/kits/loot_tables/kits/a.json"]
+    assert (out / "data/kits/functions/kits/b.mcfunction").exists()
+
+
+def test_name_collision_is_reported_per_kit(tmp_path):
+    write_kit(tmp_path / "a.json", "Kit A")
+    write_kit(tmp_path / "b.json", "kit_a")
+    result = export_datapack([tmp_path / "a.json", tmp_path / "b.json"], tmp_path / "pack",
+                             version="1.20", jobs=1)
+    assert list(result.failed) == [str(tmp_path / "b.json")]
+    assert "collides" in result.failed[str(tmp_path / "b.json")][0]
@@ -0,0 +1,114 @@
+"""
+Byte-identische Round-Trips des schnellen NBT-Writers (serialize_items_nbt,
+save_items_nbt) gegen den nbtlib-Pfad (create_nbt_structure + save_nbt_file).
+"""
+
+import gzip
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+nbtlib = pytest.importorskip("nbtlib")
+
+from core.exporters import (COMPONENTS, LEGACY, create_nbt_structure, generate_give_commands, save_items_nbt,
+                            save_nbt_file, serialize_items_nbt, write_items_nbt)
+
+SYNTAXES = [LEGACY, COMPONENTS]
+
+KITS = {
+    "empty": [],
+    "plain": [
+        {"slot": 0, "id": "minecraft:golden_apple", "count": 64},
+        {"slot": 26, "id": "minecraft:ender_pearl", "count": 16},
+    ],
+    "names": [
+        {"slot": 0, "id": "minecraft:diamond_sword", "name": "Diamantschwert", "count": 1},
+        {"slot": 1, "id": "minecraft:bow", "name": "Bogen \"Spezial\" – Ümläut 'x' \\", "count": 1},
+        {"slot": 2, "id": "minecraft:stick", "name": "", "count": 1},
+    ],
+    "enchantments": [
+        {"slot": 3, "id": "minecraft:diamond_chestplate", "count": 1,
+         "enchantments": [{"id": "minecraft:protection", "level": 4},
+                          {"id": "minecraft:unbreaking", "level": 3},
+                          {"id": "minecraft:mending", "level": 1}]},
+        {"slot": 4, "id": "minecraft:bow", "count": 1, "enchantments": []},
+    ],
+    "duplicate_enchantments": [
+        {"slot": 5, "id": "minecraft:diamond_sword", "count": 1,
+         "enchantments": [{"id": "minecraft:sharpness", "level": 3},
+                          {"id": "minecraft:unbreaking", "level": 3},
+                          {"id": "minecraft:sharpness", "level": 5}]},
+    ],
+    "full": [
+        {"slot": slot, "id": "minecraft:netherite_sword", "name": f"Schwert {slot}", "count": 1,
+         "enchantments": [{"id": "minecraft:sharpness", "level": 5},
+                          {"id": "minecraft:sweeping_edge", "level": 3}]}
+        for slot in range(27)
+    ],
+}
+
+
+def reference_bytes(items, syntax, tmp_path) -> bytes:
+    path = tmp_path / "reference.nbt"
+    save_nbt_file(create_nbt_structure(items, syntax), path)
+    return path.read_bytes()
+
+
+@pytest.mark.parametrize("syntax", SYNTAXES)
+@pytest.mark.parametrize("kit", sorted(KITS))
+def test_serialize_matches_nbtlib(kit, syntax, tmp_path):
+    items = KITS[kit]
+    assert serialize_items_nbt(items, syntax) == reference_bytes(items, syntax, tmp_path)
+
+
+@pytest.mark.parametrize("syntax", SYNTAXES)
+@pytest.mark.parametrize("kit", sorted(KITS))
+def test_save_uncompressed_matches_nbtlib(kit, syntax, tmp_path):
+    items = KITS[kit]
+    path = tmp_path / "fast.nbt"
+    save_items_nbt(items, path, syntax=syntax)
+    assert path.read_bytes() == reference_bytes(items, syntax, tmp_path)
+
+
+@pytest.mark.parametrize("syntax", SYNTAXES)
+@pytest.mark.parametrize("kit", sorted(KITS))
+def test_save_gzipped_matches_nbtlib(kit, syntax, tmp_path):
+    items = KITS[kit]
+    path = tmp_path / "fast.nbt"
+    save_items_nbt(items, path, gzipped=True, syntax=syntax)
+    data = path.read_bytes()
+    assert data[:2] == b"\x1f\x8b"
+    # gzip-Kopf (mtime) unterscheidet sich, der Inhalt nicht
+    assert gzip.decompress(data) == reference_bytes(items, syntax, tmp_path)
+
+    nbtlib_path = tmp_path / "nbtlib.nbt"
+    nbtlib.File({"Items": create_nbt_structure(items, syntax)}, gzipped=True).save(nbtlib_path)
+    assert gzip.decompress(nbtlib_path.read_bytes()) == gzip.decompress(data)
+    assert nbtlib.load(path) == nbtlib.load(nbtlib_path)
+
+
+@pytest.mark.parametrize("gzipped", [False, True])
+def test_write_is_reproducible(gzipped):
+    items = KITS["full"]
+    first, second = io.BytesIO(), io.BytesIO()
+    write_items_nbt(items, first, gzipped=gzipped, syntax=COMPONENTS)
+    write_items_nbt(items, second, gzipped=gzipped, syntax=COMPONENTS)
+    assert first.getvalue() == second.getvalue()
+
+
+@pytest.mark.parametrize("syntax", SYNTAXES)
+def test_round_trip_through_nbtlib(syntax, tmp_path):
+    items = KITS["names"] + KITS["enchantments"]
+    path = tmp_path / "kit.nbt"
+    save_items_nbt(items, path, syntax=syntax)
+    assert nbtlib.load(path)["Items"] == create_nbt_structure(items, syntax)
+
+
+def test_give_merges_duplicate_component_enchantments():
+    command, = generate_give_commands(KITS["duplicate_enchantments"], syntax=COMPONENTS)
+    assert command.count("minecraft:sharpness") == 1
+    assert '"minecraft:sharpness":5,"minecraft:unbreaking":3' in command
@@ -0,0 +1,105 @@
+"""
+UndoHistory: Undo/Redo über verschmolzene Edits, Gruppen und die Begrenzung
+über ``max_changes``.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core import history as history_module
+from core.history import UndoHistory
+
+
+class Grid:
+    """Minimales Gegenstück zum InventoryGrid: Slots plus Historie"""
+
+    def __init__(self, **kwargs):
+        self.slots = {}
+        self.history = UndoHistory(self.apply, **kwargs)
+
+    def apply(self, slot_id, handle):
+        if handle is None:
+            self.slots.pop(slot_id, None)
+        else:
+            self.slots[slot_id] = handle
+
+    def set(self, slot_id, handle, **kwargs):
+        before = self.slots.get(slot_id)
+        self.apply(slot_id, handle)
+        self.history.record(slot_id, before, handle, **kwargs)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(history_module, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_coalesced_edits_undo_and_redo_together(clock):
+    grid = Grid(coalesce_window=0.5)
+    grid.set(0, "a1", label="Anzahl", merge_key=("count", 0))
+    for handle in ("a2", "a3", "a4"):
+        clock.now += 0.3
+        grid.set(0, handle, label="Anzahl", merge_key=("count", 0))
+    assert len(grid.history.undo_stack) == 1 and grid.history.change_count == 1
+
+    assert grid.history.undo() == "Anzahl"
+    assert grid.slots == {}
+    assert grid.history.redo() == "Anzahl"
+    assert grid.slots == {0: "a4"}
+
+
+def test_coalescing_stops_after_window_key_change_or_undo(clock):
+    grid = Grid(coalesce_window=0.5)
+    grid.set(0, "a1", merge_key="k")
+    clock.now += 1.0
+    grid.set(0, "a2", merge_key="k")            # Fenster abgelaufen
+    grid.set(0, "a3", merge_key="other")        # anderer Schlüssel
+    assert len(grid.history.undo_stack) == 3
+
+    grid.history.undo()
+    grid.set(0, "b", merge_key="other")         # neuer Befehl, Redo verworfen
+    assert len(grid.history.undo_stack) == 3 and not grid.history.can_redo()
+    assert [grid.history.undo() for _ in range(3)] == ["Edit"] * 3
+    assert grid.slots == {}
+
+
+def test_group_undo_restores_every_slot_in_reverse():
+    grid = Grid()
+    grid.set(0, "sword")
+    with grid.history.group("Drag"):
+        grid.set(5, "sword")
+        grid.set(0, None)
+    assert grid.slots == {5: "sword"}
+    assert grid.history.undo() == "Drag"
+    assert grid.slots == {0: "sword"}
+    assert grid.history.redo() == "Drag"
+    assert grid.slots == {5: "sword"}
+
+
+def test_history_limit_drops_oldest_commands():
+    grid = Grid(max_changes=10)
+    for slot_id in range(4):
+        with grid.history.group(f"Preset {slot_id}"):
+            for offset in range(4):
+                grid.set(slot_id * 4 + offset, f"item{slot_id}")
+    # 4 Befehle mit je 4 Änderungen; nur die letzten beiden passen in 10
+    assert [c.label for c in grid.history.undo_stack] == ["Preset 2", "Preset 3"]
+    assert grid.history.change_count == 8
+    while grid.history.undo():
+        pass
+    assert sorted(grid.slots) == list(range(8))
+
+
+def test_single_command_larger_than_limit_is_kept():
+    grid = Grid(max_changes=2)
+    with grid.history.group("Leeren"):
+        for slot_id in range(5):
+            grid.set(slot_id, "x")
+    assert grid.history.can_undo() and grid.history.change_count == 5
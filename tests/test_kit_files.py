@@ -0,0 +1,39 @@
+"""
+Export-Daten aus Kits: eigene Namen nur bei display_name, gleiche Befehle aus
+KitSlots und aus Export-Daten.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.exporters import COMPONENTS, LEGACY, generate_give_command, generate_give_commands
+from core.kit_files import kit_from_dict, kit_to_dict, kit_to_export_data
+
+DEFINITION = {"name": "pvp", "version": "1.20", "slots": [
+    {"slot": 0, "id": "minecraft:diamond_sword", "name": "Diamantschwert", "count": 1,
+     "enchantments": [{"id": "minecraft:sharpness", "level": 5}]},
+    {"slot": 1, "id": "minecraft:bow", "name": "Mein Bogen", "count": 1},
+    {"slot": 2, "id": "minecraft:golden_apple", "count": 16},
+]}
+
+
+def test_export_data_names_only_custom_names():
+    items = kit_to_export_data(kit_from_dict(DEFINITION))
+    assert [item.get("name") for item in items] == [None, "Mein Bogen", None]
+
+
+def test_definition_keeps_item_names():
+    definition = kit_to_dict(kit_from_dict(DEFINITION))
+    assert [entry["name"] for entry in definition["slots"]] == ["Diamantschwert", "Mein Bogen", "Goldener Apfel"]
+    assert kit_to_dict(kit_from_dict(definition)) == definition
+
+
+@pytest.mark.parametrize("syntax", [LEGACY, COMPONENTS])
+def test_give_command_same_from_slots_and_export_data(syntax):
+    kit = kit_from_dict(DEFINITION)
+    assert (generate_give_command(kit.slots, kit.name, syntax).split("\n")
+            == generate_give_commands(kit_to_export_data(kit), kit.name, syntax))
@@ -0,0 +1,38 @@
+"""
+SQLite-Kit-Bibliothek: Speichern, Laden und doppelte Verzauberungen.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.kit_store import KitStore
+
+KIT = {"name": "PvP", "version": "1.20", "slots": [
+    {"slot": 0, "id": "minecraft:diamond_sword", "count": 1, "name": "Klinge",
+     "enchantments": [{"id": "minecraft:sharpness", "level": 3}, {"id": "minecraft:unbreaking", "level": 3},
+                      {"id": "minecraft:sharpness", "level": 5}, {"id": "minecraft:sharpness", "level": 4}]},
+    {"slot": 1, "id": "minecraft:golden_apple", "count": 16},
+]}
+
+
+def test_duplicate_enchantment_keeps_highest_level():
+    with KitStore(":memory:") as store:
+        store.save_kit(KIT)
+        sword = store.definition("PvP")["slots"][0]
+        assert sorted((e["id"], e["level"]) for e in sword["enchantments"]) == [
+            ("minecraft:sharpness", 5), ("minecraft:unbreaking", 3)]
+        assert store.kits_with_enchantment("minecraft:sharpness") == ["PvP"]
+
+
+def test_save_replaces_kit_and_round_trips():
+    with KitStore(":memory:") as store:
+        store.save_kit(dict(KIT, slots=[]))
+        store.save_many([KIT])
+        assert len(store) == 1
+        kit = store.load_kit("PvP")
+        slots = {slot.slot_id: slot for slot in kit.slots}
+        assert slots[0].display_name == "Klinge" and slots[1].count == 16
+        assert {e.id: e.level for e in slots[0].enchantments} == {"minecraft:sharpness": 5,
+                                                                  "minecraft:unbreaking": 3}
@@ -0,0 +1,68 @@
+"""
+Kit-Migration zwischen Datenversionen: Änderungen je Slot, Diff-Bericht und
+Zielpfade unterhalb von ``--out``.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.migration import (REMOVED_ENCHANTMENT, REMOVED_ITEM, RENAMED_ENCHANTMENT, KitMigrator,
+                            migrate_files, output_paths)
+
+KIT_1_21 = {"name": "Mace", "version": "1.21", "slots": [
+    {"slot": 0, "id": "minecraft:mace", "count": 1, "enchantments": [{"id": "minecraft:density", "level": 3}]},
+    {"slot": 1, "id": "minecraft:diamond_sword", "count": 1,
+     "enchantments": [{"id": "minecraft:sweeping_edge", "level": 3}]},
+]}
+
+
+def write_kit(path, definition=KIT_1_21):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(definition), encoding="utf-8")
+    return path
+
+
+def test_migrate_1_21_to_1_20():
+    migrated, changes = KitMigrator("1.21", "1.20").migrate(KIT_1_21)
+    assert migrated["version"] == "1.20"
+    assert [slot["slot"] for slot in migrated["slots"]] == [1]
+    assert migrated["slots"][0]["enchantments"] == [{"id": "minecraft:sweeping", "level": 3}]
+    assert [(c.slot, c.change, c.before) for c in changes] == [
+        (0, REMOVED_ITEM, "minecraft:mace"), (1, RENAMED_ENCHANTMENT, "minecraft:sweeping_edge")]
+
+
+def test_removed_enchantment_is_reported():
+    kit = {"name": "Sword", "version": "1.21", "slots": [
+        {"slot": 0, "id": "minecraft:diamond_sword", "count": 1,
+         "enchantments": [{"id": "minecraft:density", "level": 1}, {"id": "minecraft:sharpness", "level": 5}]}]}
+    migrated, changes = KitMigrator("1.21", "1.20").migrate(kit)
+    assert migrated["slots"][0]["enchantments"] == [{"id": "minecraft:sharpness", "level": 5}]
+    assert changes[0].change == REMOVED_ENCHANTMENT
+
+
+def test_output_paths_keep_layout(tmp_path):
+    paths = [str(tmp_path / "kits/pvp/a.json"), str(tmp_path / "kits/pve/a.json"), str(tmp_path / "kits/b.json")]
+    out = str(tmp_path / "out")
+    assert output_paths(paths, out) == [os.path.join(out, "pvp", "a.json"), os.path.join(out, "pve", "a.json"),
+                                        os.path.join(out, "b.json")]
+    assert output_paths(paths, None) == paths
+
+
+def test_migrate_files_report_and_layout(tmp_path):
+    kits = tmp_path / "kits"
+    write_kit(kits / "pvp/mace.json")
+    write_kit(kits / "pve/mace.json")
+    out = tmp_path / "out"
+    report = migrate_files(sorted(kits.rglob("*.json")), "1.20", out_dir=out, jobs=1)
+    assert not report.failed
+    assert sorted(p.relative_to(out).as_posix() for p in out.rglob("*.json")) == ["pve/mace.json", "pvp/mace.json"]
+    assert report.counts()[REMOVED_ITEM] == 2
+    diff = json.loads(report.to_json())["diff"]
+    assert {change["before"] for kit in diff for change in kit["changes"] if change["change"] == REMOVED_ITEM} \
+        == {"minecraft:mace"}
+    migrated = json.loads((out / "pvp/mace.json").read_text(encoding="utf-8"))
+    assert migrated["version"] == "1.20" and [s["id"] for s in migrated["slots"]] == ["minecraft:diamond_sword"]
@@ -0,0 +1,62 @@
+"""
+.nbt-Import: Versionserkennung, Zuordnung umbenannter IDs, eindeutige
+Kitnamen und der Rundlauf save_items_nbt -> Import.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.catalog import DEFAULT_VERSION, get_catalog
+from core.exporters import COMPONENTS, LEGACY, save_items_nbt
+from core.nbt_import import IdResolver, detect_version, import_nbt_file, kit_names
+
+ITEMS = [
+    {"slot": 0, "id": "minecraft:diamond_sword", "count": 1, "name": "Klinge",
+     "enchantments": [{"id": "minecraft:sharpness", "level": 5}, {"id": "minecraft:unbreaking", "level": 3}]},
+    {"slot": 4, "id": "minecraft:golden_apple", "count": 16},
+    {"slot": 26, "id": "minecraft:bow", "count": 1, "enchantments": [{"id": "minecraft:power", "level": 4}]},
+]
+
+
+@pytest.mark.parametrize("raw_items, expected", [
+    ([{"Slot": 0, "id": "minecraft:stone", "Count": 1}], DEFAULT_VERSION),
+    ([{"Slot": 0, "id": "minecraft:stone", "count": 1}], "1.21"),
+    ([{"Slot": 0, "id": "minecraft:stone", "components": {}}], "1.21"),
+    ([], DEFAULT_VERSION),
+])
+def test_detect_version(raw_items, expected):
+    assert detect_version(raw_items) == expected
+
+
+def test_resolver_follows_renames_in_both_directions():
+    old = IdResolver(get_catalog("1.20"))
+    new = IdResolver(get_catalog("1.21"))
+    assert old.enchantment("minecraft:sweeping_edge") == "minecraft:sweeping"
+    assert new.enchantment("minecraft:sweeping") == "minecraft:sweeping_edge"
+    assert old.item("minecraft:diamond_sword") == "minecraft:diamond_sword"
+    assert old.item("minecraft:mace") is None
+
+
+def test_kit_names_get_suffixes(tmp_path):
+    paths = [tmp_path / "a/b_c.nbt", tmp_path / "a_b/c.nbt", tmp_path / "A_B_C.nbt", tmp_path / "d.nbt"]
+    assert kit_names(paths, tmp_path) == ["a_b_c", "a_b_c-2", "A_B_C-3", "d"]
+
+
+@pytest.mark.parametrize("syntax, version", [(LEGACY, "1.20"), (COMPONENTS, "1.21")])
+def test_round_trip(syntax, version, tmp_path):
+    path = tmp_path / "kit.nbt"
+    save_items_nbt(ITEMS, path, gzipped=True, syntax=syntax)
+    kit, warnings = import_nbt_file(path)
+    assert warnings == []
+    assert kit.version == version and kit.name == "kit"
+    slots = {slot.slot_id: slot for slot in kit.slots}
+    assert sorted(slots) == [0, 4, 26]
+    for item in ITEMS:
+        slot = slots[item["slot"]]
+        assert (slot.item.id, slot.count, slot.display_name) == (item["id"], item["count"], item.get("name"))
+        assert [(e.id, e.level) for e in slot.enchantments] == \
+            [(e["id"], e["level"]) for e in item.get("enchantments", [])]
@@ -0,0 +1,50 @@
+"""
+Platzierungsregeln: Masken je Slot und Prüfung der Regeln beim Laden.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.catalog import get_catalog
+from core.placement import ANY, ARMOR, GRID_SLOTS, HEAD, PlacementRuleError, PlacementTable
+from core.validation import validate_kits
+
+
+@pytest.fixture(scope="module")
+def masks():
+    return get_catalog("1.20").slot_masks
+
+
+def test_rules_restrict_slots(masks):
+    table = PlacementTable(masks, {0: "head", "1": ["armor"]})
+    assert table.slot_masks[:3] == [HEAD, ARMOR, ANY]
+    assert table.is_valid("minecraft:diamond_helmet", 0)
+    assert not table.is_valid("minecraft:diamond_sword", 0)
+
+
+@pytest.mark.parametrize("rules, message", [
+    ({GRID_SLOTS: "armor"}, "outside the grid"),
+    ({-1: "armor"}, "outside the grid"),
+    ({"x": "armor"}, "not a number"),
+    ({3: "armour"}, "unknown slot type"),
+])
+def test_bad_rule_is_reported(masks, rules, message):
+    with pytest.raises(PlacementRuleError, match=message) as error:
+        PlacementTable(masks, rules)
+    assert repr(next(iter(rules))) in str(error.value)
+
+
+def test_row_rules(masks):
+    table = PlacementTable.for_rows(masks, {2: ARMOR})
+    assert table.slot_masks[18:] == [ARMOR] * 9 and table.slot_masks[:18] == [ANY] * 18
+    with pytest.raises(PlacementRuleError, match="row 3"):
+        PlacementTable.for_rows(masks, {3: ARMOR})
+
+
+def test_validation_rejects_bad_rules_before_checking_kits():
+    with pytest.raises(PlacementRuleError):
+        validate_kits([{"name": "a", "version": "1.20", "slots": []}], jobs=1, slot_rules={99: "head"})
@@ -0,0 +1,89 @@
+"""
+Item-Suche: Trigramm- und Präfix-Index gegen eine lineare Referenzsuche,
+Umlaute, inkrementelle Eingabe und die Reihenfolge unscharfer Treffer.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.catalog import get_catalog
+from core.search import PREFIX_LENGTH, ItemSearchIndex, normalize
+
+QUERIES = ["s", "di", "DI", "go ap", "a", "schw", "schwert", "diamant schwert", "minecraft:diamond",
+           "diamond_sword", "helm", "kröte", "krote", "KRÖTENHELM", "apfel gold", "xyz", "qq"]
+
+
+@pytest.fixture(scope="module")
+def index():
+    return ItemSearchIndex(get_catalog("1.20"))
+
+
+def reference(index, query, category=None):
+    """Lineare Suche mit denselben Regeln: kurze Begriffe als Wortpräfix, sonst Teilzeichenkette"""
+    terms = normalize(query).split()
+    result = []
+    for idx, text in enumerate(index.texts):
+        if category and index.catalog.items[idx].category != category:
+            continue
+        if all(any(word.startswith(term) for word in text.split()) if len(term) <= PREFIX_LENGTH
+               else term in text for term in terms):
+            result.append(idx)
+    return result
+
+
+def test_normalize_folds_umlauts_and_separators():
+    assert normalize("Schildkrötenhelm") == "schildkrotenhelm"
+    assert normalize("Größe") == "grosse"
+    assert normalize("minecraft:diamond_sword") == "minecraft diamond sword"
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_exact_search_matches_reference(index, query):
+    expected = reference(index, query)
+    if expected:
+        assert list(ItemSearchIndex(index.catalog).search(query)) == expected
+
+
+@pytest.mark.parametrize("category", ["Waffen", "Rüstung"])
+def test_category_filter(index, category):
+    assert list(ItemSearchIndex(index.catalog).search("d", category)) == reference(index, "d", category)
+    assert all(index.catalog.items[idx].category == category for idx in index.search("", category))
+
+
+def test_short_terms_match_word_prefixes_only(index):
+    names = [index.catalog.items[idx].name for idx in index.search("ap")]
+    assert names and all("apfel" in normalize(name) for name in names)
+    # "am" steckt in "diamant", zählt dort aber nicht (kein Wortanfang)
+    assert not any(index.texts[idx].startswith("diamant") for idx in index.search("am"))
+
+
+def test_umlaut_queries(index):
+    helmet = [index.catalog.items[idx].name for idx in index.search("schildkröte")]
+    assert helmet == ["Schildkrötenhelm"]
+    assert list(index.search("SCHILDKROTE")) == list(index.search("schildkröte"))
+
+
+def test_incremental_typing_matches_fresh_search(index):
+    typed = ItemSearchIndex(index.catalog)
+    for query in ["d", "di", "dia", "diam", "diama", "diamant", "diamant s", "diamant sch", "diamant sch x"]:
+        fresh = ItemSearchIndex(index.catalog)
+        assert list(typed.search(query)) == list(fresh.search(query)), query
+
+
+@pytest.mark.parametrize("query, best", [
+    ("diamnt schwert", "Diamantschwert"),
+    ("schildkrotnhelm", "Schildkrötenhelm"),
+    ("goldner apfl", "Goldener Apfel"),
+])
+def test_fuzzy_ranking_puts_closest_item_first(index, query, best):
+    assert reference(index, query) == []
+    names = [index.catalog.items[idx].name for idx in index.search(query)]
+    assert names[0] == best
+
+
+def test_no_match_returns_nothing(index):
+    assert list(index.search("zzzzqqq")) == []
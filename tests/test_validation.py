@@ -0,0 +1,123 @@
+"""
+Spalten-Validierung (KitValidator) gegen eine einfache Prüfung Slot für Slot,
+Prozess-Pool gegen einen Prozess und der Validator-Cache je Version.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.catalog import get_catalog
+from core.validation import PARALLEL_THRESHOLD, SHULKER_SLOTS, KitValidator, get_validator, validate_kits
+
+
+def reference_issues(kits, catalog):
+    """Dieselben Regeln, naiv je Kit und Slot: {(kit, code, slot)}"""
+    index = catalog.enchantment_index
+    found = set()
+    for kit in kits:
+        name, seen = kit["name"], set()
+        for entry in kit["slots"]:
+            slot, item = entry["slot"], catalog.get(entry["id"])
+            if item is None:
+                found.add((name, "unknown_item", slot))
+            if not 0 <= slot < SHULKER_SLOTS:
+                found.add((name, "slot_range", slot))
+            elif slot in seen:
+                found.add((name, "slot_duplicate", slot))
+            seen.add(slot)
+            if item is not None and not 1 <= entry["count"] <= item.max_stack:
+                found.add((name, "stack_size", slot))
+            ids = []
+            for ench in entry.get("enchantments", []):
+                definition = catalog.get_enchantment(ench["id"])
+                if definition is None:
+                    found.add((name, "unknown_enchantment", slot))
+                    continue
+                ids.append(ench["id"])
+                if not 1 <= ench["level"] <= definition.max_level:
+                    found.add((name, "enchant_level", slot))
+                if item is not None and not catalog.applicable_enchantments(item.id) >> index.index[ench["id"]] & 1:
+                    found.add((name, "enchant_not_applicable", slot))
+            for i, a in enumerate(ids):
+                for b in ids[i + 1:]:
+                    if b in catalog.get_enchantment(a).conflicts or a in catalog.get_enchantment(b).conflicts:
+                        found.add((name, "enchant_conflict", slot))
+    return found
+
+
+def random_kits(count, seed=7, bad=True):
+    """Zufällige Kits; mit ``bad`` ist etwa jeder dritte Slot fehlerhaft"""
+    catalog = get_catalog("1.20")
+    rng = random.Random(seed)
+    enchant_ids = [e.id for e in catalog.enchantments]
+    kits = []
+    for k in range(count):
+        slots = []
+        for slot in rng.sample(range(SHULKER_SLOTS), rng.randint(0, 10)):
+            item = rng.choice(catalog.items)
+            entry = {"slot": slot, "id": item.id, "count": rng.randint(1, item.max_stack)}
+            chosen = []
+            for enchant_id in catalog.enchantment_index.ids_of(catalog.applicable_enchantments(item.id)):
+                conflicts = catalog.get_enchantment(enchant_id).conflicts
+                if len(chosen) < 2 and not any(c in conflicts or enchant_id in catalog.get_enchantment(c).conflicts
+                                               for c in chosen):
+                    chosen.append(enchant_id)
+            if chosen:
+                entry["enchantments"] = [{"id": e, "level": 1} for e in chosen]
+            if bad and rng.random() < 0.35:
+                fault = rng.randrange(7)
+                if fault == 0:
+                    entry["id"] = "minecraft:does_not_exist"
+                elif fault == 1:
+                    entry["slot"] = rng.choice([-1, SHULKER_SLOTS, 99])
+                elif fault == 2 and slots:
+                    entry["slot"] = slots[0]["slot"]
+                elif fault == 3:
+                    entry["count"] = item.max_stack + 1
+                elif fault == 4:
+                    entry["enchantments"] = [{"id": rng.choice(enchant_ids), "level": 1}]
+                elif fault == 5:
+                    entry["enchantments"] = [{"id": "minecraft:sharpness", "level": 9},
+                                             {"id": "minecraft:smite", "level": 1}]
+                else:
+                    entry["enchantments"] = [{"id": "minecraft:nope", "level": 1}]
+            slots.append(entry)
+        kits.append({"name": f"kit{k}", "version": "1.20", "slots": slots})
+    return kits
+
+
+def issue_keys(report):
+    return {(issue.kit, issue.code, issue.slot) for issue in report.issues}
+
+
+def test_good_kits_have_no_issues():
+    kits = random_kits(200, bad=False)
+    assert reference_issues(kits, get_catalog("1.20")) == set()
+    assert validate_kits(kits, jobs=1).issues == []
+
+
+def test_column_validator_matches_reference():
+    kits = random_kits(300)
+    expected = reference_issues(kits, get_catalog("1.20"))
+    assert {code for _, code, _ in expected} >= {"unknown_item", "slot_range", "slot_duplicate", "stack_size",
+                                                  "enchant_level", "enchant_not_applicable", "enchant_conflict",
+                                                  "unknown_enchantment"}
+    assert issue_keys(KitValidator(get_catalog("1.20")).validate(kits)) == expected
+
+
+def test_process_pool_matches_single_process():
+    kits = random_kits(PARALLEL_THRESHOLD + 100, seed=11)
+    single = validate_kits(kits, jobs=1)
+    pooled = validate_kits(kits, jobs=2)
+    assert (pooled.kits, pooled.slots) == (single.kits, single.slots)
+    key = lambda issue: (issue.kit, issue.slot or 0, issue.code, issue.message)
+    assert sorted(pooled.issues, key=key) == sorted(single.issues, key=key)
+
+
+def test_validator_cached_per_version():
+    assert get_validator("1.20") is get_validator("1.20")
+    assert get_validator("1.21") is not get_validator("1.20")
+    assert get_validator("1.21").catalog is get_catalog("1.21")